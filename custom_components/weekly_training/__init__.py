@@ -8,10 +8,11 @@ from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_time_change
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, PLATFORMS
+from .const import DOMAIN, PLATFORMS, SIGNAL_ENTRY_UNLOADED
 from .coordinator import WeeklyTrainingCoordinator
 from .frontend import async_register_frontend
 from .services import async_register as async_register_services
@@ -33,16 +34,28 @@ def _schedule_week_cleanup(*, hass: HomeAssistant, entry: ConfigEntry, coordinat
             today = local_now.date()
             monday = today - timedelta(days=today.weekday())
             prev_week_start = (monday - timedelta(days=7)).isoformat()
-            # Archive completed workouts before blanking the canvas.
-            await coordinator.store.async_archive_week(week_start=prev_week_start)
-            await coordinator.store.async_delete_week(week_start=prev_week_start)
-            await coordinator.async_request_refresh()
+            # Archive completed workouts before blanking the canvas (one commit).
+            async with coordinator.store.transaction():
+                await coordinator.store.async_archive_week(week_start=prev_week_start)
+                await coordinator.store.async_delete_week(week_start=prev_week_start)
         except Exception:  # noqa: BLE001
             _LOGGER.exception("Weekly cleanup failed for entry_id=%s", entry.entry_id)
 
     remove = async_track_time_change(hass, _run, hour=1, minute=0, second=0)
     entry.async_on_unload(remove)
 
+
+def _schedule_person_summaries(*, hass: HomeAssistant, entry: ConfigEntry, coordinator: WeeklyTrainingCoordinator) -> None:
+    """Roll person summaries (today's session, week completion) over to the new day/week hourly."""
+
+    async def _run(_now) -> None:
+        try:
+            coordinator.update_person_summaries(await coordinator.store.async_load())
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Person summary update failed for entry_id=%s", entry.entry_id)
+
+    entry.async_on_unload(async_track_time_change(hass, _run, minute=0, second=5))
+
 async def _async_register_domain_resources(hass: HomeAssistant) -> None:
     """Register domain-wide resources once.
 
@@ -80,9 +93,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
     _schedule_week_cleanup(hass=hass, entry=entry, coordinator=coordinator)
+    _schedule_person_summaries(hass=hass, entry=entry, coordinator=coordinator)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    # Websocket subscriptions hold store listeners; end them with the entry.
+    unloaded = f"{SIGNAL_ENTRY_UNLOADED}_{entry.entry_id}"
+    entry.async_on_unload(lambda: async_dispatcher_send(hass, unloaded))
     _LOGGER.debug("Setup complete for entry_id=%s", entry.entry_id)
     return True
 
@@ -91,7 +108,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        coordinator = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        if coordinator is not None:
+            # Writes are debounced; make sure nothing is lost on unload/reload.
+            await coordinator.store.async_flush()
     return unload_ok
 
 
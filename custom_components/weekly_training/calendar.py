@@ -0,0 +1,72 @@
+"""Calendar platform for Weekly Training: one calendar of sessions per person."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import SessionSummary, WeeklyTrainingCoordinator, session_summary
+from .entity import PersonEntity, async_track_people
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    coordinator: WeeklyTrainingCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_track_people(
+        hass,
+        entry,
+        lambda: coordinator.person_summaries,
+        async_add_entities,
+        lambda pid: [PersonCalendar(entry, coordinator, pid)],
+    )
+
+
+def _event(person_id: str, session: SessionSummary) -> CalendarEvent:
+    day = date.fromisoformat(session.date)
+    lines = ["Completed"] if session.completed else []
+    lines.extend(n for n in session.exercise_names if n)
+    return CalendarEvent(
+        start=day,
+        end=day + timedelta(days=1),
+        summary=session.name or "Workout",
+        description="\n".join(lines) or None,
+        uid=f"{person_id}_{session.date}",
+    )
+
+
+class PersonCalendar(PersonEntity, CalendarEntity):
+    """Planned and completed sessions of one person as all-day events."""
+
+    _key = "calendar"
+    _label = "training"
+    _attr_icon = "mdi:calendar-check"
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        # Today's session (done or not), else the next one still to do.
+        summary = self._summary
+        session = (summary.today or summary.next_session) if summary else None
+        return _event(self._person_id, session) if session else None
+
+    async def async_get_events(self, hass: HomeAssistant, start_date: datetime, end_date: datetime) -> list[CalendarEvent]:
+        state = await self.coordinator.store.async_load()
+        plans = state.get("plans") if isinstance(state.get("plans"), dict) else {}
+        end = dt_util.as_local(end_date)
+        # All-day events: a day overlaps [start, end) unless end is exactly its midnight.
+        last = end.date() if end.time() == time.min else end.date() + timedelta(days=1)
+        found = self.coordinator.store.workout_index.between(
+            plans,
+            self._person_id,
+            dt_util.as_local(start_date).date().isoformat(),
+            last.isoformat(),
+        )
+        return [_event(self._person_id, session_summary(plans, self._person_id, day, week, pos)) for day, week, pos in found]
@@ -5,13 +5,14 @@ from __future__ import annotations
 from typing import Any
 
 import voluptuous as vol
-
 from homeassistant import config_entries
 from homeassistant.core import callback
 
 from .const import (
     CONF_NAME,
+    CONF_PERSON_ENTITIES,
     DEFAULT_NAME,
+    DEFAULT_PERSON_ENTITIES,
     DOMAIN,
 )
 
@@ -60,6 +61,7 @@ class WeeklyTrainingOptionsFlow(config_entries.OptionsFlow):
                 title="",
                 data={
                     CONF_NAME: name,
+                    CONF_PERSON_ENTITIES: bool(user_input.get(CONF_PERSON_ENTITIES, DEFAULT_PERSON_ENTITIES)),
                 },
             )
 
@@ -70,6 +72,10 @@ class WeeklyTrainingOptionsFlow(config_entries.OptionsFlow):
         schema = vol.Schema(
             {
                 vol.Required(CONF_NAME, default=str(current_name)): str,
+                vol.Optional(
+                    CONF_PERSON_ENTITIES,
+                    default=bool(self.config_entry.options.get(CONF_PERSON_ENTITIES, DEFAULT_PERSON_ENTITIES)),
+                ): bool,
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema)
@@ -8,6 +8,7 @@ DOMAIN = "weekly_training"
 
 PLATFORMS: list[Platform] = [
     Platform.BUTTON,
+    Platform.CALENDAR,
     Platform.SENSOR,
     Platform.SELECT,
     Platform.NUMBER,
@@ -23,6 +24,7 @@ CONF_MAX_SQ = "max_squat"
 CONF_MAX_DL = "max_deadlift"
 CONF_MAX_BP = "max_bench"
 CONF_UNITS = "units"
+CONF_PERSON_ENTITIES = "person_entities"
 
 DEFAULT_NAME = "Weekly Training"
 DEFAULT_GENDER = "male"
@@ -33,8 +35,15 @@ DEFAULT_MAX_SQ = 100
 DEFAULT_MAX_DL = 120
 DEFAULT_MAX_BP = 80
 DEFAULT_UNITS = "kg"
+DEFAULT_PERSON_ENTITIES = False
 
 GENDER_CHOICES = ["male", "female"]
 UNITS_CHOICES = ["kg", "lb"]
 
 SIGNAL_PLAN_UPDATED = f"{DOMAIN}_plan_updated"
+# Per person: f"{SIGNAL_PERSON_UPDATED}_{entry_id}_{person_id}"; sent only when that person's summary changed.
+SIGNAL_PERSON_UPDATED = f"{DOMAIN}_person_updated"
+# Sent when people were added or removed.
+SIGNAL_PEOPLE_CHANGED = f"{DOMAIN}_people_changed"
+# Per entry: f"{SIGNAL_ENTRY_UNLOADED}_{entry_id}"; ends websocket subscriptions on unload/reload.
+SIGNAL_ENTRY_UNLOADED = f"{DOMAIN}_entry_unloaded"
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import date, timedelta
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
@@ -16,29 +20,234 @@ from .const import (
     CONF_EQUIPMENT,
     CONF_GENDER,
     CONF_PREFERRED_EXERCISES,
+    DEFAULT_DURATION_MINUTES,
     DOMAIN,
+    SIGNAL_PEOPLE_CHANGED,
+    SIGNAL_PERSON_UPDATED,
     SIGNAL_PLAN_UPDATED,
 )
-from .library import ExerciseLibrary
-from .planner import generate_session
+from .executor import EXECUTOR_MIN_SESSIONS, async_run_sized
+from .library import async_get_library, exercise_config_key
+from .planner import CompiledLibrary, generate_session, generate_sessions
 from .storage import WeeklyTrainingStore
+from .workout_index import WorkoutIndex
+from .ws_state import MarkdownCache, PlanWeekIndex, StateDeltaTracker
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class GenerationContext:
+    """Everything the planner needs for one person, prepared once."""
+
+    person_id: str
+    profile: dict[str, Any]
+    library: CompiledLibrary
+    # Stored entry overrides (week/day selection) and the planner-facing view.
+    overrides: dict[str, Any]
+    generation_overrides: dict[str, Any]
+
+
+# Tags that make an exercise eligible for each manual session slot family (`a_lower`, `b_push`, ...).
+SLOT_FAMILY_TAGS: dict[str, frozenset[str]] = {
+    "lower": frozenset({"squat", "deadlift", "hinge", "lunge", "single_leg"}),
+    "push": frozenset({"bench", "push", "press", "overhead_press", "dumbbell_press"}),
+    "pull": frozenset({"row", "pull", "pullup", "lat"}),
+}
+
+
+def _slot_family(slot: str) -> str:
+    for family in ("lower", "push"):
+        if slot.endswith(f"_{family}"):
+            return family
+    return "pull"
+
+
+@dataclass(frozen=True, slots=True)
+class EntitySnapshot:
+    """Entity-facing views of one rev, computed once and shared by all entities."""
+
+    rev: int
+    person_names: tuple[str, ...]
+    # First person per name (the select shows names).
+    person_ids_by_name: Mapping[str, str]
+    active_person_name: str | None
+    planning_mode: str
+    duration_minutes: float
+    preferred_exercises: str
+    session_overrides: Mapping[str, str]
+    # Slot family -> ("Auto", *exercise names).
+    exercise_options: Mapping[str, tuple[str, ...]]
+
+    def slot_options(self, slot: str) -> tuple[str, ...]:
+        return self.exercise_options.get(_slot_family(slot), ("Auto",))
+
+    def slot_value(self, slot: str) -> str:
+        return self.session_overrides.get(slot) or "Auto"
+
+
+def _exercise_options(library: dict[str, Any]) -> Mapping[str, tuple[str, ...]]:
+    exercises = library.get("exercises", []) if isinstance(library, dict) else []
+    names: dict[str, set[str]] = {family: set() for family in SLOT_FAMILY_TAGS}
+    for ex in exercises if isinstance(exercises, list) else []:
+        if not isinstance(ex, dict):
+            continue
+        name = str(ex.get("name") or "").strip()
+        if not name:
+            continue
+        tags = {str(t).strip().lower() for t in (ex.get("tags") or []) if str(t).strip()}
+        for family, wanted in SLOT_FAMILY_TAGS.items():
+            if not tags.isdisjoint(wanted):
+                names[family].add(name)
+    return MappingProxyType({family: ("Auto", *sorted(found)) for family, found in names.items()})
+
+
+def build_entity_snapshot(state: dict[str, Any], *, exercise_options: Mapping[str, tuple[str, ...]]) -> EntitySnapshot:
+    """Derive everything the select/number/text entities show from one state."""
+    state = state if isinstance(state, dict) else {}
+    people = state.get("people") if isinstance(state.get("people"), list) else []
+    names: list[str] = []
+    ids_by_name: dict[str, str] = {}
+    active_id = str(state.get("active_person_id") or "")
+    active_name: str | None = None
+    for p in people:
+        if not isinstance(p, dict):
+            continue
+        name = str(p.get("name") or "").strip()
+        pid = str(p.get("id") or "")
+        if pid == active_id and active_name is None:
+            active_name = str(p.get("name") or "")
+        if name:
+            names.append(name)
+            ids_by_name.setdefault(name, pid)
+    if active_name is None and names:
+        active_name = names[0]
+
+    overrides = state.get("overrides") if isinstance(state.get("overrides"), dict) else {}
+    if overrides.get("duration_minutes") is not None:
+        duration = float(int(overrides.get("duration_minutes") or DEFAULT_DURATION_MINUTES))
+    else:
+        duration = float(DEFAULT_DURATION_MINUTES)
+    session = overrides.get("session_overrides") if isinstance(overrides.get("session_overrides"), dict) else {}
+
+    return EntitySnapshot(
+        rev=int(state.get("rev") or 1),
+        person_names=tuple(names),
+        person_ids_by_name=MappingProxyType(ids_by_name),
+        active_person_name=active_name,
+        planning_mode=str(overrides.get("planning_mode") or "auto").lower(),
+        duration_minutes=duration,
+        preferred_exercises=str(overrides.get("preferred_exercises") or ""),
+        session_overrides=MappingProxyType({str(k): str(v or "").strip() for k, v in session.items()}),
+        exercise_options=exercise_options,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class SessionSummary:
+    date: str
+    week_start: str
+    name: str
+    exercise_names: tuple[str, ...]
+    completed: bool
+
+    @property
+    def exercises(self) -> int:
+        return len(self.exercise_names)
+
+
+@dataclass(frozen=True, slots=True)
+class PersonSummary:
+    """Per-person day view behind the person entities; compared by value."""
+
+    name: str
+    today: SessionSummary | None
+    # First not-completed workout from today on (any stored week).
+    next_session: SessionSummary | None
+    week_start: str
+    workout_count: int
+    completed_count: int
+
+    @property
+    def week_completion(self) -> float | None:
+        if not self.workout_count:
+            return None
+        return round(100 * self.completed_count / self.workout_count, 1)
+
+
+def session_summary(plans: dict[str, Any], person_id: str, day: str, week: str, pos: int) -> SessionSummary:
+    """Summary of the workout the workout index located at (week, pos)."""
+    workout = plans[person_id][week]["workouts"][pos]
+    items = workout.get("items") if isinstance(workout.get("items"), list) else []
+    names = tuple(str(i.get("exercise") or "") for i in items if isinstance(i, dict))
+    return SessionSummary(day, week, str(workout.get("name") or ""), names, bool(workout.get("completed")))
+
+
+def build_person_summary(
+    state: dict[str, Any],
+    person: dict[str, Any],
+    *,
+    index: WorkoutIndex,
+    today: str,
+    week_start: str,
+) -> PersonSummary:
+    """Summarize one person's today/next session and current-week completion."""
+    pid = str(person.get("id") or "")
+    plans = state.get("plans") if isinstance(state.get("plans"), dict) else {}
+    today_summary = None
+    next_summary = None
+    for day, week, pos in index.between(plans, pid, today):
+        summary = session_summary(plans, pid, day, week, pos)
+        if day == today:
+            today_summary = summary
+        if not summary.completed:
+            next_summary = summary
+            break
+    person_plans = plans.get(pid) if isinstance(plans.get(pid), dict) else {}
+    plan = person_plans.get(week_start)
+    workouts = plan.get("workouts") if isinstance(plan, dict) and isinstance(plan.get("workouts"), list) else []
+    workouts = [w for w in workouts if isinstance(w, dict)]
+    return PersonSummary(
+        name=str(person.get("name") or ""),
+        today=today_summary,
+        next_session=next_summary,
+        week_start=week_start,
+        workout_count=len(workouts),
+        completed_count=sum(1 for w in workouts if bool(w.get("completed"))),
+    )
+
+
 class WeeklyTrainingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinates loading and generating weekly training plans."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         self.entry = entry
         self.store = WeeklyTrainingStore(hass, entry.entry_id)
-        self.library = ExerciseLibrary()
+        # Process-wide bundled library; merged views are cached per exercise_config.
+        self.library = async_get_library(hass)
+        self._exercise_config_key: str | None = None
+        # Per-rev change log used for delta websocket responses.
+        self.deltas = StateDeltaTracker()
+        # Sorted week keys per person for scoped get_state/get_plan queries.
+        self.plan_index = PlanWeekIndex()
+        # Week markdown, rendered on request (sensor attribute, get_markdown).
+        self.markdown = MarkdownCache()
+        # Shared, immutable entity views; replaced (and SIGNAL_PLAN_UPDATED sent) once per rev.
+        self._exercise_options: Mapping[str, tuple[str, ...]] = _exercise_options({})
+        self.entity_snapshot = build_entity_snapshot({}, exercise_options=self._exercise_options)
+        # person_id -> summary for the person entities, kept current per save/day.
+        self.person_summaries: dict[str, PersonSummary] = {}
+        # person_id -> (person object, person plans object) the summary was built from.
+        self._summary_sources: dict[str, tuple[Any, Any]] = {}
+        self._summary_day: tuple[str, str] = ("", "")
+        self.store.async_add_listener(self._on_store_saved)
 
         super().__init__(
             hass,
             logger=_LOGGER,
             name=f"{DOMAIN}_{entry.entry_id}",
-            update_interval=timedelta(hours=6),
+            # Push-driven: the store hands every committed snapshot to `_on_store_saved`.
+            update_interval=None,
         )
 
     def _profile_from_entry(self) -> dict[str, Any]:
@@ -55,8 +264,80 @@ class WeeklyTrainingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         }
 
     async def _async_update_data(self) -> dict[str, Any]:
-        # Single source of truth is storage; entities/services write to it.
-        return await self.store.async_load()
+        # Single source of truth is storage; entities/services write to it. This
+        # runs for the first load (and manual refreshes); later commits are pushed
+        # by the store listener.
+        state = await self.store.async_load()
+        self.deltas.seed(state)
+        if self._exercise_config_key is None:
+            self._exercise_config_key = exercise_config_key(state.get("exercise_config"))
+        first = self.data is None
+        if first:
+            self._exercise_options = _exercise_options(await self.library.async_load())
+        if first or int(state.get("rev") or 1) != self.entity_snapshot.rev:
+            self._publish_entity_snapshot(state)
+        if first:
+            self.update_person_summaries(state)
+        return state
+
+    @callback
+    def _on_store_saved(self, state: dict[str, Any], touched_people: frozenset[str] | None) -> None:
+        self.deltas.record(state, touched_people=touched_people)
+        self.plan_index.sync(state.get("plans"), touched_people)
+        self.markdown.sync(state.get("plans"), touched_people)
+        config_key = exercise_config_key(state.get("exercise_config"))
+        if config_key != self._exercise_config_key:
+            # exercise_config changed (async_set_exercise_config / import): drop the stale merged view.
+            if self._exercise_config_key is not None:
+                self.library.invalidate(self._exercise_config_key)
+            self._exercise_config_key = config_key
+        self._publish_entity_snapshot(state)
+        self.update_person_summaries(state)
+        # One push per rev, last: coordinator entities (the Weekly plan sensor
+        # reads person_summaries) must see every view of this rev.
+        if self.data is None or int(state.get("rev") or 1) != int(self.data.get("rev") or 1):
+            self.async_set_updated_data(state)
+
+    @callback
+    def update_person_summaries(self, state: dict[str, Any]) -> None:
+        """Rebuild summaries of people whose record or plans changed (all of them on a new day).
+
+        People and plans are copy-on-write, so an unchanged person is skipped by
+        identity. Only people whose summary actually differs get a signal.
+        """
+        now = dt_util.as_local(dt_util.utcnow())
+        day = (now.date().isoformat(), self._week_start_for_offset(0).isoformat())
+        new_day = day != self._summary_day
+        self._summary_day = day
+        plans = state.get("plans") if isinstance(state.get("plans"), dict) else {}
+        people = state.get("people") if isinstance(state.get("people"), list) else []
+        by_id = {str(p.get("id") or ""): p for p in people if isinstance(p, dict) and p.get("id")}
+        known = set(self.person_summaries)
+        changed: list[str] = []
+        for pid, person in by_id.items():
+            sources = (person, plans.get(pid))
+            prev = self._summary_sources.get(pid)
+            if not new_day and prev is not None and prev[0] is sources[0] and prev[1] is sources[1]:
+                continue
+            self._summary_sources[pid] = sources
+            summary = build_person_summary(state, person, index=self.store.workout_index, today=day[0], week_start=day[1])
+            if self.person_summaries.get(pid) != summary:
+                self.person_summaries[pid] = summary
+                changed.append(pid)
+        removed = [pid for pid in self.person_summaries if pid not in by_id]
+        for pid in removed:
+            del self.person_summaries[pid]
+            self._summary_sources.pop(pid, None)
+        entry_id = self.entry.entry_id
+        for pid in (*changed, *removed):
+            async_dispatcher_send(self.hass, f"{SIGNAL_PERSON_UPDATED}_{entry_id}_{pid}")
+        if removed or not known.issuperset(by_id):
+            async_dispatcher_send(self.hass, f"{SIGNAL_PEOPLE_CHANGED}_{entry_id}")
+
+    @callback
+    def _publish_entity_snapshot(self, state: dict[str, Any]) -> None:
+        self.entity_snapshot = build_entity_snapshot(state, exercise_options=self._exercise_options)
+        self._notify_plan_updated()
 
     def _week_start_for_offset(self, offset: int) -> date:
         # Week rollover is intentionally delayed until Monday 01:00 (local time).
@@ -69,38 +350,18 @@ class WeeklyTrainingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         monday = today - timedelta(days=today.weekday())
         return monday + timedelta(days=int(offset) * 7)
 
-    async def async_generate_for_day(
-        self,
-        *,
-        person_id: str | None = None,
-        week_offset: int | None = None,
-        weekday: int | None = None,
-        expected_rev: int | None = None,
-    ) -> dict[str, Any]:
-        """Generate and persist a session for a specific weekday in a selected week."""
-        state = await self.store.async_load()
+    async def _async_generation_context(self, state: dict[str, Any], *, person_id: str | None) -> GenerationContext:
+        """Resolve person, profile, merged library and overrides for generation."""
         overrides = state.get("overrides") if isinstance(state, dict) else {}
         if not isinstance(overrides, dict):
             overrides = {}
 
-        library = await self.library.async_load()
-        # Merge any user-added custom exercises into the library for generation,
-        # and pass disabled list down as an override.
-        cfg = state.get("exercise_config") if isinstance(state, dict) else {}
-        if not isinstance(cfg, dict):
-            cfg = {}
-        disabled = cfg.get("disabled_exercises", [])
-        if isinstance(disabled, list):
+        # Bundled + user-added custom exercises (cached, precompiled); the disabled
+        # list is passed down as an override.
+        view = await self.library.async_view(state.get("exercise_config") if isinstance(state, dict) else None)
+        if view.disabled_exercises is not None:
             overrides = dict(overrides)
-            overrides["disabled_exercises"] = disabled
-        custom = cfg.get("custom_exercises", [])
-        if isinstance(custom, list) and custom:
-            merged = dict(library)
-            exercises = merged.get("exercises", [])
-            if not isinstance(exercises, list):
-                exercises = []
-            merged["exercises"] = [*exercises, *[e for e in custom if isinstance(e, dict)]]
-            library = merged
+            overrides["disabled_exercises"] = view.disabled_exercises
         people = state.get("people", []) if isinstance(state, dict) else []
         active_id = str(person_id or state.get("active_person_id") or "")
         person = next((p for p in people if isinstance(p, dict) and str(p.get("id") or "") == active_id), None)
@@ -108,20 +369,6 @@ class WeeklyTrainingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             person = people[0] if people and isinstance(people[0], dict) else {}
             active_id = str(person.get("id") or "")
 
-        # Week/day selection
-        effective_week_offset = int(week_offset) if week_offset is not None else int(overrides.get("week_offset") or 0)
-        week_start_day = self._week_start_for_offset(effective_week_offset)
-        if weekday is None:
-            sel = overrides.get("selected_weekday")
-            if sel is None:
-                now = dt_util.as_local(dt_util.utcnow())
-                effective = now.date()
-                if now.weekday() == 0 and now.hour < 1:
-                    effective = effective - timedelta(days=1)
-                sel = effective.weekday()
-            weekday = int(sel)
-        weekday = max(0, min(6, int(weekday)))
-
         # Apply per-generation overrides on top of the active person profile.
         effective_profile = dict(person)
         if overrides.get("duration_minutes") is not None:
@@ -137,28 +384,99 @@ class WeeklyTrainingCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         else:
             overrides_for_gen.pop("cycle", None)
 
-        existing_plan = self.store.get_plan(state, person_id=active_id, week_start=week_start_day.isoformat())
-        plan = generate_session(
+        return GenerationContext(
+            person_id=active_id,
             profile=effective_profile,
-            library=library,
-            overrides=overrides_for_gen,
-            week_start_day=week_start_day,
-            weekday=weekday,
-            existing_plan=existing_plan,
+            library=view.compiled,
+            overrides=overrides,
+            generation_overrides=overrides_for_gen,
         )
 
-        updated = await self.store.async_save_plan(
-            person_id=active_id,
-            week_start=week_start_day.isoformat(),
-            plan=plan,
-            expected_rev=expected_rev,
-        )
-        # Nudge entity UI to refresh options/overrides when generation happens.
-        try:
-            from homeassistant.helpers.dispatcher import async_dispatcher_send
-
-            async_dispatcher_send(self.hass, f"{SIGNAL_PLAN_UPDATED}_{self.entry.entry_id}")
-        except Exception:  # noqa: BLE001
-            pass
-        await self.async_request_refresh()
-        return updated
+    @callback
+    def _notify_plan_updated(self) -> None:
+        # Entities re-read `entity_snapshot` on this signal.
+        async_dispatcher_send(self.hass, f"{SIGNAL_PLAN_UPDATED}_{self.entry.entry_id}")
+
+    async def async_generate_for_day(
+        self,
+        *,
+        person_id: str | None = None,
+        week_offset: int | None = None,
+        weekday: int | None = None,
+        expected_rev: int | None = None,
+    ) -> dict[str, Any]:
+        """Generate and persist a session for a specific weekday in a selected week."""
+        # Read, generate and save under the write lock: a completion or edit of
+        # the same week cannot land in between and be overwritten.
+        async with self.store.transaction(expected_rev=expected_rev) as state:
+            ctx = await self._async_generation_context(state, person_id=person_id)
+            overrides = ctx.overrides
+
+            # Week/day selection
+            effective_week_offset = int(week_offset) if week_offset is not None else int(overrides.get("week_offset") or 0)
+            week_start_day = self._week_start_for_offset(effective_week_offset)
+            if weekday is None:
+                sel = overrides.get("selected_weekday")
+                if sel is None:
+                    now = dt_util.as_local(dt_util.utcnow())
+                    effective = now.date()
+                    if now.weekday() == 0 and now.hour < 1:
+                        effective = effective - timedelta(days=1)
+                    sel = effective.weekday()
+                weekday = int(sel)
+            weekday = max(0, min(6, int(weekday)))
+
+            existing_plan = self.store.get_plan(state, person_id=ctx.person_id, week_start=week_start_day.isoformat())
+            plan = generate_session(
+                profile=ctx.profile,
+                library=ctx.library,
+                overrides=ctx.generation_overrides,
+                week_start_day=week_start_day,
+                weekday=weekday,
+                existing_plan=existing_plan,
+            )
+
+            await self.store.async_save_plan(person_id=ctx.person_id, week_start=week_start_day.isoformat(), plan=plan)
+        return await self.store.async_load()
+
+    async def async_generate_cycle(
+        self,
+        *,
+        person_id: str | None,
+        week_starts: list[date],
+        weekdays: list[int],
+        expected_rev: int | None = None,
+    ) -> dict[str, Any]:
+        """Generate every (week, weekday) session in memory and commit once.
+
+        One generation context is prepared up front, all sessions are built
+        against it, and the result is persisted with a single save (one rev bump,
+        one push) instead of one write per day. Long cycles are generated in the
+        executor.
+        """
+        # The write lock is held across generation, so a cycle built in the
+        # executor cannot overwrite a change committed meanwhile.
+        async with self.store.transaction(expected_rev=expected_rev) as state:
+            ctx = await self._async_generation_context(state, person_id=person_id)
+
+            days = [(ws, max(0, min(6, int(wd)))) for ws in week_starts for wd in weekdays]
+            existing = {
+                ws.isoformat(): self.store.get_plan(state, person_id=ctx.person_id, week_start=ws.isoformat())
+                for ws in week_starts
+            }
+            # Inputs are the generation context and copy-on-write stored plans;
+            # the commit stays on the loop.
+            plans = await async_run_sized(
+                self.hass,
+                len(days),
+                EXECUTOR_MIN_SESSIONS,
+                generate_sessions,
+                profile=ctx.profile,
+                library=ctx.library,
+                overrides=ctx.generation_overrides,
+                days=days,
+                existing_plans=existing,
+            )
+            if plans:
+                await self.store.async_save_plans(person_id=ctx.person_id, plans=plans)
+        return await self.store.async_load()
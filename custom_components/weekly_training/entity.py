@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+
+from .const import CONF_NAME, DEFAULT_NAME, DOMAIN, SIGNAL_PEOPLE_CHANGED, SIGNAL_PERSON_UPDATED
 
-from .const import CONF_NAME, DEFAULT_NAME, DOMAIN
+if TYPE_CHECKING:
+    from .coordinator import PersonSummary, WeeklyTrainingCoordinator
 
 
 def device_info_from_entry(entry) -> DeviceInfo:
@@ -16,3 +26,72 @@ def device_info_from_entry(entry) -> DeviceInfo:
         model="Weekly Training",
     )
 
+
+def async_track_people(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    people: Callable[[], Iterable[str]],
+    add: Callable[[list[Entity]], None],
+    factory: Callable[[str], Iterable[Entity]],
+) -> None:
+    """Add `factory(person_id)` entities for every person now and for people added later."""
+    added: set[str] = set()
+
+    @callback
+    def _add_people() -> None:
+        new = [pid for pid in people() if pid not in added]
+        added.update(new)
+        if new:
+            add([entity for pid in new for entity in factory(pid)])
+
+    _add_people()
+    entry.async_on_unload(async_dispatcher_connect(hass, f"{SIGNAL_PEOPLE_CHANGED}_{entry.entry_id}", _add_people))
+
+
+class PersonEntity(Entity):
+    """Entity showing one person's summary from the coordinator.
+
+    Not a coordinator entity: it only listens to its person's signal and
+    writes state when its own state or attributes changed.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _key = ""
+    _label = ""
+
+    def __init__(self, entry: ConfigEntry, coordinator: WeeklyTrainingCoordinator, person_id: str) -> None:
+        self.coordinator = coordinator
+        self._person_id = person_id
+        self._attr_unique_id = f"{entry.entry_id}_{person_id}_{self._key}"
+        self._attr_device_info = device_info_from_entry(entry)
+        self._written: tuple[Any, ...] | None = None
+
+    @property
+    def _summary(self) -> PersonSummary | None:
+        return self.coordinator.person_summaries.get(self._person_id)
+
+    @property
+    def name(self) -> str:
+        summary = self._summary
+        return f"{summary.name if summary else self._person_id} {self._label}"
+
+    @property
+    def available(self) -> bool:
+        return self._summary is not None
+
+    def _view(self) -> tuple[Any, ...]:
+        return (self.available, self.name, self.state, self.state_attributes, self.extra_state_attributes)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._written = self._view()
+        signal = f"{SIGNAL_PERSON_UPDATED}_{self.coordinator.entry.entry_id}_{self._person_id}"
+        self.async_on_remove(async_dispatcher_connect(self.hass, signal, self._handle_updated))
+
+    @callback
+    def _handle_updated(self) -> None:
+        view = self._view()
+        if view != self._written:
+            self._written = view
+            self.async_write_ha_state()
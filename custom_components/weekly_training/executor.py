@@ -0,0 +1,37 @@
+"""Run heavy planner/storage work off the event loop once it is big enough."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant
+
+_T = TypeVar("_T")
+
+# Sizes from which work moves to the executor (about 1-2 ms of work on a small
+# host; below that the thread handoff costs more than it saves).
+EXECUTOR_MIN_SESSIONS = 16  # sessions generated in one call
+EXECUTOR_MIN_LOAD_ITEMS = 2_000  # workout items in one bulk load recompute
+EXECUTOR_MIN_IMPORT_ITEMS = 500  # people + custom exercises in one import
+
+
+async def async_run_sized(
+    hass: HomeAssistant,
+    size: int,
+    threshold: int,
+    func: Callable[..., _T],
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> _T:
+    """`func(*args, **kwargs)` inline when `size < threshold`, else in the executor.
+
+    `func` must be pure and its inputs must not change while it runs: pass
+    copy-on-write snapshots or private copies, and commit the result on the
+    loop.
+    """
+    if size < threshold:
+        return func(*args, **kwargs)
+    return await hass.async_add_executor_job(partial(func, *args, **kwargs))
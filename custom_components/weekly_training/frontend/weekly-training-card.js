@@ -97,6 +97,16 @@ class WeeklyTrainingCard extends HTMLElement {
     this._settingsDraft = null;
 
     this._renderedOnce = false;
+    // Promise of the unsubscribe function for weekly_training/subscribe (push updates).
+    this._unsubState = null;
+  }
+
+  connectedCallback() {
+    if (this._state) this._subscribeState();
+  }
+
+  disconnectedCallback() {
+    this._unsubscribeState();
   }
 
   setConfig(config) {
@@ -136,15 +146,34 @@ class WeeklyTrainingCard extends HTMLElement {
 		    if (mutating && this._state && this._state.rev != null && p.expected_rev == null) {
 		      p.expected_rev = Number(this._state.rev || 1);
 		    }
+		    // Ask for a delta (changed paths only) instead of the full state. Older backends reject the key, so only when versions match.
+		    if (mutating && this._state && p.expected_rev != null && p.response == null && this._versionsMatch() && this._backendVersion()) {
+		      p.response = "delta";
+		    }
 	    try {
-	      return await this._hass.callWS(p);
+	      const res = await this._hass.callWS(p);
+	      if (res && res.delta && !res.state) {
+	        const base = this._state;
+	        if (base && Number(base.rev) === Number(res.delta.base_rev)) {
+	          res.state = this._patchState(base, res.delta);
+	        } else if (base && Number(base.rev) === Number(res.delta.rev)) {
+	          // Already applied from the push subscription.
+	          res.state = base;
+	        } else {
+	          await this._reloadState();
+	          res.state = this._state;
+	        }
+	      }
+	      return res;
 	    } catch (e) {
 	      const code = String((e && e.code) || "");
 	      const msg = String((e && e.message) || e);
 	      if ((code === "conflict" || msg.toLowerCase().includes("expected rev")) && !_retried) {
 	        // Auto-heal: reload state and retry once. Avoids noisy "reload" prompts in the UI.
+	        // With a push subscription the newer state has usually arrived already; skip the reload then.
 	        try {
-	          await this._reloadState();
+	          const pushed = this._unsubState && this._state && Number(this._state.rev) !== Number(p.expected_rev);
+	          if (!pushed) await this._reloadState();
 	          return await this._callWS(payload, true);
 	        } catch (_) {
 	          // Fall through to throw the original error.
@@ -154,6 +183,29 @@ class WeeklyTrainingCard extends HTMLElement {
 	    }
 	  }
 
+  _patchState(base, delta) {
+    // Apply JSON-patch style ops ({op: add|remove, path}) to a copy of base; unchanged subtrees are shared.
+    const next = { ...(base || {}) };
+    for (const op of (delta && delta.ops) || []) {
+      const parts = String((op && op.path) || "")
+        .split("/")
+        .slice(1)
+        .map((k) => k.replace(/~1/g, "/").replace(/~0/g, "~"));
+      if (!parts.length) continue;
+      let node = next;
+      for (let i = 0; i < parts.length - 1; i++) {
+        const k = parts[i];
+        const child = node[k] && typeof node[k] === "object" ? { ...node[k] } : {};
+        node[k] = child;
+        node = child;
+      }
+      const last = parts[parts.length - 1];
+      if (op.op === "remove") delete node[last];
+      else node[last] = op.value;
+    }
+    return next;
+  }
+
   _applyState(nextState) {
     if (!nextState || typeof nextState !== "object") return;
     // Some WS responses may omit runtime; keep last known runtime to avoid UI flicker.
@@ -229,6 +281,7 @@ class WeeklyTrainingCard extends HTMLElement {
       if (!this._entryId) throw new Error("Set entry_id in card config (or keep only one entry).");
       const res = await this._callWS({ type: "weekly_training/get_state", entry_id: this._entryId });
       this._applyState((res && res.state) || {});
+      this._subscribeState();
     } catch (e) {
       this._error = String((e && e.message) || e);
     } finally {
@@ -237,6 +290,70 @@ class WeeklyTrainingCard extends HTMLElement {
     }
   }
 
+  _subscribeState() {
+    // Push updates keep several dashboards in sync without polling.
+    if (this._unsubState || !this._hass || !this._hass.connection || !this._entryId) return;
+    if (!this._versionsMatch() || !this._backendVersion()) return;
+    const entryId = this._entryId;
+    this._unsubState = this._hass.connection
+      .subscribeMessage((ev) => this._onStateEvent(ev), { type: "weekly_training/subscribe", entry_id: entryId })
+      .catch(() => {
+        this._unsubState = null;
+        return null;
+      });
+  }
+
+  _unsubscribeState() {
+    const pending = this._unsubState;
+    this._unsubState = null;
+    if (!pending) return;
+    pending.then((unsub) => {
+      try {
+        if (typeof unsub === "function") unsub();
+      } catch (_) {}
+    });
+  }
+
+  _resubscribeState(attempt = 0) {
+    // The entry was unloaded (usually a reload after an options change); subscribe again once it is back.
+    if (attempt >= 5) return;
+    window.setTimeout(() => {
+      if (!this.isConnected || this._unsubState) return;
+      this._subscribeState();
+      const pending = this._unsubState;
+      if (!pending) return;
+      pending.then((unsub) => {
+        if (!unsub && !this._unsubState) this._resubscribeState(attempt + 1);
+      });
+    }, 1000 * (attempt + 1));
+  }
+
+  _onStateEvent(ev) {
+    if (!ev || typeof ev !== "object") return;
+    const cur = this._state ? Number(this._state.rev || 0) : 0;
+    if (ev.type === "closed") {
+      this._unsubscribeState();
+      this._resubscribeState();
+      return;
+    }
+    if (ev.type === "snapshot") {
+      if (Number(ev.rev) === cur) return;
+      this._applyState(ev.state || {});
+    } else if (ev.type === "change") {
+      // Our own mutations are usually applied already (from the command result).
+      if (Number(ev.rev) <= cur) return;
+      if (this._state && Number(ev.base_rev) === cur) {
+        this._applyState(this._patchState(this._state, ev));
+      } else {
+        this._reloadState();
+        return;
+      }
+    } else {
+      return;
+    }
+    this._render();
+  }
+
   _showToast(message, action, undo) {
     const msg = String(message || "").trim();
     if (!msg) return;
@@ -506,8 +623,9 @@ class WeeklyTrainingCard extends HTMLElement {
 	  async _reloadState() {
 	    if (!this._entryId) return;
 	    try {
-	      const res = await this._callWS({ type: "weekly_training/get_state", entry_id: this._entryId }, true);
-	      this._applyState((res && res.state) || {});
+	      const ifRev = this._state && this._state.rev != null ? { if_rev: Number(this._state.rev) } : {};
+	      const res = await this._callWS({ type: "weekly_training/get_state", entry_id: this._entryId, ...ifRev }, true);
+	      if (!(res && res.not_modified)) this._applyState((res && res.state) || {});
 	    } catch (e) {
 	      this._error = String((e && e.message) || e);
 	    } finally {
@@ -854,15 +972,14 @@ class WeeklyTrainingCard extends HTMLElement {
         deload_pct: Number(d.deload_pct || 0),
         deload_volume: Number(d.deload_volume || 0.65),
       };
-      await this._callWS({ type: "weekly_training/set_person_cycle", entry_id: this._entryId, person_id: personId, cycle });
-
+      // One batch: cycle config + generated sessions land as a single rev (one write, one round trip).
       const res = await this._callWS({
-        type: "weekly_training/generate_cycle",
+        type: "weekly_training/batch",
         entry_id: this._entryId,
-        person_id: personId,
-        start_week_start: startWeekStart,
-        weeks: weeks,
-        weekdays: weekdays,
+        ops: [
+          { type: "set_person_cycle", person_id: personId, cycle },
+          { type: "generate_cycle", person_id: personId, start_week_start: startWeekStart, weeks: weeks, weekdays: weekdays },
+        ],
       });
       this._applyState((res && res.state) || this._state);
       this._ui.showCyclePlanner = false;
@@ -1105,10 +1222,10 @@ class WeeklyTrainingCard extends HTMLElement {
       // Persist draft first so generation uses latest values
       await this._saveOverrides();
       const pid = personId ? String(personId) : "";
-      await this._callWS({ type: "weekly_training/generate_plan", entry_id: this._entryId, ...(pid ? { person_id: pid } : {}) });
-      // Refresh state after generation
-      const st = await this._callWS({ type: "weekly_training/get_state", entry_id: this._entryId });
-      this._applyState((st && st.state) || this._state);
+      const res = await this._callWS({ type: "weekly_training/generate_plan", entry_id: this._entryId, ...(pid ? { person_id: pid } : {}) });
+      this._applyState((res && res.state) || this._state);
+      // Revalidate (cheap when nothing else changed in the meantime).
+      await this._reloadState();
     } catch (e) {
       this._error = String((e && e.message) || e);
     } finally {
@@ -1190,13 +1307,37 @@ class WeeklyTrainingCard extends HTMLElement {
   }
 
   async _ensureLibrary() {
-    if (this._library) return;
+    // The library only changes with exercise_config; skip the round trip while that is unchanged.
+    const cfgKey = JSON.stringify((this._state && this._state.exercise_config) || {});
+    if (this._library && this._libraryCfgKey === cfgKey) return;
+    // Cached across page reloads; the backend answers not_modified when the hash still matches.
+    const storageKey = `weekly_training_library_${this._entryId}`;
+    let cached = this._libraryCache || null;
+    if (!cached) {
+      try {
+        cached = JSON.parse(window.localStorage.getItem(storageKey) || "null");
+      } catch (_) {
+        cached = null;
+      }
+    }
     try {
-      const res = await this._callWS({ type: "weekly_training/get_library", entry_id: this._entryId });
-      this._library = res && Array.isArray(res.exercises) ? res.exercises : [];
+      const res = await this._callWS({
+        type: "weekly_training/get_library",
+        entry_id: this._entryId,
+        ...(cached && cached.hash ? { if_hash: String(cached.hash) } : {}),
+      });
+      if (!(res && res.not_modified && cached)) {
+        cached = { hash: String((res && res.hash) || ""), exercises: res && Array.isArray(res.exercises) ? res.exercises : [] };
+        try {
+          window.localStorage.setItem(storageKey, JSON.stringify(cached));
+        } catch (_) {}
+      }
+      this._libraryCache = cached;
+      this._library = Array.isArray(cached.exercises) ? cached.exercises : [];
+      this._libraryCfgKey = cfgKey;
     } catch (e) {
       // Non-fatal: settings modal can still render without the list.
-      this._library = [];
+      if (!this._library) this._library = cached && Array.isArray(cached.exercises) ? cached.exercises : [];
     }
   }
 
@@ -2,27 +2,171 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .planner import CompiledLibrary
+
+_DATA_PATH = Path(__file__).parent / "data" / "exercises.json"
+# hass.data[DOMAIN] key holding the process-wide library.
+_DATA_KEY = "library"
+# Merged views kept per library (one per distinct exercise_config in use).
+_MAX_VIEWS = 8
+
+
+def _read_bundled() -> dict[str, Any]:
+    """Read and parse the bundled JSON (blocking; run in an executor)."""
+    raw = json.loads(_DATA_PATH.read_text(encoding="utf-8"))
+    if not isinstance(raw, dict):
+        raw = {}
+    raw.setdefault("exercises", [])
+    raw.setdefault("tags", {})
+    return raw
+
+
+def exercise_config_key(exercise_config: Any) -> str:
+    """Stable hash of the parts of exercise_config that change the library (custom + disabled)."""
+    cfg = exercise_config if isinstance(exercise_config, dict) else {}
+    custom = cfg.get("custom_exercises")
+    disabled = cfg.get("disabled_exercises")
+    material = {
+        "custom": [e for e in custom if isinstance(e, dict)] if isinstance(custom, list) else [],
+        "disabled": [str(n) for n in disabled] if isinstance(disabled, list) else [],
+    }
+    return hashlib.sha1(json.dumps(material, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _library_payload(exercises: Any) -> list[dict[str, Any]]:
+    # Payload: enough for UI grouping + future-proofing.
+    payload = []
+    for ex in exercises if isinstance(exercises, list) else []:
+        if not isinstance(ex, dict):
+            continue
+        ex_id = str(ex.get("id") or "").strip()
+        name = str(ex.get("name") or "").strip()
+        if not name:
+            continue
+        group = ex.get("group")
+        tags = ex.get("tags") if isinstance(ex.get("tags"), list) else []
+        equipment = ex.get("equipment") if isinstance(ex.get("equipment"), list) else []
+        payload.append(
+            {
+                **({"id": ex_id} if ex_id else {}),
+                "name": name,
+                **({"group": str(group)} if group else {}),
+                "tags": [str(t).strip().lower() for t in tags if str(t).strip()],
+                "equipment": [str(t).strip().lower() for t in equipment if str(t).strip()],
+            }
+        )
+
+    payload.sort(key=lambda e: str(e.get("name") or "").lower())
+    return payload
+
+
+class LibraryView:
+    """Bundled library merged with one exercise_config; treat as read-only."""
+
+    def __init__(self, key: str, bundled: dict[str, Any], exercise_config: Any) -> None:
+        cfg = exercise_config if isinstance(exercise_config, dict) else {}
+        self.key = key
+        library = bundled
+        custom = cfg.get("custom_exercises", [])
+        if isinstance(custom, list) and custom:
+            library = dict(bundled)
+            exercises = library.get("exercises", [])
+            if not isinstance(exercises, list):
+                exercises = []
+            library["exercises"] = [*exercises, *[e for e in custom if isinstance(e, dict)]]
+        self.library = library
+        disabled = cfg.get("disabled_exercises", [])
+        self.disabled_exercises: list[Any] | None = list(disabled) if isinstance(disabled, list) else None
+        self._compiled: CompiledLibrary | None = None
+        self._payload: list[dict[str, Any]] | None = None
+        self._payload_hash = ""
+
+    @property
+    def compiled(self) -> CompiledLibrary:
+        if self._compiled is None:
+            self._compiled = CompiledLibrary(self.library)
+        return self._compiled
+
+    def _build_payload(self) -> None:
+        if self._payload is None:
+            self._payload = _library_payload(self.library.get("exercises", []))
+            self._payload_hash = hashlib.sha1(
+                json.dumps(self._payload, sort_keys=True, separators=(",", ":")).encode()
+            ).hexdigest()
+
+    @property
+    def payload(self) -> list[dict[str, Any]]:
+        """UI payload for get_library (normalized, sorted by name); built once per view."""
+        self._build_payload()
+        return self._payload or []
+
+    @property
+    def payload_hash(self) -> str:
+        """Content hash of `payload`; clients send it back to revalidate."""
+        self._build_payload()
+        return self._payload_hash
+
 
 class ExerciseLibrary:
-    """Loads bundled exercise data from JSON and caches it."""
+    """Loads bundled exercise data from JSON (off the event loop) and caches it.
 
-    def __init__(self) -> None:
+    One instance is shared by all config entries (see `async_get_library`).
+    Merged views (bundled + custom exercises, compiled for the planner) are
+    cached by `exercise_config_key` and dropped with `invalidate`.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
         self._cache: dict[str, Any] | None = None
+        self._lock = asyncio.Lock()
+        self._views: OrderedDict[str, LibraryView] = OrderedDict()
 
     async def async_load(self) -> dict[str, Any]:
         if self._cache is not None:
             return self._cache
-
-        data_path = Path(__file__).parent / "data" / "exercises.json"
-        raw = json.loads(data_path.read_text(encoding="utf-8"))
-        if not isinstance(raw, dict):
-            raw = {}
-        raw.setdefault("exercises", [])
-        raw.setdefault("tags", {})
-        self._cache = raw
+        async with self._lock:
+            if self._cache is None:
+                self._cache = await self._hass.async_add_executor_job(_read_bundled)
         return self._cache
 
+    async def async_view(self, exercise_config: Any) -> LibraryView:
+        """Merged library for this exercise_config (cached)."""
+        bundled = await self.async_load()
+        key = exercise_config_key(exercise_config)
+        view = self._views.get(key)
+        if view is None:
+            view = LibraryView(key, bundled, exercise_config)
+            self._views[key] = view
+            while len(self._views) > _MAX_VIEWS:
+                self._views.popitem(last=False)
+        else:
+            self._views.move_to_end(key)
+        return view
+
+    @callback
+    def invalidate(self, key: str | None = None) -> None:
+        """Drop one cached view (or all of them)."""
+        if key is None:
+            self._views.clear()
+        else:
+            self._views.pop(key, None)
+
+
+@callback
+def async_get_library(hass: HomeAssistant) -> ExerciseLibrary:
+    """Return the process-wide library, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    library = domain_data.get(_DATA_KEY)
+    if library is None:
+        library = domain_data[_DATA_KEY] = ExerciseLibrary(hass)
+    return library
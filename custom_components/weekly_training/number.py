@@ -4,11 +4,11 @@ from __future__ import annotations
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DEFAULT_DURATION_MINUTES, DOMAIN, SIGNAL_PLAN_UPDATED
+from .const import DOMAIN, SIGNAL_PLAN_UPDATED
 from .coordinator import WeeklyTrainingCoordinator
 from .entity import device_info_from_entry
 
@@ -40,7 +40,6 @@ class SessionDurationNumber(NumberEntity):
         self._attr_unique_id = f"{entry.entry_id}_session_minutes"
         self._attr_device_info = device_info_from_entry(entry)
         self._unsub = None
-        self._value = float(DEFAULT_DURATION_MINUTES)
 
     async def async_added_to_hass(self) -> None:
         self._unsub = async_dispatcher_connect(
@@ -48,7 +47,6 @@ class SessionDurationNumber(NumberEntity):
             f"{SIGNAL_PLAN_UPDATED}_{self._entry.entry_id}",
             self._handle_updated,
         )
-        await self._refresh_from_store()
 
     async def async_will_remove_from_hass(self) -> None:
         if self._unsub:
@@ -57,26 +55,11 @@ class SessionDurationNumber(NumberEntity):
 
     @property
     def native_value(self) -> float:
-        return float(self._value)
+        return self._coordinator.entity_snapshot.duration_minutes
 
     async def async_set_native_value(self, value: float) -> None:
         await self._coordinator.store.async_set_overrides(duration_minutes=int(value))
-        await self._coordinator.async_request_refresh()
-        await self._refresh_from_store()
-        self.async_write_ha_state()
-
-    async def _refresh_from_store(self) -> None:
-        state = await self._coordinator.store.async_load()
-        overrides = state.get("overrides", {}) if isinstance(state, dict) else {}
-        if isinstance(overrides, dict) and overrides.get("duration_minutes") is not None:
-            self._value = float(int(overrides.get("duration_minutes") or DEFAULT_DURATION_MINUTES))
-        else:
-            self._value = float(DEFAULT_DURATION_MINUTES)
 
+    @callback
     def _handle_updated(self) -> None:
-        self.hass.async_create_task(self._async_reload_and_write())
-
-    async def _async_reload_and_write(self) -> None:
-        await self._refresh_from_store()
         self.async_write_ha_state()
-
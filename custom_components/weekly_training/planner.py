@@ -6,12 +6,24 @@ You generate sessions day-by-day and store them under that week.
 
 from __future__ import annotations
 
+from collections.abc import Collection, Iterable
 from dataclasses import dataclass
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.util import dt as dt_util
 
+from .programs import NO_DEADLIFT, NO_SQUAT, PROGRAMS, TemplateItem
+
+try:  # Optional: bulk load recomputation is vectorized when NumPy is available.
+    import numpy as np
+except ImportError:  # pragma: no cover - pure-Python fallback
+    np = None
+
+# Rows below which the pure-Python rounding loop is faster than building arrays.
+VECTOR_MIN_ITEMS = 256
+
 
 def _week_start(day_value: date) -> date:
     return day_value - timedelta(days=day_value.weekday())
@@ -55,61 +67,221 @@ def _week_index_from_start(*, start_week_start: date, week_start_day: date, cycl
     return delta_weeks % cycle_len
 
 
+# Lift families whose suggested load derives from a 1RM: family -> key in profile["maxes"].
+LIFT_FAMILY_MAX = {"squat": "squat", "deadlift": "deadlift", "bench": "bench", "ohp": "bench"}
+
+
+@lru_cache(maxsize=4096)
+def lift_family(exercise_name: str) -> tuple[str, float] | None:
+    """(family, share of that family's 1RM) for an exercise with a max-derived load, else None.
+
+    Simple heuristics on the name; cached, so each distinct name is classified once.
+    """
+    name = str(exercise_name or "").lower()
+    if "squat" in name:
+        return ("squat", 0.85 if "front squat" in name else 1.0)
+    if "deadlift" in name:
+        return ("deadlift", 0.65 if "romanian" in name else 1.0)
+    if "bench" in name:
+        return ("bench", 1.0)
+    if "overhead press" in name or name == "press":
+        # If no OHP 1RM exists, approximate from bench.
+        return ("ohp", 0.65)
+    return None
+
+
+def lift_families_for_maxes(before: Any, after: Any) -> frozenset[str]:
+    """Lift families whose loads change when maxes go from `before` to `after`."""
+    before = before if isinstance(before, dict) else {}
+    after = after if isinstance(after, dict) else {}
+    changed = {key for key in set(LIFT_FAMILY_MAX.values()) if float(before.get(key) or 0) != float(after.get(key) or 0)}
+    return frozenset(family for family, key in LIFT_FAMILY_MAX.items() if key in changed)
+
+
 def _csv_set(raw: str) -> set[str]:
     return {part.strip().lower() for part in str(raw or "").split(",") if part.strip()}
 
 
 @dataclass(frozen=True, slots=True)
 class PickContext:
-    equipment: set[str]
-    preferred: set[str]
-    disabled: set[str]
+    equipment: frozenset[str]
+    preferred: frozenset[str]
+    disabled: frozenset[str]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledExercise:
+    """Normalized view of one library exercise."""
+
+    raw: dict[str, Any]
+    name: str
+    name_lc: str
+    tags: frozenset[str]
+    equipment: frozenset[str]
+
+
+class CompiledLibrary:
+    """Exercise library with normalized tag/equipment sets and lookup indexes.
+
+    Built once per library payload so picks become set intersections instead of
+    full scans that re-normalize every exercise.
+    """
+
+    _MAX_CACHED_CONTEXTS = 32
 
+    def __init__(self, library: dict[str, Any]) -> None:
+        exercises = library.get("exercises", []) if isinstance(library, dict) else []
+        if not isinstance(exercises, list):
+            exercises = []
 
-def _matches_preferences(ex: dict[str, Any], ctx: PickContext) -> bool:
-    name = str(ex.get("name") or "").strip().lower()
-    if name and name in ctx.disabled:
+        compiled: list[CompiledExercise] = []
+        for ex in exercises:
+            if not isinstance(ex, dict):
+                continue
+            compiled.append(
+                CompiledExercise(
+                    raw=ex,
+                    name=str(ex.get("name") or ""),
+                    name_lc=str(ex.get("name") or "").strip().lower(),
+                    tags=frozenset(str(t).strip().lower() for t in (ex.get("tags") or []) if str(t).strip()),
+                    equipment=frozenset(str(t).strip().lower() for t in (ex.get("equipment") or []) if str(t).strip()),
+                )
+            )
+        self.exercises: tuple[CompiledExercise, ...] = tuple(compiled)
+        self.by_name: dict[str, CompiledExercise] = {ex.name: ex for ex in compiled if ex.name}
+        self.by_name_lc: dict[str, CompiledExercise] = {ex.name_lc: ex for ex in compiled if ex.name_lc}
+
+        tag_index: dict[str, set[int]] = {}
+        for idx, ex in enumerate(compiled):
+            for tag in ex.tags:
+                tag_index.setdefault(tag, set()).add(idx)
+        self._tag_index: dict[str, frozenset[int]] = {t: frozenset(ids) for t, ids in tag_index.items()}
+
+        # Deterministic-ish choice: name-sorted order (stable for equal names).
+        order = sorted(range(len(compiled)), key=lambda i: compiled[i].name)
+        self._rank: list[int] = [0] * len(compiled)
+        for pos, idx in enumerate(order):
+            self._rank[idx] = pos
+        self._all: frozenset[int] = frozenset(range(len(compiled)))
+
+        self._tagged_cache: dict[frozenset[str], frozenset[int]] = {}
+        self._allowed_cache: dict[PickContext, frozenset[int]] = {}
+        self._program_cache: dict[tuple[str, PickContext], dict[str, tuple[tuple[str, dict[str, Any], str], ...]]] = {}
+
+    def tagged(self, tags_any: set[str] | frozenset[str]) -> frozenset[int]:
+        """Indexes of exercises carrying at least one of the given tags."""
+        key = tags_any if isinstance(tags_any, frozenset) else frozenset(tags_any)
+        hit = self._tagged_cache.get(key)
+        if hit is None:
+            ids: set[int] = set()
+            for tag in key:
+                ids.update(self._tag_index.get(tag, ()))
+            hit = frozenset(ids)
+            self._tagged_cache[key] = hit
+        return hit
+
+    def allowed(self, ctx: PickContext) -> frozenset[int]:
+        """Indexes of exercises that pass the person's equipment/preference filters."""
+        hit = self._allowed_cache.get(ctx)
+        if hit is None:
+            hit = frozenset(i for i, ex in enumerate(self.exercises) if _matches_preferences(ex, ctx))
+            if len(self._allowed_cache) >= self._MAX_CACHED_CONTEXTS:
+                self._allowed_cache.clear()
+            self._allowed_cache[ctx] = hit
+        return hit
+
+    def program(self, name: str, ctx: PickContext) -> dict[str, tuple[tuple[str, dict[str, Any], str], ...]]:
+        """Program template resolved against this library and the person's filters (cached).
+
+        Maps slot -> ((kind, exercise, sets_reps), ...); empty for an unknown program.
+        """
+        key = (name, ctx)
+        hit = self._program_cache.get(key)
+        if hit is None:
+            template = PROGRAMS.get(name)
+            hit = {
+                slot: tuple((item.kind, _resolve_template_item(self, item, ctx), item.sets_reps) for item in items)
+                for slot, items in (template.slots.items() if template is not None else ())
+            }
+            if len(self._program_cache) >= self._MAX_CACHED_CONTEXTS:
+                self._program_cache.clear()
+            self._program_cache[key] = hit
+        return hit
+
+    def first_by_name(self, candidates: frozenset[int]) -> dict[str, Any] | None:
+        if not candidates:
+            return None
+        best = min(candidates, key=self._rank.__getitem__)
+        return self.exercises[best].raw
+
+    @property
+    def all(self) -> frozenset[int]:
+        return self._all
+
+
+def compile_library(library: dict[str, Any] | CompiledLibrary) -> CompiledLibrary:
+    """Return a compiled library, compiling raw payloads on demand."""
+    if isinstance(library, CompiledLibrary):
+        return library
+    return CompiledLibrary(library)
+
+
+def _matches_preferences(ex: CompiledExercise, ctx: PickContext) -> bool:
+    if ex.name_lc and ex.name_lc in ctx.disabled:
         return False
-    tags = {str(t).strip().lower() for t in (ex.get("tags") or []) if str(t).strip()}
-    equipment = {str(t).strip().lower() for t in (ex.get("equipment") or []) if str(t).strip()}
 
     if ctx.equipment:
-        if equipment and equipment.isdisjoint(ctx.equipment):
+        if ex.equipment and ex.equipment.isdisjoint(ctx.equipment):
             return False
 
     if not ctx.preferred:
         return True
 
     # Preferred tokens can match name or tags.
-    for token in ctx.preferred:
-        if token in name or token in tags:
-            return True
-    return False
-
+    if not ctx.preferred.isdisjoint(ex.tags):
+        return True
+    return any(token in ex.name_lc for token in ctx.preferred)
 
-def _pick_one(library: dict[str, Any], *, tags_any: set[str], ctx: PickContext, fallback_tags_any: set[str]) -> dict[str, Any]:
-    exercises = library.get("exercises", [])
-    if not isinstance(exercises, list):
-        exercises = []
 
-    def ok(ex: Any) -> bool:
-        if not isinstance(ex, dict):
-            return False
-        ex_tags = {str(t).strip().lower() for t in (ex.get("tags") or []) if str(t).strip()}
-        if tags_any and ex_tags.isdisjoint(tags_any):
-            return False
-        return _matches_preferences(ex, ctx)
-
-    matches = [ex for ex in exercises if ok(ex)]
+def _pick_one(
+    library: CompiledLibrary,
+    *,
+    tags_any: set[str],
+    ctx: PickContext,
+    fallback_tags_any: set[str],
+) -> dict[str, Any]:
+    allowed = library.allowed(ctx)
+    matches = library.tagged(tags_any) & allowed if tags_any else allowed
     if not matches and fallback_tags_any:
-        matches = [ex for ex in exercises if isinstance(ex, dict) and not {str(t).strip().lower() for t in (ex.get("tags") or [])}.isdisjoint(fallback_tags_any)]
+        matches = library.tagged(fallback_tags_any)
     if not matches:
         # Last resort: anything.
-        matches = [ex for ex in exercises if isinstance(ex, dict)]
+        matches = library.all
 
-    # Deterministic-ish choice: sort by name
-    matches.sort(key=lambda ex: str(ex.get("name") or ""))
-    return matches[0] if matches else {"name": "Bodyweight Squat", "tags": ["squat"], "equipment": ["bodyweight"]}
+    picked = library.first_by_name(matches)
+    return picked if picked is not None else {"name": "Bodyweight Squat", "tags": ["squat"], "equipment": ["bodyweight"]}
+
+
+def _resolve_template_item(library: CompiledLibrary, item: TemplateItem, ctx: PickContext) -> dict[str, Any]:
+    # Prefer exact exercise names if available (keeps templates stable).
+    for nm in item.names:
+        ex = library.by_name_lc.get(nm.strip().lower())
+        if ex is None:
+            continue
+        if ex.name_lc and ex.name_lc in ctx.disabled:
+            continue
+        # Hard preference: avoid front squats in auto programs.
+        if "front squat" in ex.name_lc:
+            continue
+        if item.disallow_tags and not ex.tags.isdisjoint(item.disallow_tags):
+            continue
+        if _matches_preferences(ex, ctx):
+            return ex.raw
+    picked = _pick_one(library, tags_any=item.tags, ctx=ctx, fallback_tags_any=item.fallback_tags)
+    if isinstance(picked, dict) and "front squat" in str(picked.get("name") or "").strip().lower():
+        # Retry without squat tags to escape a "front squat" heavy library.
+        picked = _pick_one(library, tags_any=frozenset(), ctx=ctx, fallback_tags_any=item.fallback_tags)
+    return picked
 
 
 def _slot_for_weekday(weekday: int) -> str:
@@ -192,16 +364,79 @@ def _render_markdown(*, week_number: int, week_start: str, plan: dict[str, Any])
         lines.append("")
     return "\n".join(lines).strip()
 
+def render_week_markdown(plan: dict[str, Any], *, week_start: str) -> str:
+    """Markdown view of one stored week plan (derived on request, never persisted)."""
+    week_number = plan.get("week_number")
+    if week_number is None:
+        try:
+            week_number = _iso_week_number(date.fromisoformat(str(week_start)[:10]))
+        except ValueError:
+            week_number = 0
+    return _render_markdown(week_number=int(week_number), week_start=str(plan.get("week_start") or week_start), plan=plan)
+
+
 def generate_session(
     *,
     profile: dict[str, Any],
-    library: dict[str, Any],
+    library: dict[str, Any] | CompiledLibrary,
+    overrides: dict[str, Any],
+    week_start_day: date,
+    weekday: int,
+    existing_plan: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Generate one day's full-body session and merge into the weekly plan.
+
+    Plans carry no markdown; it is rendered on demand (`render_week_markdown`).
+    """
+    return _merge_session(
+        profile=profile,
+        library=library,
+        overrides=overrides,
+        week_start_day=week_start_day,
+        weekday=weekday,
+        existing_plan=existing_plan,
+    )
+
+
+def generate_sessions(
+    *,
+    profile: dict[str, Any],
+    library: dict[str, Any] | CompiledLibrary,
+    overrides: dict[str, Any],
+    days: list[tuple[date, int]],
+    existing_plans: dict[str, dict[str, Any] | None],
+) -> dict[str, dict[str, Any]]:
+    """Generate many (week_start, weekday) sessions in one pass.
+
+    The library is compiled once and each week's plan is threaded through
+    in memory, so a whole cycle costs one generation context instead of one
+    per day. Returns a mapping week_start (ISO) -> plan for every touched week.
+    """
+    library = compile_library(library)
+    plans: dict[str, dict[str, Any]] = {}
+    for week_start_day, weekday in days:
+        key = week_start_day.isoformat()
+        existing = plans[key] if key in plans else existing_plans.get(key)
+        plans[key] = _merge_session(
+            profile=profile,
+            library=library,
+            overrides=overrides,
+            week_start_day=week_start_day,
+            weekday=weekday,
+            existing_plan=existing,
+        )
+    return plans
+
+
+def _merge_session(
+    *,
+    profile: dict[str, Any],
+    library: dict[str, Any] | CompiledLibrary,
     overrides: dict[str, Any],
     week_start_day: date,
     weekday: int,
     existing_plan: dict[str, Any] | None,
 ) -> dict[str, Any]:
-    """Generate one day's full-body session and merge into the weekly plan."""
     week_number = _iso_week_number(week_start_day)
     session_date = week_start_day + timedelta(days=int(weekday))
     session_date_iso = session_date.isoformat()
@@ -225,7 +460,7 @@ def generate_session(
     if cycle_preset not in {"strength", "hypertrophy", "minimalist"}:
         cycle_preset = "strength"
     cycle_program = str(cycle_cfg.get("program") or "full_body_abc").strip().lower()
-    if cycle_program not in {"full_body_abc", "full_body_2day", "upper_lower_4day"}:
+    if cycle_program not in PROGRAMS:
         cycle_program = "full_body_abc"
     try:
         cycle_step_pct = float(cycle_cfg.get("step_pct")) if cycle_cfg.get("step_pct") is not None else 2.5
@@ -265,7 +500,7 @@ def generate_session(
     duration = int(profile.get("duration_minutes") or 45)
     preferred = _csv_set(profile.get("preferred_exercises") or "")
     equipment = _csv_set(profile.get("equipment") or "")
-    disabled = set()
+    disabled: frozenset[str] = frozenset()
     dis = overrides.get("exercise_config") if isinstance(overrides.get("exercise_config"), dict) else None
     # Backwards/compat: allow disabled_exercises at top-level of overrides too.
     disabled_raw = None
@@ -274,13 +509,13 @@ def generate_session(
     if disabled_raw is None:
         disabled_raw = overrides.get("disabled_exercises")
     if isinstance(disabled_raw, list):
-        disabled = {str(n or "").strip().lower() for n in disabled_raw if str(n or "").strip()}
+        disabled = frozenset(str(n or "").strip().lower() for n in disabled_raw if str(n or "").strip())
     units = str(profile.get("units") or "kg").lower()
     maxes = profile.get("maxes") if isinstance(profile.get("maxes"), dict) else {}
     max_sq = float(maxes.get("squat") or 0)
     max_dl = float(maxes.get("deadlift") or 0)
     max_bp = float(maxes.get("bench") or 0)
-    ctx = PickContext(equipment=equipment, preferred=preferred, disabled=disabled)
+    ctx = PickContext(equipment=frozenset(equipment), preferred=frozenset(preferred), disabled=disabled)
 
     # Rep ranges: keep simple. Cycle presets can nudge volume/intensity.
     if intensity == "easy":
@@ -321,17 +556,15 @@ def generate_session(
         accessory_reps = _format_sets_reps(as_, ar)
         core_reps = _format_sets_reps(cs, cr)
 
-    # Index exercises by name to allow manual selection by name.
-    exercises = library.get("exercises", [])
-    if not isinstance(exercises, list):
-        exercises = []
-    by_name = {str(ex.get("name") or ""): ex for ex in exercises if isinstance(ex, dict) and str(ex.get("name") or "")}
+    # Name indexes (manual selection by name) come precompiled with the library.
+    library = compile_library(library)
+    by_name = library.by_name
 
-    def tags_for(ex_name: str) -> set[str]:
+    def tags_for(ex_name: str) -> frozenset[str]:
         ex = by_name.get(ex_name)
-        if not isinstance(ex, dict):
-            return set()
-        return {str(t).strip().lower() for t in (ex.get("tags") or []) if str(t).strip()}
+        if ex is None:
+            return frozenset()
+        return ex.tags
 
     # Determine lower_family across the week so SQ and DL don't both appear.
     lower_family = ""
@@ -367,7 +600,7 @@ def generate_session(
         *,
         tags_any: set[str],
         fallback_tags_any: set[str],
-        disallow_tags: set[str] | None = None,
+        disallow_tags: frozenset[str] | None = None,
     ) -> dict[str, Any]:
         chosen = str(session_overrides.get(slot_key) or "").strip()
         if planning_mode == "manual" and chosen and chosen in by_name:
@@ -378,13 +611,10 @@ def generate_session(
                 pass
             else:
                 ex = by_name.get(chosen)
-                if isinstance(ex, dict):
-                    return ex
+                if ex is not None:
+                    return ex.raw
         return _pick_one(library, tags_any=tags_any, ctx=ctx, fallback_tags_any=fallback_tags_any)
 
-    disallow_deadlift = {"deadlift", "hinge"}
-    disallow_squat = {"squat"}
-
     # Cycle uses A/B/C rotation across chosen training weekdays.
     training_weekdays: list[int] = []
     if isinstance(cycle_cfg, dict):
@@ -401,52 +631,16 @@ def generate_session(
             cleaned.sort()
             training_weekdays = cleaned
 
-    rot_slots: list[str] = ["A", "B", "C"]
-    if cycle_program == "full_body_2day":
-        rot_slots = ["A", "B"]
-    elif cycle_program == "upper_lower_4day":
-        # U/L split with separate squat and deadlift lower days.
-        rot_slots = ["U", "L", "U", "D"]
-
+    program = PROGRAMS[cycle_program]
     slot = _cycle_slot_for_day(
         start_week_start=start_week_start if cycle_enabled else None,
         week_start_day=week_start_day,
         weekday=int(weekday),
         training_weekdays=training_weekdays,
-        slots=rot_slots,
+        slots=list(program.rotation),
     ) or _slot_for_weekday(int(weekday))
     slot_key = slot.lower()
 
-    by_name_lc = {str(k or "").strip().lower(): v for k, v in by_name.items() if str(k or "").strip()}
-
-    def _pick_named_or_tags(
-        *,
-        names: list[str],
-        tags_any: set[str],
-        fallback_tags_any: set[str],
-        disallow_tags: set[str] | None = None,
-    ) -> dict[str, Any]:
-        # Prefer exact exercise names if available (keeps templates stable).
-        for nm in names:
-            ex = by_name_lc.get(str(nm or "").strip().lower())
-            if not isinstance(ex, dict):
-                continue
-            ex_name = str(ex.get("name") or "").strip().lower()
-            if ex_name and ex_name in disabled:
-                continue
-            # Hard preference: avoid front squats in auto programs.
-            if "front squat" in ex_name:
-                continue
-            if disallow_tags and not tags_for(str(ex.get("name") or "")).isdisjoint(disallow_tags):
-                continue
-            if _matches_preferences(ex, ctx):
-                return ex
-        picked = _pick_one(library, tags_any=tags_any, ctx=ctx, fallback_tags_any=fallback_tags_any)
-        if isinstance(picked, dict) and "front squat" in str(picked.get("name") or "").strip().lower():
-            # Retry without squat tags to escape a "front squat" heavy library.
-            picked = _pick_one(library, tags_any=set(), ctx=ctx, fallback_tags_any=fallback_tags_any)
-        return picked
-
     def _apply_deload_sr(sr: str) -> str:
         if not is_deload:
             return sr
@@ -458,94 +652,14 @@ def generate_session(
     use_cycle_templates = cycle_enabled and (int(weekday) in training_weekdays) and planning_mode != "manual"
     use_strength_templates = use_cycle_templates and cycle_preset == "strength"
 
-    lower = {}
-    push = {}
-    pull = {}
-    accessory = {}
-    core = {}
     items_spec: list[tuple[str, dict[str, Any], str]] | None = None
 
-    if use_strength_templates and cycle_program in {"full_body_abc", "full_body_2day"}:
-        # Strength-ish full body templates (no squat+deadlift in same session; bench can pair).
-        if slot == "A":
-            lower = _pick_named_or_tags(names=["Back Squat", "Squat"], tags_any={"squat"}, fallback_tags_any={"leg"}, disallow_tags=disallow_deadlift)
-            push = _pick_named_or_tags(names=["Bench Press", "Barbell Bench Press"], tags_any={"bench", "press", "push"}, fallback_tags_any={"push"})
-            pull = _pick_named_or_tags(names=["Barbell Row", "Bent-Over Row", "Row"], tags_any={"row"}, fallback_tags_any={"pull"})
-            core = _pick_named_or_tags(names=["Hanging Leg Raise", "Leg Raise"], tags_any={"core"}, fallback_tags_any={"core"})
-            items_spec = [
-                ("main_lower", lower, _apply_deload_sr("4 x 5")),
-                ("main_push", push, _apply_deload_sr("4 x 5")),
-                ("accessory", pull, _apply_deload_sr("3 x 8")),
-                ("core", core, _apply_deload_sr("3 x 10")),
-            ]
-        elif slot == "B":
-            lower = _pick_named_or_tags(names=["Deadlift", "Conventional Deadlift"], tags_any={"deadlift", "hinge"}, fallback_tags_any={"hinge"}, disallow_tags=disallow_squat)
-            accessory = _pick_named_or_tags(names=["Dumbbell Shoulder Press", "DB Shoulder Press", "Overhead Press"], tags_any={"shoulders", "press", "push"}, fallback_tags_any={"shoulders"})
-            pull = _pick_named_or_tags(names=["Pull-Up", "Pull-ups", "Pull Up", "Chin-Up"], tags_any={"pullup", "pull"}, fallback_tags_any={"pull"})
-            core = _pick_named_or_tags(names=["Plank"], tags_any={"core"}, fallback_tags_any={"core"})
-            items_spec = [
-                ("main_lower", lower, _apply_deload_sr("4 x 4")),
-                ("accessory", accessory, _apply_deload_sr("3 x 10")),
-                ("accessory_2", pull, _apply_deload_sr("3 x 6")),
-                ("core", core, _apply_deload_sr("3 x 45")),
-            ]
-        else:
-            # C
-            # Prefer back squat (or pause squat). Never auto-pick front squat.
-            lower = _pick_named_or_tags(
-                names=["Pause Squat", "Back Squat", "Squat"],
-                tags_any={"squat"},
-                fallback_tags_any={"leg"},
-                disallow_tags=disallow_deadlift,
-            )
-            push = _pick_named_or_tags(
-                names=["Close-Grip Bench Press", "Close Grip Bench Press", "Close-Grip Bench", "Bench Press"],
-                tags_any={"bench", "press", "push"},
-                fallback_tags_any={"push"},
-            )
-            pull = _pick_named_or_tags(names=["Dumbbell Row", "DB Row", "Row"], tags_any={"row", "pull"}, fallback_tags_any={"pull"})
-            accessory = _pick_named_or_tags(names=["Hammer Curl", "Dumbbell Hammer Curl", "Curl"], tags_any={"arms"}, fallback_tags_any={"arms"})
-            core = _pick_named_or_tags(names=["Ab Wheel Rollout", "Ab Wheel", "Rollout"], tags_any={"core"}, fallback_tags_any={"core"})
-            items_spec = [
-                # Light squat day: explicitly mark as light so loads come out lower.
-                ("main_lower_light", lower, _apply_deload_sr("3 x 6")),
-                ("main_push", push, _apply_deload_sr("3 x 8")),
-                ("accessory", pull, _apply_deload_sr("3 x 10")),
-                ("accessory_2", accessory, _apply_deload_sr("3 x 10")),
-                ("core", core, _apply_deload_sr("3 x 8")),
-            ]
-    elif use_strength_templates and cycle_program == "upper_lower_4day":
-        # Upper/Lower 4-day templates. Lower days split squat vs deadlift.
-        if slot == "U":
-            push = _pick_named_or_tags(names=["Bench Press", "Barbell Bench Press"], tags_any={"bench", "push", "press"}, fallback_tags_any={"push"})
-            pull = _pick_named_or_tags(names=["Barbell Row", "Bent-Over Row", "Row"], tags_any={"row", "pull"}, fallback_tags_any={"pull"})
-            accessory = _pick_named_or_tags(names=["Dumbbell Shoulder Press", "DB Shoulder Press", "Overhead Press"], tags_any={"shoulders", "press"}, fallback_tags_any={"shoulders"})
-            core = _pick_named_or_tags(names=["Hanging Leg Raise", "Ab Wheel Rollout", "Plank"], tags_any={"core"}, fallback_tags_any={"core"})
-            items_spec = [
-                ("main_push", push, _apply_deload_sr("4 x 5")),
-                ("main_pull", pull, _apply_deload_sr("4 x 6")),
-                ("accessory", accessory, _apply_deload_sr("3 x 10")),
-                ("core", core, _apply_deload_sr("3 x 10")),
-            ]
-        elif slot == "L":
-            lower = _pick_named_or_tags(names=["Back Squat", "Pause Squat", "Squat"], tags_any={"squat"}, fallback_tags_any={"leg"}, disallow_tags=disallow_deadlift)
-            accessory = _pick_named_or_tags(names=["Bulgarian Split Squat", "Split Squat", "Lunge"], tags_any={"lunge", "single_leg"}, fallback_tags_any={"leg"})
-            core = _pick_named_or_tags(names=["Ab Wheel Rollout", "Hanging Leg Raise", "Plank"], tags_any={"core"}, fallback_tags_any={"core"})
-            items_spec = [
-                ("main_lower", lower, _apply_deload_sr("4 x 5")),
-                ("accessory", accessory, _apply_deload_sr("3 x 10")),
-                ("core", core, _apply_deload_sr("3 x 10")),
-            ]
-        else:
-            # D = deadlift lower day
-            lower = _pick_named_or_tags(names=["Deadlift", "Conventional Deadlift"], tags_any={"deadlift", "hinge"}, fallback_tags_any={"hinge"}, disallow_tags=disallow_squat)
-            accessory = _pick_named_or_tags(names=["Romanian Deadlift", "Hip Thrust", "Good Morning"], tags_any={"hinge"}, fallback_tags_any={"hinge"})
-            core = _pick_named_or_tags(names=["Plank", "Ab Wheel Rollout"], tags_any={"core"}, fallback_tags_any={"core"})
-            items_spec = [
-                ("main_lower", lower, _apply_deload_sr("4 x 4")),
-                ("accessory", accessory, _apply_deload_sr("3 x 8")),
-                ("core", core, _apply_deload_sr("3 x 45")),
-            ]
+    if use_strength_templates:
+        # Declarative program templates, resolved once per (program, library, preferences).
+        resolved = library.program(cycle_program, ctx)
+        items_spec = [
+            (kind, ex, _apply_deload_sr(sr)) for kind, ex, sr in resolved.get(slot) or resolved.get(program.default_slot, ())
+        ]
     else:
         # Default generator behavior (auto or manual per-slot picking).
         if slot == "C":
@@ -556,14 +670,14 @@ def generate_session(
                     f"{slot_key}_lower",
                     tags_any={"squat"},
                     fallback_tags_any={"leg"},
-                    disallow_tags=disallow_deadlift,
+                    disallow_tags=NO_DEADLIFT,
                 )
             else:
                 lower = _manual_or_pick(
                     f"{slot_key}_lower",
                     tags_any={"deadlift", "hinge"},
                     fallback_tags_any={"hinge"},
-                    disallow_tags=disallow_squat,
+                    disallow_tags=NO_SQUAT,
                 )
 
         push = _manual_or_pick(f"{slot_key}_push", tags_any={"bench", "push", "press"}, fallback_tags_any={"push"})
@@ -593,8 +707,9 @@ def generate_session(
             return 0.0
         return round(value / inc) * inc
 
+    family_max = {family: {"squat": max_sq, "deadlift": max_dl, "bench": max_bp}[key] for family, key in LIFT_FAMILY_MAX.items()}
+
     def _suggested_load(exercise_name: str, sets_reps: str, kind: str) -> float | None:
-        name = str(exercise_name or "").lower()
         if intensity == "easy":
             main_pct = 0.65
         elif intensity == "hard":
@@ -631,24 +746,11 @@ def generate_session(
             except Exception:  # noqa: BLE001
                 pass
         # Simple heuristics. In real life you'd track more lifts.
-        if "squat" in name:
-            base = max_sq
-            if "front squat" in name:
-                base = max_sq * 0.85
-            return _round_load(base * main_pct) if base else None
-        if "deadlift" in name:
-            base = max_dl
-            if "romanian" in name:
-                base = max_dl * 0.65
-            return _round_load(base * main_pct) if base else None
-        if "bench" in name:
-            base = max_bp
-            return _round_load(base * main_pct) if base else None
-        if "overhead press" in name or "press" == name:
-            # If no OHP 1RM exists, approximate from bench.
-            base = max_bp * 0.65 if max_bp else 0
-            return _round_load(base * main_pct) if base else None
-        return None
+        family = lift_family(str(exercise_name or ""))
+        if family is None:
+            return None
+        base = family_max[family[0]] * family[1]
+        return _round_load(base * main_pct) if base else None
 
     def _item(kind: str, exercise: str, sets_reps: str) -> dict[str, Any]:
         item: dict[str, Any] = {"type": kind, "exercise": exercise, "sets_reps": sets_reps}
@@ -704,47 +806,27 @@ def generate_session(
     workouts = [w for w in workouts if not (isinstance(w, dict) and str(w.get("date") or "") == session_date_iso)]
     workouts.append(workout)
     plan["workouts"] = workouts
-    plan["markdown"] = _render_markdown(week_number=week_number, week_start=week_start_day.isoformat(), plan=plan)
     return plan
 
 
-def recompute_workout_loads(
-    *,
-    profile: dict[str, Any],
-    workout: dict[str, Any],
-    cycle_cfg: dict[str, Any] | None,
-) -> dict[str, Any]:
-    """Recompute suggested loads for an existing workout.
-
-    Used when a user updates their 1RM maxes after workouts were generated.
-    We only update `suggested_load` (and `units`) and keep exercise selection,
-    sets/reps and ordering unchanged.
-    """
-    if not isinstance(workout, dict):
-        return workout
+def _workout_load_params(
+    profile: dict[str, Any], workout: dict[str, Any], cycle_cfg: dict[str, Any] | None
+) -> tuple[str, float, float, float, dict[str, float]]:
+    """(units, rounding increment, main pct, cycle factor, family -> 1RM) for one workout's loads."""
     units = str(profile.get("units") or "kg").lower()
     intensity = str(workout.get("intensity") or "normal").lower()
-    items = workout.get("items")
-    if not isinstance(items, list) or not items:
-        return workout
 
     maxes = profile.get("maxes") if isinstance(profile.get("maxes"), dict) else {}
     max_sq = float(maxes.get("squat") or 0)
     max_dl = float(maxes.get("deadlift") or 0)
     max_bp = float(maxes.get("bench") or 0)
+    family_max = {family: {"squat": max_sq, "deadlift": max_dl, "bench": max_bp}[key] for family, key in LIFT_FAMILY_MAX.items()}
 
-    def _round_load(value: float) -> float:
-        inc = 2.5 if units == "kg" else 5.0
-        if value <= 0:
-            return 0.0
-        return round(value / inc) * inc
-
-    def _main_pct_base() -> float:
-        if intensity == "easy":
-            return 0.65
-        if intensity == "hard":
-            return 0.80
-        return 0.75
+    main_pct = 0.75
+    if intensity == "easy":
+        main_pct = 0.65
+    elif intensity == "hard":
+        main_pct = 0.80
 
     cyw = workout.get("cycle") if isinstance(workout.get("cycle"), dict) else {}
     cy_enabled = bool(cyw.get("enabled")) if isinstance(cyw.get("enabled"), bool) else False
@@ -765,65 +847,130 @@ def recompute_workout_loads(
         except Exception:  # noqa: BLE001
             pass
 
-    def _factor_for_cycle() -> float:
-        if not cy_enabled:
-            return 1.0
-        if is_deload:
-            try:
-                f = 1.0 - (max(0.0, float(deload_pct)) / 100.0)
-                return max(0.80, min(1.25, f))
-            except Exception:  # noqa: BLE001
-                return 1.0
-        try:
-            up = float(step_pct) * float(min(2, max(0, int(week_index))))
-            f = 1.0 + (up / 100.0)
-            return max(0.80, min(1.25, f))
-        except Exception:  # noqa: BLE001
-            return 1.0
+    cycle_factor = 1.0
+    if cy_enabled and is_deload:
+        cycle_factor = max(0.80, min(1.25, 1.0 - (max(0.0, deload_pct) / 100.0)))
+    elif cy_enabled:
+        cycle_factor = max(0.80, min(1.25, 1.0 + (step_pct * float(min(2, max(0, week_index))) / 100.0)))
 
-    cycle_factor = _factor_for_cycle()
+    return units, 2.5 if units == "kg" else 5.0, main_pct, cycle_factor, family_max
 
-    def _suggested_load(exercise_name: str, kind: str) -> float | None:
-        name = str(exercise_name or "").lower()
-        main_pct = _main_pct_base()
-        if kind == "main_lower_light":
-            main_pct = main_pct * 0.92
-        main_pct = main_pct * cycle_factor
-
-        if "squat" in name:
-            base = max_sq
-            if "front squat" in name:
-                base = max_sq * 0.85
-            return _round_load(base * main_pct) if base else None
-        if "deadlift" in name:
-            base = max_dl
-            if "romanian" in name:
-                base = max_dl * 0.65
-            return _round_load(base * main_pct) if base else None
-        if "bench" in name:
-            base = max_bp
-            return _round_load(base * main_pct) if base else None
-        if "overhead press" in name or name == "press":
-            base = max_bp * 0.65 if max_bp else 0
-            return _round_load(base * main_pct) if base else None
-        return None
 
+def _round_loads(base: list[float], pct: list[float], factor: list[float], inc: list[float]) -> list[float]:
+    """Per row: `base * pct * factor` rounded to a multiple of `inc` (0.0 when not positive); needs NumPy."""
+    value = np.asarray(base, dtype=float) * (np.asarray(pct, dtype=float) * np.asarray(factor, dtype=float))
+    step = np.asarray(inc, dtype=float)
+    return np.where(value > 0, np.round(value / step) * step, 0.0).tolist()
+
+
+def _apply_loads(workout: dict[str, Any], units: str, targets: list[Any]) -> dict[str, Any]:
+    """Write per-item target loads (None = drop the load, False = leave the item as is) into a copy of `workout`."""
+    changed = False
     next_items: list[dict[str, Any]] = []
-    for it in items:
+    for it, load in zip(workout["items"], targets):
         if not isinstance(it, dict):
+            changed = True
             continue
-        ex = str(it.get("exercise") or "")
-        kind = str(it.get("type") or "")
-        nxt = dict(it)
-        load = _suggested_load(ex, kind)
-        if load is not None and load > 0:
-            nxt["suggested_load"] = load
-            nxt["units"] = units
+        if load is False:
+            next_items.append(it)
+            continue
+        if load is not None:
+            if it.get("suggested_load") == load and it.get("units") == units:
+                next_items.append(it)
+                continue
+            nxt = {**it, "suggested_load": load, "units": units}
         else:
+            if "suggested_load" not in it and "units" not in it:
+                next_items.append(it)
+                continue
+            nxt = dict(it)
             nxt.pop("suggested_load", None)
             nxt.pop("units", None)
+        changed = True
         next_items.append(nxt)
+    return {**workout, "items": next_items} if changed else workout
 
-    out = dict(workout)
-    out["items"] = next_items
-    return out
+
+def recompute_loads_bulk(
+    jobs: Iterable[tuple[dict[str, Any], dict[str, Any], dict[str, Any] | None]],
+    *,
+    families: Collection[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Recompute suggested loads for many workouts at once.
+
+    `jobs` are `(profile, workout, cycle_cfg)` triples (any mix of people and
+    weeks); the result lists the workouts in the same order. With NumPy
+    installed and at least `VECTOR_MIN_ITEMS` items, the inputs of every
+    max-derived item (base max, pct, cycle factor, rounding increment) are
+    gathered into columns and rounded in one vectorized pass; otherwise each
+    load is rounded as it is gathered. Semantics are those of
+    `recompute_workout_loads`.
+    """
+    jobs = list(jobs)
+    vectorize = np is not None and sum(
+        len(w["items"]) for _, w, _ in jobs if isinstance(w, dict) and isinstance(w.get("items"), list)
+    ) >= VECTOR_MIN_ITEMS
+    # Per workout: units and the target load per item (see `_apply_loads`).
+    pending: list[tuple[str, list[Any]] | None] = []
+    rows: list[tuple[list[Any], int]] = []
+    base: list[float] = []
+    pct: list[float] = []
+    factor: list[float] = []
+    inc: list[float] = []
+    for profile, workout, cycle_cfg in jobs:
+        items = workout.get("items") if isinstance(workout, dict) else None
+        if not isinstance(items, list) or not items:
+            pending.append(None)
+            continue
+        units, step, main_pct, cycle_factor, family_max = _workout_load_params(profile, workout, cycle_cfg)
+        targets: list[Any] = []
+        for it in items:
+            if not isinstance(it, dict):
+                targets.append(None)
+                continue
+            family = lift_family(str(it.get("exercise") or ""))
+            if families is not None and (family is None or family[0] not in families):
+                targets.append(False)
+                continue
+            item_base = family_max[family[0]] * family[1] if family is not None else 0.0
+            if not item_base:
+                targets.append(None)
+                continue
+            item_pct = main_pct * 0.92 if str(it.get("type") or "") == "main_lower_light" else main_pct
+            if vectorize:
+                rows.append((targets, len(targets)))
+                targets.append(None)
+                base.append(item_base)
+                pct.append(item_pct)
+                factor.append(cycle_factor)
+                inc.append(step)
+                continue
+            value = item_base * (item_pct * cycle_factor)
+            load = round(value / step) * step if value > 0 else 0.0
+            targets.append(load if load > 0 else None)
+        pending.append((units, targets))
+
+    if rows:
+        for (targets, i), load in zip(rows, _round_loads(base, pct, factor, inc)):
+            targets[i] = load if load > 0 else None
+
+    return [workout if entry is None else _apply_loads(workout, *entry) for (_, workout, _), entry in zip(jobs, pending)]
+
+
+def recompute_workout_loads(
+    *,
+    profile: dict[str, Any],
+    workout: dict[str, Any],
+    cycle_cfg: dict[str, Any] | None,
+    families: Collection[str] | None = None,
+) -> dict[str, Any]:
+    """Recompute suggested loads for an existing workout.
+
+    Used when a user updates their 1RM maxes after workouts were generated.
+    We only update `suggested_load` (and `units`) and keep exercise selection,
+    sets/reps and ordering unchanged. With `families` (see
+    `lift_families_for_maxes`) only items of those lift families are touched.
+    Unchanged items, and the workout itself when nothing changed, are returned
+    as the same objects. For many workouts use `recompute_loads_bulk`.
+    """
+    return recompute_loads_bulk([(profile, workout, cycle_cfg)], families=families)[0]
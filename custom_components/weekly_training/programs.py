@@ -0,0 +1,99 @@
+"""Cycle program templates, defined as data.
+
+A program is a slot rotation plus, per slot, the ordered items of a strength
+session. Each item lists exact exercise names to try first, then tags to pick
+by (and fallback tags). The planner resolves a program into concrete exercises
+once per (program, library, person preferences); see
+`CompiledLibrary.program`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+# No squat and deadlift in the same session.
+NO_DEADLIFT = frozenset({"deadlift", "hinge"})
+NO_SQUAT = frozenset({"squat"})
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateItem:
+    kind: str
+    names: tuple[str, ...]
+    tags: frozenset[str]
+    fallback_tags: frozenset[str]
+    sets_reps: str
+    disallow_tags: frozenset[str] = frozenset()
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ProgramTemplate:
+    # Slot order for the A/B/C-style rotation across training days.
+    rotation: tuple[str, ...]
+    slots: Mapping[str, tuple[TemplateItem, ...]]
+    # Template for a slot outside `slots` (e.g. the weekday-based fallback slot).
+    default_slot: str
+
+
+def _item(
+    kind: str,
+    names: tuple[str, ...],
+    tags: set[str],
+    fallback_tags: set[str],
+    sets_reps: str,
+    disallow_tags: frozenset[str] = frozenset(),
+) -> TemplateItem:
+    return TemplateItem(kind, names, frozenset(tags), frozenset(fallback_tags), sets_reps, disallow_tags)
+
+
+# Strength-ish full body templates (no squat+deadlift in same session; bench can pair).
+_FULL_BODY_SLOTS: dict[str, tuple[TemplateItem, ...]] = {
+    "A": (
+        _item("main_lower", ("Back Squat", "Squat"), {"squat"}, {"leg"}, "4 x 5", NO_DEADLIFT),
+        _item("main_push", ("Bench Press", "Barbell Bench Press"), {"bench", "press", "push"}, {"push"}, "4 x 5"),
+        _item("accessory", ("Barbell Row", "Bent-Over Row", "Row"), {"row"}, {"pull"}, "3 x 8"),
+        _item("core", ("Hanging Leg Raise", "Leg Raise"), {"core"}, {"core"}, "3 x 10"),
+    ),
+    "B": (
+        _item("main_lower", ("Deadlift", "Conventional Deadlift"), {"deadlift", "hinge"}, {"hinge"}, "4 x 4", NO_SQUAT),
+        _item("accessory", ("Dumbbell Shoulder Press", "DB Shoulder Press", "Overhead Press"), {"shoulders", "press", "push"}, {"shoulders"}, "3 x 10"),
+        _item("accessory_2", ("Pull-Up", "Pull-ups", "Pull Up", "Chin-Up"), {"pullup", "pull"}, {"pull"}, "3 x 6"),
+        _item("core", ("Plank",), {"core"}, {"core"}, "3 x 45"),
+    ),
+    # Prefer back squat (or pause squat). Never auto-pick front squat.
+    "C": (
+        # Light squat day: explicitly mark as light so loads come out lower.
+        _item("main_lower_light", ("Pause Squat", "Back Squat", "Squat"), {"squat"}, {"leg"}, "3 x 6", NO_DEADLIFT),
+        _item("main_push", ("Close-Grip Bench Press", "Close Grip Bench Press", "Close-Grip Bench", "Bench Press"), {"bench", "press", "push"}, {"push"}, "3 x 8"),
+        _item("accessory", ("Dumbbell Row", "DB Row", "Row"), {"row", "pull"}, {"pull"}, "3 x 10"),
+        _item("accessory_2", ("Hammer Curl", "Dumbbell Hammer Curl", "Curl"), {"arms"}, {"arms"}, "3 x 10"),
+        _item("core", ("Ab Wheel Rollout", "Ab Wheel", "Rollout"), {"core"}, {"core"}, "3 x 8"),
+    ),
+}
+
+# Upper/Lower 4-day templates. Lower days split squat (L) vs deadlift (D).
+_UPPER_LOWER_SLOTS: dict[str, tuple[TemplateItem, ...]] = {
+    "U": (
+        _item("main_push", ("Bench Press", "Barbell Bench Press"), {"bench", "push", "press"}, {"push"}, "4 x 5"),
+        _item("main_pull", ("Barbell Row", "Bent-Over Row", "Row"), {"row", "pull"}, {"pull"}, "4 x 6"),
+        _item("accessory", ("Dumbbell Shoulder Press", "DB Shoulder Press", "Overhead Press"), {"shoulders", "press"}, {"shoulders"}, "3 x 10"),
+        _item("core", ("Hanging Leg Raise", "Ab Wheel Rollout", "Plank"), {"core"}, {"core"}, "3 x 10"),
+    ),
+    "L": (
+        _item("main_lower", ("Back Squat", "Pause Squat", "Squat"), {"squat"}, {"leg"}, "4 x 5", NO_DEADLIFT),
+        _item("accessory", ("Bulgarian Split Squat", "Split Squat", "Lunge"), {"lunge", "single_leg"}, {"leg"}, "3 x 10"),
+        _item("core", ("Ab Wheel Rollout", "Hanging Leg Raise", "Plank"), {"core"}, {"core"}, "3 x 10"),
+    ),
+    "D": (
+        _item("main_lower", ("Deadlift", "Conventional Deadlift"), {"deadlift", "hinge"}, {"hinge"}, "4 x 4", NO_SQUAT),
+        _item("accessory", ("Romanian Deadlift", "Hip Thrust", "Good Morning"), {"hinge"}, {"hinge"}, "3 x 8"),
+        _item("core", ("Plank", "Ab Wheel Rollout"), {"core"}, {"core"}, "3 x 45"),
+    ),
+}
+
+PROGRAMS: dict[str, ProgramTemplate] = {
+    "full_body_abc": ProgramTemplate(rotation=("A", "B", "C"), slots=_FULL_BODY_SLOTS, default_slot="C"),
+    "full_body_2day": ProgramTemplate(rotation=("A", "B"), slots=_FULL_BODY_SLOTS, default_slot="C"),
+    "upper_lower_4day": ProgramTemplate(rotation=("U", "L", "U", "D"), slots=_UPPER_LOWER_SLOTS, default_slot="D"),
+}
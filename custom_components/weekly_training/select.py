@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -50,8 +50,6 @@ class ActivePersonSelect(SelectEntity):
         self._attr_unique_id = f"{entry.entry_id}_active_person"
         self._attr_device_info = device_info_from_entry(entry)
         self._unsub = None
-        self._options = []
-        self._value = None
 
     async def async_added_to_hass(self) -> None:
         self._unsub = async_dispatcher_connect(
@@ -59,7 +57,6 @@ class ActivePersonSelect(SelectEntity):
             f"{SIGNAL_PLAN_UPDATED}_{self._entry.entry_id}",
             self._handle_updated,
         )
-        await self._refresh_from_store()
 
     async def async_will_remove_from_hass(self) -> None:
         if self._unsub:
@@ -68,37 +65,20 @@ class ActivePersonSelect(SelectEntity):
 
     @property
     def options(self) -> list[str]:
-        return list(self._options)
+        return list(self._coordinator.entity_snapshot.person_names)
 
     @property
     def current_option(self) -> str | None:
-        return self._value
+        return self._coordinator.entity_snapshot.active_person_name
 
     async def async_select_option(self, option: str) -> None:
-        state = await self._coordinator.store.async_load()
-        people = state.get("people", []) if isinstance(state, dict) else []
-        person = next((p for p in people if isinstance(p, dict) and str(p.get("name") or "") == option), None)
-        if not isinstance(person, dict):
+        person_id = self._coordinator.entity_snapshot.person_ids_by_name.get(option)
+        if person_id is None:
             return
-        await self._coordinator.store.async_set_active_person(str(person.get("id") or ""))
-        await self._coordinator.async_request_refresh()
-        await self._refresh_from_store()
-        self.async_write_ha_state()
-
-    async def _refresh_from_store(self) -> None:
-        state = await self._coordinator.store.async_load()
-        people = state.get("people", []) if isinstance(state, dict) else []
-        names = [str(p.get("name") or "").strip() for p in people if isinstance(p, dict) and str(p.get("name") or "").strip()]
-        self._options = names
-        active_id = str(state.get("active_person_id") or "")
-        active = next((p for p in people if isinstance(p, dict) and str(p.get("id") or "") == active_id), None)
-        self._value = str(active.get("name") or "") if isinstance(active, dict) else (names[0] if names else None)
+        await self._coordinator.store.async_set_active_person(person_id)
 
+    @callback
     def _handle_updated(self) -> None:
-        self.hass.async_create_task(self._async_reload_and_write())
-
-    async def _async_reload_and_write(self) -> None:
-        await self._refresh_from_store()
         self.async_write_ha_state()
 
 
@@ -116,7 +96,6 @@ class PlanningModeSelect(SelectEntity):
         self._attr_unique_id = f"{entry.entry_id}_planning_mode"
         self._attr_device_info = device_info_from_entry(entry)
         self._unsub = None
-        self._value = "auto"
 
     @property
     def options(self) -> list[str]:
@@ -124,7 +103,7 @@ class PlanningModeSelect(SelectEntity):
 
     @property
     def current_option(self) -> str | None:
-        return self._value
+        return self._coordinator.entity_snapshot.planning_mode
 
     async def async_added_to_hass(self) -> None:
         self._unsub = async_dispatcher_connect(
@@ -132,7 +111,6 @@ class PlanningModeSelect(SelectEntity):
             f"{SIGNAL_PLAN_UPDATED}_{self._entry.entry_id}",
             self._handle_updated,
         )
-        await self._refresh_from_store()
 
     async def async_will_remove_from_hass(self) -> None:
         if self._unsub:
@@ -144,23 +122,9 @@ class PlanningModeSelect(SelectEntity):
         if option not in {"auto", "manual"}:
             option = "auto"
         await self._coordinator.store.async_set_overrides(planning_mode=option)
-        await self._coordinator.async_request_refresh()
-        await self._refresh_from_store()
-        self.async_write_ha_state()
-
-    async def _refresh_from_store(self) -> None:
-        state = await self._coordinator.store.async_load()
-        overrides = state.get("overrides", {}) if isinstance(state, dict) else {}
-        if isinstance(overrides, dict):
-            self._value = str(overrides.get("planning_mode") or "auto").lower()
-        else:
-            self._value = "auto"
 
+    @callback
     def _handle_updated(self) -> None:
-        self.hass.async_create_task(self._async_reload_and_write())
-
-    async def _async_reload_and_write(self) -> None:
-        await self._refresh_from_store()
         self.async_write_ha_state()
 
 
@@ -178,8 +142,6 @@ class SessionExerciseSelect(SelectEntity):
         self._attr_unique_id = f"{entry.entry_id}_{slot}"
         self._attr_device_info = device_info_from_entry(entry)
         self._unsub = None
-        self._value = "Auto"
-        self._options: list[str] = ["Auto"]
 
     @property
     def translation_key(self) -> str | None:
@@ -188,11 +150,11 @@ class SessionExerciseSelect(SelectEntity):
 
     @property
     def options(self) -> list[str]:
-        return list(self._options)
+        return list(self._coordinator.entity_snapshot.slot_options(self._slot))
 
     @property
     def current_option(self) -> str | None:
-        return self._value
+        return self._coordinator.entity_snapshot.slot_value(self._slot)
 
     async def async_added_to_hass(self) -> None:
         self._unsub = async_dispatcher_connect(
@@ -200,7 +162,6 @@ class SessionExerciseSelect(SelectEntity):
             f"{SIGNAL_PLAN_UPDATED}_{self._entry.entry_id}",
             self._handle_updated,
         )
-        await self._refresh()
 
     async def async_will_remove_from_hass(self) -> None:
         if self._unsub:
@@ -211,52 +172,7 @@ class SessionExerciseSelect(SelectEntity):
         option = str(option or "").strip()
         value = "" if option.lower() == "auto" else option
         await self._coordinator.store.async_set_overrides(session_overrides={self._slot: value})
-        await self._coordinator.async_request_refresh()
-        await self._refresh()
-        self.async_write_ha_state()
-
-    async def _refresh(self) -> None:
-        lib = await self._coordinator.library.async_load()
-        exercises = lib.get("exercises", [])
-        if not isinstance(exercises, list):
-            exercises = []
-
-        def tags(ex: dict) -> set[str]:
-            return {str(t).strip().lower() for t in (ex.get("tags") or []) if str(t).strip()}
-
-        wanted: set[str]
-        if self._slot.endswith("_lower"):
-            wanted = {"squat", "deadlift", "hinge", "lunge", "single_leg"}
-        elif self._slot.endswith("_push"):
-            wanted = {"bench", "push", "press", "overhead_press", "dumbbell_press"}
-        else:
-            wanted = {"row", "pull", "pullup", "lat"}
-
-        names: list[str] = []
-        for ex in exercises:
-            if not isinstance(ex, dict):
-                continue
-            ex_tags = tags(ex)
-            if ex_tags.isdisjoint(wanted):
-                continue
-            n = str(ex.get("name") or "").strip()
-            if n:
-                names.append(n)
-        names = sorted(set(names))
-        self._options = ["Auto", *names]
-
-        state = await self._coordinator.store.async_load()
-        overrides = state.get("overrides", {}) if isinstance(state, dict) else {}
-        session = overrides.get("session_overrides", {}) if isinstance(overrides, dict) else {}
-        if isinstance(session, dict):
-            v = str(session.get(self._slot) or "").strip()
-            self._value = v if v else "Auto"
-        else:
-            self._value = "Auto"
 
+    @callback
     def _handle_updated(self) -> None:
-        self.hass.async_create_task(self._async_reload_and_write())
-
-    async def _async_reload_and_write(self) -> None:
-        await self._refresh()
         self.async_write_ha_state()
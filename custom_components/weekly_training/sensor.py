@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+from datetime import date
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    CONF_PERSON_ENTITIES,
+    DEFAULT_PERSON_ENTITIES,
+    DOMAIN,
+)
 from .coordinator import WeeklyTrainingCoordinator
-from .entity import device_info_from_entry
+from .entity import PersonEntity, async_track_people, device_info_from_entry
 
 
 async def async_setup_entry(
@@ -22,6 +28,16 @@ async def async_setup_entry(
 ) -> None:
     coordinator: WeeklyTrainingCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities([WeeklyPlanSensor(entry, coordinator)])
+    if not entry.options.get(CONF_PERSON_ENTITIES, DEFAULT_PERSON_ENTITIES):
+        return
+
+    async_track_people(
+        hass,
+        entry,
+        lambda: coordinator.person_summaries,
+        async_add_entities,
+        lambda pid: [cls(entry, coordinator, pid) for cls in PERSON_SENSORS],
+    )
 
 
 class WeeklyPlanSensor(CoordinatorEntity[WeeklyTrainingCoordinator], SensorEntity):
@@ -31,6 +47,8 @@ class WeeklyPlanSensor(CoordinatorEntity[WeeklyTrainingCoordinator], SensorEntit
     _attr_name = "Weekly plan"
     _attr_icon = "mdi:dumbbell"
     _attr_translation_key = "weekly_plan"
+    # Timestamps change on every save; keep them out of the recorder.
+    _unrecorded_attributes = frozenset({"updated_at", "generated_at"})
 
     def __init__(self, entry: ConfigEntry, coordinator: WeeklyTrainingCoordinator) -> None:
         super().__init__(coordinator)
@@ -38,45 +56,135 @@ class WeeklyPlanSensor(CoordinatorEntity[WeeklyTrainingCoordinator], SensorEntit
         self._attr_unique_id = f"{entry.entry_id}_weekly_plan"
         self._attr_device_info = device_info_from_entry(entry)
 
+    def _active_week(self) -> tuple[dict[str, Any], str, str, dict[str, Any] | None]:
+        """(state, active person id, selected week start, that week's plan)."""
+        data = self.coordinator.data or {}
+        if not isinstance(data, dict):
+            return {}, "", "", None
+        overrides = data.get("overrides", {}) if isinstance(data.get("overrides"), dict) else {}
+        week_offset = int(overrides.get("week_offset") or 0)
+        week_start = self.coordinator._week_start_for_offset(week_offset).isoformat()  # noqa: SLF001
+        active_id = str(data.get("active_person_id") or "")
+        plans = data.get("plans", {}) if isinstance(data.get("plans"), dict) else {}
+        person_plans = plans.get(active_id) if active_id and isinstance(plans.get(active_id), dict) else {}
+        plan = person_plans.get(week_start) if isinstance(person_plans, dict) else None
+        return data, active_id, week_start, plan if isinstance(plan, dict) else None
+
     @property
     def native_value(self) -> str:
-        data = self.coordinator.data or {}
-        if isinstance(data, dict):
-            overrides = data.get("overrides", {}) if isinstance(data.get("overrides"), dict) else {}
-            week_offset = int(overrides.get("week_offset") or 0)
-            week_start = self.coordinator._week_start_for_offset(week_offset).isoformat()  # noqa: SLF001
-            active_id = str(data.get("active_person_id") or "")
-            plans = data.get("plans", {}) if isinstance(data.get("plans"), dict) else {}
-            person_plans = plans.get(active_id) if active_id and isinstance(plans.get(active_id), dict) else {}
-            plan = person_plans.get(week_start) if isinstance(person_plans, dict) else None
-            if isinstance(plan, dict) and plan.get("week_number") is not None:
-                return str(plan.get("week_number"))
+        _, _, _, plan = self._active_week()
+        if plan is not None and plan.get("week_number") is not None:
+            return str(plan.get("week_number"))
         return "not_generated"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        data = self.coordinator.data or {}
-        plan = None
-        person = None
-        if isinstance(data, dict):
-            active_id = str(data.get("active_person_id") or "")
-            overrides = data.get("overrides", {}) if isinstance(data.get("overrides"), dict) else {}
-            week_offset = int(overrides.get("week_offset") or 0)
-            week_start = self.coordinator._week_start_for_offset(week_offset).isoformat()  # noqa: SLF001
-            plans = data.get("plans", {}) if isinstance(data.get("plans"), dict) else {}
-            person_plans = plans.get(active_id) if active_id and isinstance(plans.get(active_id), dict) else {}
-            plan = person_plans.get(week_start) if isinstance(person_plans, dict) else None
-            people = data.get("people", []) if isinstance(data.get("people"), list) else []
-            person = next((p for p in people if isinstance(p, dict) and str(p.get("id") or "") == active_id), None)
+        """Compact summary; workouts and markdown come from get_plan/get_markdown or get_weekly_plan."""
+        data, active_id, week_start, plan = self._active_week()
+        people = data.get("people", []) if isinstance(data.get("people"), list) else []
+        person = next((p for p in people if isinstance(p, dict) and str(p.get("id") or "") == active_id), None)
         attrs: dict[str, Any] = {
             "entry_id": self._entry.entry_id,
             "updated_at": str(data.get("updated_at") or ""),
-            "person": person if isinstance(person, dict) else {},
+            "person_id": active_id,
+            "person_name": str(person.get("name") or "") if isinstance(person, dict) else "",
         }
-        if isinstance(plan, dict):
+        if plan is not None:
+            workouts = [w for w in plan.get("workouts", []) if isinstance(w, dict)] if isinstance(plan.get("workouts"), list) else []
+            completed = sum(1 for w in workouts if bool(w.get("completed")))
             attrs["week_number"] = plan.get("week_number")
-            attrs["week_start"] = plan.get("week_start")
+            attrs["week_start"] = plan.get("week_start") or week_start
             attrs["generated_at"] = plan.get("generated_at")
-            attrs["workouts"] = plan.get("workouts", [])
-            attrs["markdown"] = plan.get("markdown", "")
+            attrs["workout_count"] = len(workouts)
+            attrs["completed_count"] = completed
+            attrs["completion_ratio"] = round(completed / len(workouts), 2) if workouts else 0.0
+        summary = self.coordinator.person_summaries.get(active_id)
+        nxt = summary.next_session if summary is not None else None
+        attrs["next_session_date"] = nxt.date if nxt else None
+        attrs["next_session_name"] = nxt.name if nxt else None
+        attrs["next_session_exercises"] = nxt.exercises if nxt else 0
         return attrs
+
+
+class PersonSensor(PersonEntity, SensorEntity):
+    """One view of a person's summary (see `PersonEntity`)."""
+
+
+class PersonTodaySessionSensor(PersonSensor):
+    """Today's workout name, or `rest`."""
+
+    _key = "today_session"
+    _label = "today's session"
+    _attr_icon = "mdi:calendar-today"
+
+    @property
+    def native_value(self) -> str | None:
+        summary = self._summary
+        if summary is None:
+            return None
+        return (summary.today.name or "workout") if summary.today else "rest"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        today = self._summary.today if self._summary else None
+        return {
+            "person_id": self._person_id,
+            "date": today.date if today else None,
+            "week_start": today.week_start if today else None,
+            "exercises": today.exercises if today else 0,
+            "completed": today.completed if today else False,
+        }
+
+
+class PersonNextSessionSensor(PersonSensor):
+    """Date of the next not-completed workout."""
+
+    _key = "next_session"
+    _label = "next session"
+    _attr_icon = "mdi:calendar-arrow-right"
+    _attr_device_class = SensorDeviceClass.DATE
+
+    @property
+    def native_value(self) -> date | None:
+        nxt = self._summary.next_session if self._summary else None
+        return date.fromisoformat(nxt.date) if nxt else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        nxt = self._summary.next_session if self._summary else None
+        return {
+            "person_id": self._person_id,
+            "session_name": nxt.name if nxt else None,
+            "exercises": nxt.exercises if nxt else 0,
+        }
+
+
+class PersonWeekCompletionSensor(PersonSensor):
+    """Share of this week's workouts that are completed."""
+
+    _key = "week_completion"
+    _label = "week completion"
+    _attr_icon = "mdi:progress-check"
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self) -> float | None:
+        return self._summary.week_completion if self._summary else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        summary = self._summary
+        return {
+            "person_id": self._person_id,
+            "week_start": summary.week_start if summary else None,
+            "workout_count": summary.workout_count if summary else 0,
+            "completed_count": summary.completed_count if summary else 0,
+        }
+
+
+PERSON_SENSORS: tuple[type[PersonSensor], ...] = (
+    PersonTodaySessionSensor,
+    PersonNextSessionSensor,
+    PersonWeekCompletionSensor,
+)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import voluptuous as vol
-
 from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 
 from .const import DOMAIN
@@ -103,7 +102,6 @@ async def async_register(hass: HomeAssistant) -> None:
             },
         }
         state = await coordinator.store.async_upsert_person(person)
-        await coordinator.async_request_refresh()
         return {"ok": True, "entry_id": entry_id, "people": state.get("people", [])}
 
     async def _async_update_person(call: ServiceCall) -> ServiceResponse:
@@ -133,7 +131,6 @@ async def async_register(hass: HomeAssistant) -> None:
         updated["maxes"] = maxes
 
         next_state = await coordinator.store.async_upsert_person(updated)
-        await coordinator.async_request_refresh()
         return {"ok": True, "entry_id": entry_id, "people": next_state.get("people", [])}
 
     async def _async_delete_person(call: ServiceCall) -> ServiceResponse:
@@ -143,7 +140,6 @@ async def async_register(hass: HomeAssistant) -> None:
             return {"ok": False, "error": "entry_not_found"}
         person_id = str(call.data["person_id"]).strip()
         next_state = await coordinator.store.async_delete_person(person_id)
-        await coordinator.async_request_refresh()
         return {"ok": True, "entry_id": entry_id, "people": next_state.get("people", [])}
 
     if not hass.services.has_service(DOMAIN, SERVICE_GENERATE):
@@ -1,6 +1,6 @@
 """Storage for Weekly Training (.storage).
 
-State model (schema v1):
+State model (schema v2):
 - people: list of people profiles (gender, defaults, 1RM maxes, preferences)
 - active_person_id: which person the UI controls target by default
 - overrides: per-entry generation overrides (week offset/day + duration/preferred + planning mode + session picks)
@@ -8,20 +8,41 @@ State model (schema v1):
 - plans: mapping person_id -> mapping week_start -> plan payload
 - rev: monotonic revision for optimistic concurrency in the UI
 - history: archived previous weeks (read-only in UI, kept small)
+
+On disk the state is sharded: the core document (`weekly_training_<entry_id>`)
+holds everything except plans plus the list of plan shards, and each person's
+plans live in `weekly_training_<entry_id>_plans_<person_id>`. Saving one
+person's workout only rewrites the core and that person's shard. Schema v1
+(everything in one file) is migrated on first load.
+
+Snapshots are immutable and copy-on-write: `async_load` hands out the
+committed state without copying, and callers must treat it as read-only.
+Mutators edit a top-level copy and replace only the containers on the path
+they change (people list -> person, plans -> person -> week -> workout), so
+unchanged subtrees are shared between revs and can be compared by identity.
+
+Writes are write-behind: mutators update memory (and bump rev) right away and
+the document is flushed to disk once after a short quiet period. Unload and
+Home Assistant's final write force a flush.
 """
 
 from __future__ import annotations
 
-from datetime import UTC, date, datetime
-from datetime import timedelta
-from typing import Any
+import asyncio
+import hashlib
+import logging
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable, Collection, Iterable
+from contextlib import asynccontextmanager
+from datetime import UTC, date, datetime, timedelta
+from functools import partial, wraps
+from typing import Any, Concatenate, ParamSpec, TypeVar
 from uuid import uuid4
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
-from .planner import recompute_workout_loads
 from .const import (
     DEFAULT_DURATION_MINUTES,
     DEFAULT_EQUIPMENT,
@@ -33,8 +54,18 @@ from .const import (
     DEFAULT_UNITS,
     DOMAIN,
 )
+from .executor import EXECUTOR_MIN_LOAD_ITEMS, async_run_sized
+from .planner import LIFT_FAMILY_MAX, lift_families_for_maxes, recompute_loads_bulk
+from .programs import PROGRAMS
+from .workout_index import WorkoutIndex
+
+_LOGGER = logging.getLogger(__name__)
 
 _STORAGE_VERSION = 1
+_SCHEMA = 2
+# Write-behind: mutations update memory immediately and are flushed to disk
+# after this many seconds of quiet (bursts of taps coalesce into one write).
+_SAVE_DELAY = 2.0
 DEFAULT_CYCLE_PRESET = "strength"
 DEFAULT_CYCLE_PROGRAM = "full_body_abc"
 DEFAULT_CYCLE_STEP_PCT = 2.5
@@ -114,6 +145,34 @@ def _normalize_custom_exercise(ex: dict[str, Any]) -> dict[str, Any] | None:
     }
 
 
+def normalize_import_config(cfg: dict[str, Any]) -> dict[str, Any]:
+    """State keys to replace for an imported config: `people` and/or `exercise_config`.
+
+    Pure (safe to run in the executor): people are kept if they are dicts and
+    custom exercises are normalized as on load.
+    """
+    out: dict[str, Any] = {}
+    people = cfg.get("people")
+    if isinstance(people, list):
+        out["people"] = [p for p in people if isinstance(p, dict)]
+    ex_cfg = cfg.get("exercise_config")
+    if isinstance(ex_cfg, dict):
+        ex_cfg = dict(ex_cfg)
+        custom = ex_cfg.get("custom_exercises")
+        if isinstance(custom, list):
+            normalized = (_normalize_custom_exercise(ex) for ex in custom if isinstance(ex, dict))
+            ex_cfg["custom_exercises"] = [n for n in normalized if n]
+        out["exercise_config"] = ex_cfg
+    return out
+
+
+def import_config_size(cfg: dict[str, Any]) -> int:
+    people = cfg.get("people")
+    ex_cfg = cfg.get("exercise_config")
+    custom = ex_cfg.get("custom_exercises") if isinstance(ex_cfg, dict) else None
+    return (len(people) if isinstance(people, list) else 0) + (len(custom) if isinstance(custom, list) else 0)
+
+
 def _trim_history(items: list[dict[str, Any]], *, keep: int = 4) -> list[dict[str, Any]]:
     """Keep only the newest N archived weeks, based on week_start.
 
@@ -144,25 +203,25 @@ def _trim_history(items: list[dict[str, Any]], *, keep: int = 4) -> list[dict[st
     return out
 
 
-def _recompute_cycle_workout_loads_for_person(state: dict[str, Any], *, person: dict[str, Any]) -> bool:
-    """Update suggested loads for workouts in the active cycle window for this person."""
+def _cycle_window_positions(state: dict[str, Any], person: dict[str, Any], index: WorkoutIndex) -> list[tuple[str, int]]:
+    """(week_start, position) of this person's stored workouts inside their active cycle window."""
     cy = person.get("cycle")
     if not isinstance(cy, dict) or not bool(cy.get("enabled")):
-        return False
+        return []
     start_raw = str(cy.get("start_week_start") or "").strip()[:10]
     if not start_raw:
-        return False
+        return []
     try:
         start_ws = date.fromisoformat(start_raw)
     except Exception:  # noqa: BLE001
-        return False
+        return []
     try:
         weeks = max(1, min(12, int(cy.get("weeks") or 4)))
     except Exception:  # noqa: BLE001
         weeks = 4
     tdays = cy.get("training_weekdays")
     if not isinstance(tdays, list) or not tdays:
-        return False
+        return []
     training_weekdays: list[int] = []
     for x in tdays:
         try:
@@ -173,17 +232,14 @@ def _recompute_cycle_workout_loads_for_person(state: dict[str, Any], *, person:
             training_weekdays.append(xi)
     training_weekdays.sort()
     if not training_weekdays:
-        return False
+        return []
 
     plans = state.get("plans")
     if not isinstance(plans, dict):
-        return False
+        return []
     pid = str(person.get("id") or "").strip()
-    if not pid:
-        return False
-    person_plans = plans.get(pid)
-    if not isinstance(person_plans, dict):
-        return False
+    if not pid or not isinstance(plans.get(pid), dict):
+        return []
 
     target_dates: set[str] = set()
     for i in range(weeks):
@@ -191,34 +247,117 @@ def _recompute_cycle_workout_loads_for_person(state: dict[str, Any], *, person:
         for wd in training_weekdays:
             target_dates.add((wk + timedelta(days=int(wd))).isoformat())
 
-    changed = False
-    for wk_key, plan in list(person_plans.items()):
-        if not isinstance(plan, dict):
+    out = []
+    for d in sorted(target_dates):
+        loc = index.locate(plans, pid, d)
+        if loc is not None:
+            out.append(loc)
+    return out
+
+
+_LoadJob = tuple[dict[str, Any], dict[str, Any], dict[str, Any] | None]
+
+
+def _cycle_load_jobs(
+    state: dict[str, Any],
+    people: Iterable[dict[str, Any]],
+    index: WorkoutIndex,
+) -> tuple[list[tuple[str, str, int]], list[_LoadJob]]:
+    """(person_id, week_start, position) and the aligned `recompute_loads_bulk` job of every active-cycle workout."""
+    plans = state.get("plans")
+    where: list[tuple[str, str, int]] = []
+    jobs: list[_LoadJob] = []
+    for person in people:
+        positions = _cycle_window_positions(state, person, index)
+        if not positions:
             continue
-        workouts = plan.get("workouts")
-        if not isinstance(workouts, list) or not workouts:
+        pid = str(person.get("id") or "").strip()
+        for wk_key, i in positions:
+            w = plans[pid][wk_key]["workouts"][i]
+            if isinstance(w.get("cycle"), dict) and bool(w["cycle"].get("enabled")):
+                where.append((pid, wk_key, i))
+                jobs.append((person, w, person["cycle"]))
+    return where, jobs
+
+
+def _apply_cycle_loads(
+    state: dict[str, Any],
+    where: list[tuple[str, str, int]],
+    jobs: list[_LoadJob],
+    results: list[dict[str, Any]],
+) -> set[str]:
+    """Write recomputed workouts into `state` (copy-on-write); return the people changed."""
+    plans = state.get("plans")
+    # person_id -> week_start -> edited workouts list
+    edited: dict[str, dict[str, list[Any]]] = {}
+    for (pid, wk_key, i), (_, w, _), nxt in zip(where, jobs, results):
+        if nxt is w:
             continue
-        next_workouts: list[dict[str, Any]] = []
-        did = False
-        for w in workouts:
-            if not isinstance(w, dict):
-                continue
-            d = str(w.get("date") or "")
-            if d and d in target_dates and isinstance(w.get("cycle"), dict) and bool(w["cycle"].get("enabled")):
-                next_workouts.append(recompute_workout_loads(profile=person, workout=w, cycle_cfg=cy))
-                did = True
-            else:
-                next_workouts.append(w)
-        if did:
-            plan2 = dict(plan)
-            plan2["workouts"] = next_workouts
-            person_plans[wk_key] = plan2
-            changed = True
-
-    if changed:
-        plans[pid] = person_plans
-        state["plans"] = plans
-    return changed
+        weeks = edited.setdefault(pid, {})
+        if wk_key not in weeks:
+            weeks[wk_key] = list(plans[pid][wk_key]["workouts"])
+        weeks[wk_key][i] = nxt
+    for pid, weeks in edited.items():
+        draft = _draft_person_plans(state, pid)
+        for wk_key, workouts in weeks.items():
+            draft[wk_key] = {**draft[wk_key], "workouts": workouts}
+    return set(edited)
+
+
+def _load_job_items(jobs: list[_LoadJob]) -> int:
+    return sum(len(w.get("items") or ()) for _, w, _ in jobs)
+
+
+def _recompute_cycle_workout_loads(
+    state: dict[str, Any],
+    *,
+    people: Iterable[dict[str, Any]],
+    index: WorkoutIndex | None = None,
+    families: Collection[str] | None = None,
+) -> set[str]:
+    """Update suggested loads for workouts in each person's active cycle window; return the people changed.
+
+    All affected workouts (every person and week) go through one
+    `recompute_loads_bulk` call. `index` (the store's workout index) avoids
+    scanning every stored week; `families` limits the update to items of
+    those lift families.
+    """
+    where, jobs = _cycle_load_jobs(state, people, index if index is not None else WorkoutIndex())
+    if not jobs:
+        return set()
+    return _apply_cycle_loads(state, where, jobs, recompute_loads_bulk(jobs, families=families))
+
+
+def _recompute_cycle_workout_loads_for_person(
+    state: dict[str, Any],
+    *,
+    person: dict[str, Any],
+    index: WorkoutIndex | None = None,
+    families: Collection[str] | None = None,
+) -> bool:
+    """Update suggested loads for workouts in the active cycle window for this person."""
+    return bool(_recompute_cycle_workout_loads(state, people=(person,), index=index, families=families))
+
+
+def _draft_person_plans(state: dict[str, Any], person_id: str) -> dict[str, Any]:
+    """Copy-on-write: give the draft `state` its own `plans` and week dict for this person; return the latter to edit.
+
+    Call once per person and mutation: each call copies both containers again.
+    """
+    plans = state.get("plans")
+    plans = dict(plans) if isinstance(plans, dict) else {}
+    person_plans = plans.get(person_id)
+    person_plans = dict(person_plans) if isinstance(person_plans, dict) else {}
+    plans[person_id] = person_plans
+    state["plans"] = plans
+    return person_plans
+
+
+def _replace_person(state: dict[str, Any], person: dict[str, Any]) -> None:
+    """Copy-on-write: swap the person with the same id into a new `people` list on the draft `state`."""
+    pid = str(person.get("id") or "")
+    people = state.get("people") if isinstance(state.get("people"), list) else []
+    state["people"] = [person if isinstance(p, dict) and str(p.get("id") or "") == pid else p for p in people]
 
 
 def _new_person(
@@ -255,12 +394,63 @@ def _new_person(
     }
 
 
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+def _writer(
+    func: Callable[Concatenate[WeeklyTrainingStore, _P], Awaitable[_R]],
+) -> Callable[Concatenate[WeeklyTrainingStore, _P], Awaitable[_R]]:
+    """Run a store mutator under the entry's write lock (inside a transaction it joins it)."""
+
+    @wraps(func)
+    async def _wrapper(self: WeeklyTrainingStore, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+        async with self._async_writer():  # noqa: SLF001
+            return await func(self, *args, **kwargs)
+
+    return _wrapper
+
+
+def _state_changes(base: dict[str, Any], working: dict[str, Any]) -> tuple[bool, set[str]]:
+    """(anything changed, people whose plans changed) between two states.
+
+    Values shared with `base` (copy-on-write) are skipped by identity; only
+    replaced ones are compared.
+    """
+    base_plans = base.get("plans") if isinstance(base.get("plans"), dict) else {}
+    plans = working.get("plans") if isinstance(working.get("plans"), dict) else {}
+    touched = {
+        str(pid) for pid, p in plans.items() if pid not in base_plans or (base_plans[pid] is not p and base_plans[pid] != p)
+    }
+    if touched or set(plans) != set(base_plans):
+        return True, touched
+    keys = (set(base) | set(working)) - {"plans"}
+    return any(base.get(k) is not working.get(k) and base.get(k) != working.get(k) for k in keys), touched
+
+
 class WeeklyTrainingStore:
     """Per-config-entry storage wrapper."""
 
-    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
-        self._store: Store[dict[str, Any]] = Store(hass, _STORAGE_VERSION, f"{DOMAIN}_{entry_id}")
+    def __init__(self, hass: HomeAssistant, entry_id: str, *, save_delay: float = _SAVE_DELAY) -> None:
+        self._hass = hass
+        self._key = f"{DOMAIN}_{entry_id}"
+        self._store: Store[dict[str, Any]] = Store(hass, _STORAGE_VERSION, self._key)
         self._data: dict[str, Any] | None = None
+        # 0 disables write-behind (every save hits disk immediately).
+        self._save_delay = max(0.0, float(save_delay))
+        self._core_pending = False
+        # Per-person plan shards: person_id -> Store, plus which shards exist on disk.
+        self._shards: dict[str, Store[dict[str, Any]]] = {}
+        self._known_shards: set[str] = set()
+        self._shards_pending: set[str] = set()
+        self._listeners: list[Callable[[dict[str, Any], frozenset[str] | None], None]] = []
+        # (person_id, date) -> workout location; follows the plans it is queried with.
+        self.workout_index = WorkoutIndex()
+        # Writers are serialized per entry; the task holding the lock may re-enter.
+        self._write_lock = asyncio.Lock()
+        self._write_owner: asyncio.Task[Any] | None = None
+        # Working copy of the open transaction (only visible to the owning task).
+        self._txn: dict[str, Any] | None = None
 
     @staticmethod
     def _clamp_week_offset(value: Any) -> int:
@@ -271,11 +461,24 @@ class WeeklyTrainingStore:
         return max(-1, min(3, v))
 
     async def async_load(self) -> dict[str, Any]:
+        if self._in_transaction():
+            return self._txn
         if self._data is None:
             loaded = await self._store.async_load()
             self._data = loaded if isinstance(loaded, dict) else {}
 
-            self._data.setdefault("schema", 1)
+            # Schema v1 kept every plan in the core document; split it into shards below.
+            migrate_to_shards = "plans" in self._data and "plan_shards" not in self._data
+            if not migrate_to_shards:
+                shard_ids = self._data.pop("plan_shards", None)
+                self._data["plans"] = await self._async_load_shards(shard_ids if isinstance(shard_ids, list) else [])
+            # Markdown is rendered on demand now; drop copies persisted by older versions.
+            for person_plans in (self._data.get("plans") or {}).values():
+                for plan in person_plans.values() if isinstance(person_plans, dict) else ():
+                    if isinstance(plan, dict):
+                        plan.pop("markdown", None)
+
+            self._data.setdefault("schema", _SCHEMA)
             self._data.setdefault("rev", 1)
             self._data.setdefault("people", [])
             self._data.setdefault("active_person_id", "")
@@ -357,7 +560,8 @@ class WeeklyTrainingStore:
                 default_person = _new_person(name="You")
                 self._data["people"] = [default_person]
                 self._data["active_person_id"] = default_person["id"]
-                await self._store.async_save(self._data)
+                if not migrate_to_shards:
+                    await self._async_write(touched_people=())
 
             # Ensure active_person_id is valid.
             ids = {str(p.get("id") or "") for p in (self._data.get("people") or []) if isinstance(p, dict)}
@@ -406,12 +610,15 @@ class WeeklyTrainingStore:
                         if delta_weeks >= weeks:
                             p["cycle"] = None
                             changed = True
-                    if changed:
-                        await self._store.async_save(self._data)
+                    if changed and not migrate_to_shards:
+                        await self._async_write(touched_people=())
             except Exception:  # noqa: BLE001
                 pass
 
-        return dict(self._data)
+            if migrate_to_shards:
+                await self._async_migrate_to_shards()
+
+        return self._data
 
     def _assert_rev(self, state: dict[str, Any], expected_rev: int | None) -> None:
         if expected_rev is None:
@@ -420,6 +627,7 @@ class WeeklyTrainingStore:
         if int(expected_rev) != cur:
             raise ConflictError(expected=int(expected_rev), current=cur)
 
+    @_writer
     async def async_set_exercise_config(
         self,
         *,
@@ -427,11 +635,10 @@ class WeeklyTrainingStore:
         custom_exercises: list[dict[str, Any]] | None = None,
         expected_rev: int | None = None,
     ) -> dict[str, Any]:
-        state = await self.async_load()
+        state = await self._async_draft()
         self._assert_rev(state, expected_rev)
         cfg = state.get("exercise_config") if isinstance(state, dict) else None
-        if not isinstance(cfg, dict):
-            cfg = {"disabled_exercises": [], "custom_exercises": []}
+        cfg = dict(cfg) if isinstance(cfg, dict) else {"disabled_exercises": [], "custom_exercises": []}
 
         if disabled_exercises is not None:
             cleaned = []
@@ -460,19 +667,199 @@ class WeeklyTrainingStore:
             cfg["custom_exercises"] = normalized
 
         state["exercise_config"] = cfg
-        return await self.async_save(state)
+        return await self.async_save(state, touched_people=())
 
-    async def async_save(self, state: dict[str, Any]) -> dict[str, Any]:
+    async def async_save(
+        self, state: dict[str, Any], *, touched_people: Iterable[str] | None = None
+    ) -> dict[str, Any]:
+        """Commit state (bumps rev) and persist it.
+
+        `touched_people` names the people whose plans changed, so only their
+        shards are rewritten. None means "unknown": every shard is rewritten.
+        """
+        if self._in_transaction():
+            # Staged in the working copy; the transaction commits once on exit.
+            if state is not self._txn:
+                self._txn.clear()
+                self._txn.update(state or {})
+            return self._txn
+        touched = None if touched_people is None else frozenset(str(pid) for pid in touched_people)
         next_state = dict(state or {})
-        next_state["schema"] = 1
+        next_state["schema"] = _SCHEMA
         next_state["rev"] = int(next_state.get("rev") or 1) + 1
         next_state["updated_at"] = _now_iso()
         self._data = next_state
-        await self._store.async_save(self._data)
-        return dict(self._data)
+        self.workout_index.sync(next_state.get("plans"))
+        await self._async_write(touched_people=touched)
+        for listener in list(self._listeners):
+            try:
+                listener(self._data, touched)
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Weekly Training state listener failed")
+        return self._data
 
-    async def async_set_active_person(self, person_id: str, *, expected_rev: int | None = None) -> dict[str, Any]:
+    async def _async_draft(self) -> dict[str, Any]:
+        """Top-level copy of the snapshot for a mutator to edit (the working copy inside a transaction)."""
         state = await self.async_load()
+        return state if self._in_transaction() else dict(state)
+
+    def _in_transaction(self) -> bool:
+        return self._txn is not None and self._write_owner is asyncio.current_task()
+
+    @asynccontextmanager
+    async def _async_writer(self) -> AsyncIterator[None]:
+        """Hold the per-entry write lock (re-entrant for the owning task)."""
+        task = asyncio.current_task()
+        if self._write_owner is task:
+            yield
+            return
+        async with self._write_lock:
+            self._write_owner = task
+            try:
+                yield
+            finally:
+                self._write_owner = None
+
+    @asynccontextmanager
+    async def transaction(self, *, expected_rev: int | None = None) -> AsyncIterator[dict[str, Any]]:
+        """Apply several changes as one commit.
+
+            async with store.transaction(expected_rev=rev) as state:
+                state["history"] = []
+                await store.async_delete_week(week_start=...)
+
+        Writers are serialized by the entry's lock for the whole block. The
+        caller gets a private top-level copy of the snapshot: assign keys, and
+        replace (never mutate) nested values. Mutators called inside read and
+        stage into it (pass them `expected_rev=None`). On exit the changes are
+        committed with one rev bump, one write and one listener call (nothing
+        if nothing changed); on an exception they are discarded. Nested
+        transactions in the same task join the outer one.
+        """
+        async with self._async_writer():
+            if self._txn is not None:
+                self._assert_rev(self._txn, expected_rev)
+                yield self._txn
+                return
+            await self.async_load()
+            base = self._data or {}
+            self._assert_rev(base, expected_rev)
+            working = dict(base)
+            self._txn = working
+            try:
+                yield working
+            finally:
+                self._txn = None
+            changed, touched = _state_changes(base, working)
+            if changed:
+                await self.async_save(working, touched_people=touched)
+
+    @callback
+    def async_add_listener(
+        self, listener: Callable[[dict[str, Any], frozenset[str] | None], None]
+    ) -> Callable[[], None]:
+        """Call `listener(state, touched_people)` after every save. Returns an unsubscribe callable."""
+        self._listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _remove
+
+    def _shard_store(self, person_id: str) -> Store[dict[str, Any]]:
+        store = self._shards.get(person_id)
+        if store is None:
+            # Person ids end up in a file name; keep them filesystem-safe and unique.
+            safe = re.sub(r"[^A-Za-z0-9_-]", "_", person_id)
+            if safe != person_id:
+                safe = f"{safe}_{hashlib.sha1(person_id.encode()).hexdigest()[:8]}"
+            store = Store(self._hass, _STORAGE_VERSION, f"{self._key}_plans_{safe}")
+            self._shards[person_id] = store
+        return store
+
+    async def _async_load_shards(self, person_ids: list[Any]) -> dict[str, Any]:
+        ids = [str(pid) for pid in person_ids if str(pid or "")]
+        loaded = await asyncio.gather(*(self._shard_store(pid).async_load() for pid in ids))
+        plans: dict[str, Any] = {}
+        for pid, shard in zip(ids, loaded):
+            person_plans = shard.get("plans") if isinstance(shard, dict) else None
+            plans[pid] = person_plans if isinstance(person_plans, dict) else {}
+        self._known_shards = set(plans)
+        return plans
+
+    async def _async_migrate_to_shards(self) -> None:
+        """Split a schema v1 single-file document into core + per-person shards."""
+        plans = self._data.get("plans") if isinstance(self._data, dict) else None
+        if not isinstance(plans, dict):
+            plans = {}
+            self._data["plans"] = plans
+        self._data["schema"] = _SCHEMA
+        self._known_shards = {str(pid) for pid in plans}
+        # Shards first: if we stop half-way the v1 core document still has every plan.
+        for pid in self._known_shards:
+            await self._shard_store(pid).async_save(self._shard_to_save(pid))
+        self._core_pending = False
+        await self._store.async_save(self._core_to_save())
+
+    async def _async_write(self, *, touched_people: Iterable[str] | None = None) -> None:
+        """Persist core + touched shards (debounced unless write-behind is disabled)."""
+        plans = self._data.get("plans") if isinstance(self._data, dict) else None
+        current = {str(pid) for pid in plans} if isinstance(plans, dict) else set()
+        removed = self._known_shards - current
+        if touched_people is None:
+            touched = set(current)
+        else:
+            touched = {str(pid) for pid in touched_people} & current
+        # New people always get their shard written (the core lists it).
+        touched |= current - self._known_shards
+        self._known_shards = current
+
+        for pid in removed:
+            self._shards_pending.discard(pid)
+            await self._shard_store(pid).async_remove()
+            self._shards.pop(pid, None)
+
+        if self._save_delay <= 0:
+            for pid in touched:
+                await self._shard_store(pid).async_save(self._shard_to_save(pid))
+            await self._store.async_save(self._core_to_save())
+            return
+        # Store.async_delay_save also flushes on Home Assistant's final write at shutdown.
+        for pid in touched:
+            self._shards_pending.add(pid)
+            self._shard_store(pid).async_delay_save(partial(self._shard_to_save, pid), self._save_delay)
+        self._core_pending = True
+        self._store.async_delay_save(self._core_to_save, self._save_delay)
+
+    @callback
+    def _core_to_save(self) -> dict[str, Any]:
+        self._core_pending = False
+        core = {k: v for k, v in (self._data or {}).items() if k != "plans"}
+        core["plan_shards"] = sorted(self._known_shards)
+        return core
+
+    @callback
+    def _shard_to_save(self, person_id: str) -> dict[str, Any]:
+        self._shards_pending.discard(person_id)
+        plans = (self._data or {}).get("plans")
+        person_plans = plans.get(person_id) if isinstance(plans, dict) else None
+        return {"person_id": person_id, "plans": person_plans if isinstance(person_plans, dict) else {}}
+
+    async def async_flush(self) -> None:
+        """Write any pending (debounced) changes now. Used on unload."""
+        if self._data is None:
+            return
+        # A direct save cancels the pending delayed write.
+        for pid in list(self._shards_pending):
+            await self._shard_store(pid).async_save(self._shard_to_save(pid))
+        if self._core_pending:
+            await self._store.async_save(self._core_to_save())
+
+    @_writer
+    async def async_set_active_person(self, person_id: str, *, expected_rev: int | None = None) -> dict[str, Any]:
+        state = await self._async_draft()
         self._assert_rev(state, expected_rev)
         people = state.get("people") if isinstance(state, dict) else []
         ids = {str(p.get("id") or "") for p in (people or []) if isinstance(p, dict)}
@@ -525,8 +912,9 @@ class WeeklyTrainingStore:
                     "c_pull": "",
                 },
             }
-        return await self.async_save(state)
+        return await self.async_save(state, touched_people=())
 
+    @_writer
     async def async_set_overrides(
         self,
         *,
@@ -541,10 +929,12 @@ class WeeklyTrainingStore:
         cycle: dict[str, Any] | None = None,
         expected_rev: int | None = None,
     ) -> dict[str, Any]:
-        state = await self.async_load()
+        state = await self._async_draft()
         self._assert_rev(state, expected_rev)
         overrides = state.get("overrides") if isinstance(state, dict) else None
-        if not isinstance(overrides, dict):
+        if isinstance(overrides, dict):
+            overrides = dict(overrides)
+        else:
             overrides = {
                 "week_offset": 0,
                 "selected_weekday": None,
@@ -578,8 +968,7 @@ class WeeklyTrainingStore:
             overrides["intensity"] = str(intensity or "normal").lower()
         if progression is not None:
             cur = overrides.get("progression")
-            if not isinstance(cur, dict):
-                cur = {}
+            cur = dict(cur) if isinstance(cur, dict) else {}
             if isinstance(progression.get("enabled"), bool):
                 cur["enabled"] = bool(progression.get("enabled"))
             if progression.get("step_pct") is not None:
@@ -594,15 +983,14 @@ class WeeklyTrainingStore:
             overrides["progression"] = cur
         if cycle is not None:
             cur = overrides.get("cycle")
-            if not isinstance(cur, dict):
-                cur = {}
+            cur = dict(cur) if isinstance(cur, dict) else {}
             if isinstance(cycle.get("enabled"), bool):
                 cur["enabled"] = bool(cycle.get("enabled"))
             preset = str(cycle.get("preset") or "").strip().lower()
             if preset in {"strength", "hypertrophy", "minimalist"}:
                 cur["preset"] = preset
             program = str(cycle.get("program") or "").strip().lower()
-            if program in {"full_body_abc", "full_body_2day", "upper_lower_4day"}:
+            if program in PROGRAMS:
                 cur["program"] = program
             if cycle.get("start_week_start") is not None:
                 cur["start_week_start"] = str(cycle.get("start_week_start") or "").strip()
@@ -663,21 +1051,20 @@ class WeeklyTrainingStore:
             overrides["cycle"] = cur
         if session_overrides is not None:
             current = overrides.get("session_overrides")
-            if not isinstance(current, dict):
-                current = {}
+            current = dict(current) if isinstance(current, dict) else {}
             # Merge known keys only
             for key, value in session_overrides.items():
                 current[str(key)] = str(value or "")
             overrides["session_overrides"] = current
         state["overrides"] = overrides
-        return await self.async_save(state)
+        return await self.async_save(state, touched_people=())
 
+    @_writer
     async def async_upsert_person(self, person: dict[str, Any], *, expected_rev: int | None = None) -> dict[str, Any]:
-        state = await self.async_load()
+        state = await self._async_draft()
         self._assert_rev(state, expected_rev)
         people = state.get("people")
-        if not isinstance(people, list):
-            people = []
+        people = list(people) if isinstance(people, list) else []
 
         incoming_id = str(person.get("id") or "").strip()
         if not incoming_id:
@@ -715,11 +1102,11 @@ class WeeklyTrainingStore:
             "deadlift": int(maxes.get("deadlift") or DEFAULT_MAX_DL),
             "bench": int(maxes.get("bench") or DEFAULT_MAX_BP),
         }
-        maxes_changed = (
-            int(prev_maxes.get("squat") or 0) != int(normalized["maxes"].get("squat") or 0)
-            or int(prev_maxes.get("deadlift") or 0) != int(normalized["maxes"].get("deadlift") or 0)
-            or int(prev_maxes.get("bench") or 0) != int(normalized["maxes"].get("bench") or 0)
-        )
+        # Only the lift families whose max changed need their loads recomputed; a unit switch changes them all.
+        changed_families = lift_families_for_maxes(prev_maxes, normalized["maxes"])
+        if isinstance(existing, dict) and str(existing.get("units") or DEFAULT_UNITS).lower() != normalized["units"]:
+            changed_families = frozenset(LIFT_FAMILY_MAX)
+        loads_changed = bool(changed_families)
         normalized["updated_at"] = now
         normalized.setdefault("created_at", now)
 
@@ -735,16 +1122,23 @@ class WeeklyTrainingStore:
         state["people"] = people
         if not state.get("active_person_id"):
             state["active_person_id"] = incoming_id
-        # If user updated 1RM maxes, recompute suggested loads for workouts in the active cycle window.
-        if maxes_changed:
+        # If user updated 1RM maxes or units, recompute suggested loads for workouts in the active cycle window.
+        if loads_changed:
             try:
-                _recompute_cycle_workout_loads_for_person(state, person=normalized)
+                # Collect and apply on the loop; the pure bulk recompute runs in the executor when large.
+                where, jobs = _cycle_load_jobs(state, (normalized,), self.workout_index)
+                if jobs:
+                    results = await async_run_sized(
+                        self._hass, _load_job_items(jobs), EXECUTOR_MIN_LOAD_ITEMS, recompute_loads_bulk, jobs, families=changed_families
+                    )
+                    _apply_cycle_loads(state, where, jobs, results)
             except Exception:  # noqa: BLE001
                 pass
-        return await self.async_save(state)
+        return await self.async_save(state, touched_people=(incoming_id,) if loads_changed else ())
 
+    @_writer
     async def async_delete_person(self, person_id: str, *, expected_rev: int | None = None) -> dict[str, Any]:
-        state = await self.async_load()
+        state = await self._async_draft()
         self._assert_rev(state, expected_rev)
         people = state.get("people")
         if not isinstance(people, list):
@@ -752,13 +1146,13 @@ class WeeklyTrainingStore:
         people = [p for p in people if not (isinstance(p, dict) and str(p.get("id") or "") == person_id)]
         state["people"] = people
         plans = state.get("plans")
-        if isinstance(plans, dict):
-            plans.pop(person_id, None)
-            state["plans"] = plans
+        if isinstance(plans, dict) and person_id in plans:
+            state["plans"] = {pid: pp for pid, pp in plans.items() if pid != person_id}
         if state.get("active_person_id") == person_id:
             state["active_person_id"] = str(people[0].get("id")) if people else ""
-        return await self.async_save(state)
+        return await self.async_save(state, touched_people=())
 
+    @_writer
     async def async_set_person_cycle(
         self,
         *,
@@ -767,7 +1161,7 @@ class WeeklyTrainingStore:
         expected_rev: int | None = None,
     ) -> dict[str, Any]:
         """Set or clear the per-person 4-week cycle config."""
-        state = await self.async_load()
+        state = await self._async_draft()
         self._assert_rev(state, expected_rev)
         people = state.get("people")
         if not isinstance(people, list):
@@ -842,64 +1236,55 @@ class WeeklyTrainingStore:
                 cur["deload_volume"] = DEFAULT_CYCLE_DELOAD_VOL
             next_cycle = cur if bool(cur.get("enabled")) else None
 
-        changed = False
-        for p in people:
-            if not isinstance(p, dict):
-                continue
-            if str(p.get("id") or "") != pid:
-                continue
-            if next_cycle is None:
-                if p.get("cycle") is not None:
-                    p["cycle"] = None
-                    changed = True
-            else:
-                p["cycle"] = next_cycle
-                changed = True
-            break
-        if not changed:
+        person = next((p for p in people if isinstance(p, dict) and str(p.get("id") or "") == pid), None)
+        if person is None or (next_cycle is None and person.get("cycle") is None):
             return state
-        state["people"] = people
-        return await self.async_save(state)
+        _replace_person(state, {**person, "cycle": next_cycle})
+        return await self.async_save(state, touched_people=())
 
     async def async_save_plan(
         self, *, person_id: str, week_start: str, plan: dict[str, Any], expected_rev: int | None = None
     ) -> dict[str, Any]:
-        state = await self.async_load()
+        return await self.async_save_plans(person_id=person_id, plans={str(week_start): plan}, expected_rev=expected_rev)
+
+    @_writer
+    async def async_save_plans(
+        self, *, person_id: str, plans: dict[str, dict[str, Any]], expected_rev: int | None = None
+    ) -> dict[str, Any]:
+        """Store several week plans for one person with a single save."""
+        state = await self._async_draft()
         self._assert_rev(state, expected_rev)
-        plans = state.get("plans")
-        if not isinstance(plans, dict):
-            plans = {}
-        person_plans = plans.get(str(person_id))
-        if not isinstance(person_plans, dict):
-            person_plans = {}
-        person_plans[str(week_start)] = dict(plan or {})
-        plans[str(person_id)] = person_plans
-        state["plans"] = plans
-        return await self.async_save(state)
+        person_plans = _draft_person_plans(state, str(person_id))
+        for week_start, plan in plans.items():
+            # Markdown is a derived view (see ws_state.MarkdownCache), never stored.
+            person_plans[str(week_start)] = {k: v for k, v in (plan or {}).items() if k != "markdown"}
+        return await self.async_save(state, touched_people=(str(person_id),))
 
+    @_writer
     async def async_delete_week(self, *, week_start: str, expected_rev: int | None = None) -> dict[str, Any]:
         """Delete a week plan for all people (blank canvas on new week)."""
-        state = await self.async_load()
+        state = await self._async_draft()
         self._assert_rev(state, expected_rev)
         plans = state.get("plans")
         if not isinstance(plans, dict):
             return state
-        changed = False
-        for pid, person_plans in list(plans.items()):
+        touched: list[str] = []
+        next_plans = dict(plans)
+        for pid, person_plans in plans.items():
             if not isinstance(person_plans, dict):
                 continue
             if str(week_start) in person_plans:
-                person_plans.pop(str(week_start), None)
-                plans[str(pid)] = person_plans
-                changed = True
-        if changed:
-            state["plans"] = plans
-            return await self.async_save(state)
+                next_plans[pid] = {wk: plan for wk, plan in person_plans.items() if wk != str(week_start)}
+                touched.append(str(pid))
+        if touched:
+            state["plans"] = next_plans
+            return await self.async_save(state, touched_people=touched)
         return state
 
+    @_writer
     async def async_archive_week(self, *, week_start: str, keep_weeks: int = 4) -> dict[str, Any]:
         """Archive completed workouts for a week into history (read-only)."""
-        state = await self.async_load()
+        state = await self._async_draft()
         plans = state.get("plans")
         if not isinstance(plans, dict):
             return state
@@ -938,67 +1323,48 @@ class WeeklyTrainingStore:
             return state
 
         history = state.get("history")
-        if not isinstance(history, list):
-            history = []
+        history = list(history) if isinstance(history, list) else []
         history.append({"week_start": str(week_start), "archived_at": _now_iso(), "completed": completed})
         state["history"] = _trim_history(history, keep=int(keep_weeks))
-        return await self.async_save(state)
+        return await self.async_save(state, touched_people=())
 
     def get_history(self, state: dict[str, Any]) -> list[dict[str, Any]]:
         history = state.get("history") if isinstance(state, dict) else None
         return history if isinstance(history, list) else []
 
+    @_writer
     async def async_set_workout_completed(
         self, *, person_id: str, week_start: str, date_iso: str, completed: bool, expected_rev: int | None = None
     ) -> dict[str, Any]:
         """Toggle completed flag on a workout by date."""
-        state = await self.async_load()
+        state = await self._async_draft()
         self._assert_rev(state, expected_rev)
-        plan = self.get_plan(state, person_id=str(person_id), week_start=str(week_start))
-        if not isinstance(plan, dict):
-            return state
-        workouts = plan.get("workouts")
-        if not isinstance(workouts, list):
-            return state
-        target = str(date_iso or "").strip()
-        if not target:
-            return state
-        changed = False
-        for w in workouts:
-            if not isinstance(w, dict):
-                continue
-            if str(w.get("date") or "") != target:
-                continue
-            w["completed"] = bool(completed)
-            w["completed_at"] = _now_iso() if completed else None
-            changed = True
-            break
-        if not changed:
+        found = self._find_workout(state, str(person_id), str(date_iso or "").strip(), week_start=str(week_start))
+        if found is None:
             return state
-        plan["workouts"] = workouts
+        _, idx, plan = found
+        workouts = list(plan["workouts"])
+        workouts[idx] = {**workouts[idx], "completed": bool(completed), "completed_at": _now_iso() if completed else None}
+        plan = {**plan, "workouts": workouts}
         return await self.async_save_plan(person_id=str(person_id), week_start=str(week_start), plan=plan)
 
+    @_writer
     async def async_delete_workout(
         self, *, person_id: str, week_start: str, date_iso: str, expected_rev: int | None = None
     ) -> dict[str, Any]:
         """Delete a workout by date."""
-        state = await self.async_load()
+        state = await self._async_draft()
         self._assert_rev(state, expected_rev)
-        plan = self.get_plan(state, person_id=str(person_id), week_start=str(week_start))
-        if not isinstance(plan, dict):
-            return state
-        workouts = plan.get("workouts")
-        if not isinstance(workouts, list):
+        found = self._find_workout(state, str(person_id), str(date_iso or "").strip(), week_start=str(week_start))
+        if found is None:
             return state
-        target = str(date_iso or "").strip()
-        if not target:
-            return state
-        next_workouts = [w for w in workouts if not (isinstance(w, dict) and str(w.get("date") or "") == target)]
-        if len(next_workouts) == len(workouts):
-            return state
-        plan["workouts"] = next_workouts
+        _, idx, plan = found
+        workouts = list(plan["workouts"])
+        del workouts[idx]
+        plan = {**plan, "workouts": workouts}
         return await self.async_save_plan(person_id=str(person_id), week_start=str(week_start), plan=plan)
 
+    @_writer
     async def async_delete_workout_series(
         self,
         *,
@@ -1012,7 +1378,7 @@ class WeeklyTrainingStore:
 
         Used for 4-week cycles: delete a whole "series" of planned sessions.
         """
-        state = await self.async_load()
+        state = await self._async_draft()
         self._assert_rev(state, expected_rev)
 
         pid = str(person_id or "").strip()
@@ -1025,36 +1391,10 @@ class WeeklyTrainingStore:
         wd = max(0, min(6, int(weekday)))
         n = max(1, min(12, int(weeks or 4)))
 
-        plans = state.get("plans")
-        if not isinstance(plans, dict):
-            return state
-        person_plans = plans.get(pid)
-        if not isinstance(person_plans, dict):
-            return state
-
-        changed = False
-        for i in range(n):
-            week_start_day = start_ws + timedelta(days=i * 7)
-            wk_key = week_start_day.isoformat()
-            plan = person_plans.get(wk_key)
-            if not isinstance(plan, dict):
-                continue
-            workouts = plan.get("workouts")
-            if not isinstance(workouts, list) or not workouts:
-                continue
-            target_date = (week_start_day + timedelta(days=wd)).isoformat()
-            next_workouts = [w for w in workouts if not (isinstance(w, dict) and str(w.get("date") or "") == target_date)]
-            if len(next_workouts) != len(workouts):
-                plan = dict(plan)
-                plan["workouts"] = next_workouts
-                person_plans[wk_key] = plan
-                changed = True
-
-        if not changed:
+        targets = [(start_ws + timedelta(days=i * 7 + wd)).isoformat() for i in range(n)]
+        if not self._delete_workouts_on(state, pid, targets):
             return state
-        plans[pid] = person_plans
-        state["plans"] = plans
-        return await self.async_save(state)
+        return await self.async_save(state, touched_people=(pid,))
 
     async def async_delete_cycle(self, *, person_id: str, expected_rev: int | None = None) -> dict[str, Any]:
         """Delete the entire active cycle for a person.
@@ -1063,42 +1403,32 @@ class WeeklyTrainingStore:
         - all workouts in the cycle window (all planned weekdays across N weeks)
         - the per-person cycle config itself (which removes Planned markers)
         """
-        state = await self.async_load()
-        self._assert_rev(state, expected_rev)
-
-        pid = str(person_id or "").strip()
-        if not pid:
-            return state
-
-        people = state.get("people")
-        if not isinstance(people, list):
-            return state
-        person = next((p for p in people if isinstance(p, dict) and str(p.get("id") or "") == pid), None)
-        if not isinstance(person, dict):
-            return state
-
-        cy = person.get("cycle")
-        if not isinstance(cy, dict) or not bool(cy.get("enabled")):
-            # Still clear any stray cycle field to guarantee reset.
-            if person.get("cycle") is not None:
-                person["cycle"] = None
-                return await self.async_save(state)
-            return state
-
-        start_raw = str(cy.get("start_week_start") or "").strip()[:10]
+        async with self.transaction(expected_rev=expected_rev) as state:
+            pid = str(person_id or "").strip()
+            people = state.get("people") if pid else None
+            person = next((p for p in people if isinstance(p, dict) and str(p.get("id") or "") == pid), None) if isinstance(people, list) else None
+            cy = person.get("cycle") if isinstance(person, dict) else None
+            if isinstance(cy, dict) and bool(cy.get("enabled")):
+                self._delete_cycle_workouts(state, person_id=pid, cycle=cy)
+            if isinstance(person, dict) and person.get("cycle") is not None:
+                # Clear cycle config (removes Planned markers); also clears a stray disabled cycle.
+                _replace_person(state, {**person, "cycle": None})
+        return await self.async_load()
+
+    def _delete_cycle_workouts(self, state: dict[str, Any], *, person_id: str, cycle: dict[str, Any]) -> None:
+        """Drop the person's workouts on the cycle's training weekdays across its weeks."""
+        start_raw = str(cycle.get("start_week_start") or "").strip()[:10]
         if not start_raw:
-            person["cycle"] = None
-            return await self.async_save(state)
+            return
         try:
             start_ws = date.fromisoformat(start_raw)
         except Exception:  # noqa: BLE001
-            person["cycle"] = None
-            return await self.async_save(state)
+            return
         try:
-            weeks = max(1, min(12, int(cy.get("weeks") or 4)))
+            weeks = max(1, min(12, int(cycle.get("weeks") or 4)))
         except Exception:  # noqa: BLE001
             weeks = 4
-        tdays = cy.get("training_weekdays")
+        tdays = cycle.get("training_weekdays")
         training_weekdays: list[int] = []
         if isinstance(tdays, list):
             for x in tdays:
@@ -1108,43 +1438,37 @@ class WeeklyTrainingStore:
                     continue
                 if 0 <= xi <= 6 and xi not in training_weekdays:
                     training_weekdays.append(xi)
-        training_weekdays.sort()
+        targets = [(start_ws + timedelta(days=i * 7 + wd)).isoformat() for i in range(weeks) for wd in training_weekdays]
+        self._delete_workouts_on(state, person_id, targets)
 
+    def _find_workout(
+        self, state: dict[str, Any], person_id: str, date_iso: str, *, week_start: str | None = None
+    ) -> tuple[str, int, dict[str, Any]] | None:
+        """Locate a person's workout by date via the index: (week_start, position, week plan) or None."""
         plans = state.get("plans")
-        if not isinstance(plans, dict):
-            plans = {}
-        person_plans = plans.get(pid)
-        if not isinstance(person_plans, dict):
-            person_plans = {}
-
-        changed = False
-        if training_weekdays:
-            for i in range(weeks):
-                week_start_day = start_ws + timedelta(days=i * 7)
-                wk_key = week_start_day.isoformat()
-                plan = person_plans.get(wk_key)
-                if not isinstance(plan, dict):
-                    continue
-                workouts = plan.get("workouts")
-                if not isinstance(workouts, list) or not workouts:
-                    continue
-                targets = {(week_start_day + timedelta(days=wd)).isoformat() for wd in training_weekdays}
-                next_workouts = [w for w in workouts if not (isinstance(w, dict) and str(w.get("date") or "") in targets)]
-                if len(next_workouts) != len(workouts):
-                    plan2 = dict(plan)
-                    plan2["workouts"] = next_workouts
-                    person_plans[wk_key] = plan2
-                    changed = True
-
-        # Clear cycle config (removes Planned markers).
-        person["cycle"] = None
-        changed = True
-
-        plans[pid] = person_plans
-        state["plans"] = plans
-        state["people"] = people
-        return await self.async_save(state)
-
+        loc = self.workout_index.locate(plans, person_id, date_iso) if date_iso else None
+        if loc is None or (week_start is not None and loc[0] != week_start):
+            return None
+        return loc[0], loc[1], plans[person_id][loc[0]]
+
+    def _delete_workouts_on(self, state: dict[str, Any], person_id: str, dates: Iterable[str]) -> bool:
+        """Remove the person's workouts on these dates (copy-on-write). Returns True if any was removed."""
+        by_week: dict[str, list[int]] = {}
+        for d in dates:
+            loc = self.workout_index.locate(state.get("plans"), person_id, d)
+            if loc is not None:
+                by_week.setdefault(loc[0], []).append(loc[1])
+        if not by_week:
+            return False
+        person_plans = state["plans"][person_id]
+        draft = _draft_person_plans(state, person_id)
+        for week, positions in by_week.items():
+            plan = person_plans[week]
+            drop = set(positions)
+            draft[week] = {**plan, "workouts": [w for i, w in enumerate(plan["workouts"]) if i not in drop]}
+        return True
+
+    @_writer
     async def async_upsert_workout(
         self,
         *,
@@ -1154,20 +1478,22 @@ class WeeklyTrainingStore:
         expected_rev: int | None = None,
     ) -> dict[str, Any]:
         """Insert or replace a workout (used for undo restore/import)."""
-        state = await self.async_load()
+        state = await self._async_draft()
         self._assert_rev(state, expected_rev)
         plan = self.get_plan(state, person_id=str(person_id), week_start=str(week_start)) or {}
         if not isinstance(plan, dict):
             plan = {}
         workouts = plan.get("workouts")
-        if not isinstance(workouts, list):
-            workouts = []
+        workouts = list(workouts) if isinstance(workouts, list) else []
         date_iso = str((workout or {}).get("date") or "").strip()
         if not date_iso:
             return state
-        workouts = [w for w in workouts if not (isinstance(w, dict) and str(w.get("date") or "") == date_iso)]
+        found = self._find_workout(state, str(person_id), date_iso, week_start=str(week_start))
+        if found is not None:
+            # Replacing moves the workout to the end (same as a fresh insert).
+            del workouts[found[1]]
         workouts.append(dict(workout or {}))
-        plan["workouts"] = workouts
+        plan = {**plan, "workouts": workouts}
         return await self.async_save_plan(person_id=str(person_id), week_start=str(week_start), plan=plan)
 
     def get_plan(self, state: dict[str, Any], *, person_id: str, week_start: str) -> dict[str, Any] | None:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from homeassistant.components.text import TextEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -36,7 +36,6 @@ class PreferredExercisesText(TextEntity):
         self._attr_unique_id = f"{entry.entry_id}_preferred_exercises"
         self._attr_device_info = device_info_from_entry(entry)
         self._unsub = None
-        self._value = ""
 
     async def async_added_to_hass(self) -> None:
         self._unsub = async_dispatcher_connect(
@@ -44,7 +43,6 @@ class PreferredExercisesText(TextEntity):
             f"{SIGNAL_PLAN_UPDATED}_{self._entry.entry_id}",
             self._handle_updated,
         )
-        await self._refresh_from_store()
 
     async def async_will_remove_from_hass(self) -> None:
         if self._unsub:
@@ -53,26 +51,11 @@ class PreferredExercisesText(TextEntity):
 
     @property
     def native_value(self) -> str | None:
-        return str(self._value or "")
+        return self._coordinator.entity_snapshot.preferred_exercises
 
     async def async_set_value(self, value: str) -> None:
         await self._coordinator.store.async_set_overrides(preferred_exercises=str(value or ""))
-        await self._coordinator.async_request_refresh()
-        await self._refresh_from_store()
-        self.async_write_ha_state()
-
-    async def _refresh_from_store(self) -> None:
-        state = await self._coordinator.store.async_load()
-        overrides = state.get("overrides", {}) if isinstance(state, dict) else {}
-        if isinstance(overrides, dict):
-            self._value = str(overrides.get("preferred_exercises") or "")
-        else:
-            self._value = ""
 
+    @callback
     def _handle_updated(self) -> None:
-        self.hass.async_create_task(self._async_reload_and_write())
-
-    async def _async_reload_and_write(self) -> None:
-        await self._refresh_from_store()
         self.async_write_ha_state()
-
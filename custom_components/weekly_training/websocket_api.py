@@ -2,20 +2,21 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
 from typing import Any
 
 import voluptuous as vol
-
 from homeassistant.components import websocket_api
-from homeassistant.core import HomeAssistant
-from datetime import timedelta
-
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_ENTRY_UNLOADED
+from .executor import EXECUTOR_MIN_IMPORT_ITEMS, async_run_sized
+from .storage import ConflictError, import_config_size, normalize_import_config
 from .version import BACKEND_VERSION
 from .ws_state import public_state
-from .storage import ConflictError
 
 
 def _runtime_payload() -> dict[str, Any]:
@@ -39,6 +40,7 @@ def _runtime_payload() -> dict[str, Any]:
     {
         vol.Required("type"): "weekly_training/get_library",
         vol.Required("entry_id"): str,
+        vol.Optional("if_hash"): str,
     }
 )
 @websocket_api.async_response
@@ -53,42 +55,12 @@ async def ws_get_library(
         connection.send_error(msg["id"], "entry_not_found", f"No entry found for entry_id={entry_id}")
         return
     state = await coordinator.store.async_load()
-    cfg = state.get("exercise_config") if isinstance(state, dict) else {}
-    if not isinstance(cfg, dict):
-        cfg = {}
-
-    lib = await coordinator.library.async_load()
-    exercises = lib.get("exercises", [])
-    if not isinstance(exercises, list):
-        exercises = []
-    custom = cfg.get("custom_exercises", [])
-    if isinstance(custom, list):
-        exercises = [*exercises, *[e for e in custom if isinstance(e, dict)]]
-
-    # Payload: enough for UI grouping + future-proofing.
-    payload = []
-    for ex in exercises:
-        if not isinstance(ex, dict):
-            continue
-        ex_id = str(ex.get("id") or "").strip()
-        name = str(ex.get("name") or "").strip()
-        if not name:
-            continue
-        group = ex.get("group")
-        tags = ex.get("tags") if isinstance(ex.get("tags"), list) else []
-        equipment = ex.get("equipment") if isinstance(ex.get("equipment"), list) else []
-        payload.append(
-            {
-                **({"id": ex_id} if ex_id else {}),
-                "name": name,
-                **({"group": str(group)} if group else {}),
-                "tags": [str(t).strip().lower() for t in tags if str(t).strip()],
-                "equipment": [str(t).strip().lower() for t in equipment if str(t).strip()],
-            }
-        )
-
-    payload.sort(key=lambda e: str(e.get("name") or "").lower())
-    connection.send_result(msg["id"], {"entry_id": entry_id, "exercises": payload})
+    view = await coordinator.library.async_view(state.get("exercise_config") if isinstance(state, dict) else None)
+    # The payload is built once per library version; clients revalidate with its hash.
+    if msg.get("if_hash") and msg["if_hash"] == view.payload_hash:
+        connection.send_result(msg["id"], {"entry_id": entry_id, "not_modified": True, "hash": view.payload_hash})
+        return
+    connection.send_result(msg["id"], {"entry_id": entry_id, "exercises": view.payload, "hash": view.payload_hash})
 
 
 @websocket_api.websocket_command({vol.Required("type"): "weekly_training/list_entries"})
@@ -103,10 +75,52 @@ async def ws_list_entries(
     connection.send_result(msg["id"], {"entries": payload})
 
 
+# Optional plan filters accepted by get_state / get_plan.
+_PLAN_SCOPE_SCHEMA = {
+    vol.Optional("person_id"): str,
+    vol.Optional("week_from"): str,
+    vol.Optional("week_to"): str,
+}
+
+
+def _plan_scope(msg: dict[str, Any]) -> dict[str, str]:
+    """Parse person_id/week_from/week_to; week bounds snap to their Monday. Raises ValueError."""
+    scope: dict[str, str] = {}
+    if msg.get("person_id"):
+        scope["person_id"] = str(msg["person_id"])
+    for key in ("week_from", "week_to"):
+        raw = str(msg.get(key) or "").strip()
+        if not raw:
+            continue
+        try:
+            day = date.fromisoformat(raw[:10])
+        except ValueError as err:
+            raise ValueError(f"{key} must be an ISO date (YYYY-MM-DD)") from err
+        scope[key] = (day - timedelta(days=day.weekday())).isoformat()
+    return scope
+
+
+def _mutation_result(coordinator: Any, entry_id: str, state: dict[str, Any], msg: dict[str, Any]) -> dict[str, Any]:
+    """Result payload for mutating commands.
+
+    Clients that send `response: "delta"` together with `expected_rev` get
+    JSON-patch style ops relative to that rev (`{entry_id, delta}`). Everyone
+    else, or when the base rev is too old, gets the full `{entry_id, state}`.
+    """
+    runtime = _runtime_payload()
+    if msg.get("response") == "delta":
+        delta = coordinator.deltas.delta(state, base_rev=msg.get("expected_rev"), runtime=runtime)
+        if delta is not None:
+            return {"entry_id": entry_id, "delta": delta}
+    return {"entry_id": entry_id, "state": public_state(state, runtime=runtime)}
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "weekly_training/get_state",
         vol.Required("entry_id"): str,
+        vol.Optional("if_rev"): vol.Coerce(int),
+        **_PLAN_SCOPE_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -121,16 +135,111 @@ async def ws_get_state(
         connection.send_error(msg["id"], "entry_not_found", f"No entry found for entry_id={entry_id}")
         return
     state = await coordinator.store.async_load()
-    connection.send_result(
-        msg["id"],
-        {
-            "entry_id": entry_id,
-            "state": public_state(
-                state,
-                runtime=_runtime_payload(),
-            ),
-        },
-    )
+    try:
+        result = _state_result(coordinator, entry_id, state, msg)
+    except ValueError as e:
+        connection.send_error(msg["id"], "invalid", str(e))
+        return
+    connection.send_result(msg["id"], result)
+
+
+def _state_result(coordinator: Any, entry_id: str, state: dict[str, Any], msg: dict[str, Any]) -> dict[str, Any]:
+    """get_state payload. Raises ValueError for an invalid scope.
+
+    `if_rev` only short-circuits unscoped queries: a matching rev says nothing
+    about whether the client ever received a particular slice.
+    """
+    scope = _plan_scope(msg)
+    if not scope:
+        rev = int(state.get("rev") or 1)
+        if msg.get("if_rev") is not None and int(msg["if_rev"]) == rev:
+            # Client already has this rev: skip serializing the state.
+            return {"entry_id": entry_id, "not_modified": True, "rev": rev}
+        return {"entry_id": entry_id, "state": public_state(state, runtime=_runtime_payload())}
+    # Scoped query: only the requested slice of plans is serialized.
+    plans = coordinator.plan_index.select(state.get("plans"), **scope)
+    return {
+        "entry_id": entry_id,
+        "scope": scope,
+        "state": public_state(state, runtime=_runtime_payload(), plans=plans),
+    }
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "weekly_training/subscribe",
+        vol.Required("entry_id"): str,
+    }
+)
+@websocket_api.async_response
+async def ws_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Push state changes for an entry.
+
+    Events: one `{"type": "snapshot", "rev", "state"}` right after subscribing,
+    then `{"type": "change", "base_rev", "rev", "ops"}` after every store save
+    (a new snapshot if the change cannot be expressed as a delta). When the
+    entry is unloaded (or reloaded) the stream ends with
+    `{"type": "closed", "reason": "entry_unloaded"}`; subscribe again.
+    Unsubscribe with the standard `unsubscribe_events` command.
+    """
+    entry_id = msg["entry_id"]
+    coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+    if coordinator is None:
+        connection.send_error(msg["id"], "entry_not_found", f"No entry found for entry_id={entry_id}")
+        return
+    state = await coordinator.store.async_load()
+    last_rev = int(state.get("rev") or 1)
+
+    @callback
+    def _on_saved(state: dict[str, Any], touched_people: frozenset[str] | None) -> None:
+        nonlocal last_rev
+        event = _change_event(coordinator, state, last_rev)
+        if event is None:
+            return
+        last_rev = int(event["rev"])
+        connection.send_message(websocket_api.event_message(msg["id"], event))
+
+    unsubs: list[Callable[[], None]] = []
+
+    @callback
+    def _unsubscribe() -> None:
+        # Runs on unload and again on `unsubscribe_events`; only the first call removes anything.
+        while unsubs:
+            unsubs.pop()()
+
+    @callback
+    def _on_unloaded() -> None:
+        _unsubscribe()
+        closed = {"type": "closed", "reason": "entry_unloaded"}
+        connection.send_message(websocket_api.event_message(msg["id"], closed))
+
+    unsubs.append(coordinator.store.async_add_listener(_on_saved))
+    unsubs.append(async_dispatcher_connect(hass, f"{SIGNAL_ENTRY_UNLOADED}_{entry_id}", _on_unloaded))
+    connection.subscriptions[msg["id"]] = _unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(websocket_api.event_message(msg["id"], _snapshot_event(state)))
+
+
+def _snapshot_event(state: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "type": "snapshot",
+        "rev": int(state.get("rev") or 1),
+        "state": public_state(state, runtime=_runtime_payload()),
+    }
+
+
+def _change_event(coordinator: Any, state: dict[str, Any], base_rev: int) -> dict[str, Any] | None:
+    """Subscription event for a save after `base_rev` (None if the rev did not move)."""
+    if int(state.get("rev") or 1) == base_rev:
+        return None
+    delta = coordinator.deltas.delta(state, base_rev=base_rev, runtime=_runtime_payload())
+    if delta is None:
+        return _snapshot_event(state)
+    return {"type": "change", **delta}
 
 
 @websocket_api.websocket_command(
@@ -142,6 +251,7 @@ async def ws_get_state(
         vol.Required("date"): str,
         vol.Required("completed"): bool,
         vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("response"): vol.In(["state", "delta"]),
     }
 )
 @websocket_api.async_response
@@ -166,8 +276,7 @@ async def ws_set_workout_completed(
     except ConflictError as e:
         connection.send_error(msg["id"], "conflict", str(e))
         return
-    await coordinator.async_request_refresh()
-    connection.send_result(msg["id"], {"entry_id": entry_id, "state": public_state(state, runtime=_runtime_payload())})
+    connection.send_result(msg["id"], _mutation_result(coordinator, entry_id, state, msg))
 
 
 @websocket_api.websocket_command(
@@ -178,6 +287,7 @@ async def ws_set_workout_completed(
         vol.Required("week_start"): str,
         vol.Required("date"): str,
         vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("response"): vol.In(["state", "delta"]),
     }
 )
 @websocket_api.async_response
@@ -201,8 +311,7 @@ async def ws_delete_workout(
     except ConflictError as e:
         connection.send_error(msg["id"], "conflict", str(e))
         return
-    await coordinator.async_request_refresh()
-    connection.send_result(msg["id"], {"entry_id": entry_id, "state": public_state(state, runtime=_runtime_payload())})
+    connection.send_result(msg["id"], _mutation_result(coordinator, entry_id, state, msg))
 
 
 @websocket_api.websocket_command(
@@ -214,6 +323,7 @@ async def ws_delete_workout(
         vol.Required("weekday"): vol.Coerce(int),
         vol.Optional("weeks"): vol.Coerce(int),
         vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("response"): vol.In(["state", "delta"]),
     }
 )
 @websocket_api.async_response
@@ -238,8 +348,7 @@ async def ws_delete_workout_series(
     except ConflictError as e:
         connection.send_error(msg["id"], "conflict", str(e))
         return
-    await coordinator.async_request_refresh()
-    connection.send_result(msg["id"], {"entry_id": entry_id, "state": public_state(state, runtime=_runtime_payload())})
+    connection.send_result(msg["id"], _mutation_result(coordinator, entry_id, state, msg))
 
 
 @websocket_api.websocket_command(
@@ -248,6 +357,7 @@ async def ws_delete_workout_series(
         vol.Required("entry_id"): str,
         vol.Required("person_id"): str,
         vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("response"): vol.In(["state", "delta"]),
     }
 )
 @websocket_api.async_response
@@ -270,8 +380,7 @@ async def ws_delete_cycle(
     except ConflictError as e:
         connection.send_error(msg["id"], "conflict", str(e))
         return
-    await coordinator.async_request_refresh()
-    connection.send_result(msg["id"], {"entry_id": entry_id, "state": public_state(state, runtime=_runtime_payload())})
+    connection.send_result(msg["id"], _mutation_result(coordinator, entry_id, state, msg))
 
 
 @websocket_api.websocket_command(
@@ -280,6 +389,7 @@ async def ws_delete_cycle(
         vol.Required("entry_id"): str,
         vol.Required("person_id"): str,
         vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("response"): vol.In(["state", "delta"]),
     }
 )
 @websocket_api.async_response
@@ -298,8 +408,57 @@ async def ws_set_active_person(
     except ConflictError as e:
         connection.send_error(msg["id"], "conflict", str(e))
         return
-    await coordinator.async_request_refresh()
-    connection.send_result(msg["id"], {"entry_id": entry_id, "state": public_state(state, runtime=_runtime_payload())})
+    connection.send_result(msg["id"], _mutation_result(coordinator, entry_id, state, msg))
+
+
+async def _async_apply_overrides(coordinator: Any, raw: Any, *, expected_rev: int | None) -> dict[str, Any]:
+    """set_overrides: overrides and/or exercise_config. Raises ConflictError."""
+    if not isinstance(raw, dict):
+        raw = {}
+    has_override_fields = any(
+        k in raw
+        for k in (
+            "week_offset",
+            "selected_weekday",
+            "duration_minutes",
+            "preferred_exercises",
+            "planning_mode",
+            "intensity",
+            "progression",
+            "cycle",
+            "session_overrides",
+        )
+    )
+    cfg = raw.get("exercise_config") if isinstance(raw.get("exercise_config"), dict) else None
+
+    # If this is only an exercise config update, avoid bumping rev twice (and avoid conflicts).
+    if not has_override_fields and cfg is not None:
+        return await coordinator.store.async_set_exercise_config(
+            disabled_exercises=cfg.get("disabled_exercises") if isinstance(cfg.get("disabled_exercises"), list) else None,
+            custom_exercises=cfg.get("custom_exercises") if isinstance(cfg.get("custom_exercises"), list) else None,
+            expected_rev=expected_rev,
+        )
+    state = await coordinator.store.async_set_overrides(
+        week_offset=raw.get("week_offset"),
+        selected_weekday=raw.get("selected_weekday"),
+        duration_minutes=raw.get("duration_minutes"),
+        preferred_exercises=raw.get("preferred_exercises"),
+        planning_mode=raw.get("planning_mode"),
+        intensity=raw.get("intensity"),
+        progression=raw.get("progression") if isinstance(raw.get("progression"), dict) else None,
+        cycle=raw.get("cycle") if isinstance(raw.get("cycle"), dict) else None,
+        session_overrides=raw.get("session_overrides") if isinstance(raw.get("session_overrides"), dict) else None,
+        expected_rev=expected_rev,
+    )
+    # Optional: exercise config updates piggybacked here (UI convenience).
+    if cfg is not None:
+        # Do not re-check expected_rev after we have already saved overrides.
+        state = await coordinator.store.async_set_exercise_config(
+            disabled_exercises=cfg.get("disabled_exercises") if isinstance(cfg.get("disabled_exercises"), list) else None,
+            custom_exercises=cfg.get("custom_exercises") if isinstance(cfg.get("custom_exercises"), list) else None,
+            expected_rev=None,
+        )
+    return state
 
 
 @websocket_api.websocket_command(
@@ -308,6 +467,7 @@ async def ws_set_active_person(
         vol.Required("entry_id"): str,
         vol.Required("overrides"): dict,
         vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("response"): vol.In(["state", "delta"]),
     }
 )
 @websocket_api.async_response
@@ -321,69 +481,12 @@ async def ws_set_overrides(
     if coordinator is None:
         connection.send_error(msg["id"], "entry_not_found", f"No entry found for entry_id={entry_id}")
         return
-    raw = msg.get("overrides") or {}
-    if not isinstance(raw, dict):
-        raw = {}
-    expected_rev = msg.get("expected_rev")
-    has_override_fields = any(
-        k in raw
-        for k in (
-            "week_offset",
-            "selected_weekday",
-            "duration_minutes",
-            "preferred_exercises",
-            "planning_mode",
-            "intensity",
-            "progression",
-            "cycle",
-            "session_overrides",
-        )
-    )
-
-    # If this is only an exercise config update, avoid bumping rev twice (and avoid conflicts).
-    if not has_override_fields and "exercise_config" in raw and isinstance(raw.get("exercise_config"), dict):
-        cfg = raw.get("exercise_config") or {}
-        try:
-            state = await coordinator.store.async_set_exercise_config(
-                disabled_exercises=cfg.get("disabled_exercises") if isinstance(cfg.get("disabled_exercises"), list) else None,
-                custom_exercises=cfg.get("custom_exercises") if isinstance(cfg.get("custom_exercises"), list) else None,
-                expected_rev=expected_rev,
-            )
-        except ConflictError as e:
-            connection.send_error(msg["id"], "conflict", str(e))
-            return
-    else:
-        try:
-            state = await coordinator.store.async_set_overrides(
-                week_offset=raw.get("week_offset"),
-                selected_weekday=raw.get("selected_weekday"),
-                duration_minutes=raw.get("duration_minutes"),
-                preferred_exercises=raw.get("preferred_exercises"),
-                planning_mode=raw.get("planning_mode"),
-                intensity=raw.get("intensity"),
-                progression=raw.get("progression") if isinstance(raw.get("progression"), dict) else None,
-                cycle=raw.get("cycle") if isinstance(raw.get("cycle"), dict) else None,
-                session_overrides=raw.get("session_overrides") if isinstance(raw.get("session_overrides"), dict) else None,
-                expected_rev=expected_rev,
-            )
-        except ConflictError as e:
-            connection.send_error(msg["id"], "conflict", str(e))
-            return
-        # Optional: exercise config updates piggybacked here (UI convenience).
-        if "exercise_config" in raw and isinstance(raw.get("exercise_config"), dict):
-            cfg = raw.get("exercise_config") or {}
-            try:
-                # Do not re-check expected_rev after we have already saved overrides.
-                state = await coordinator.store.async_set_exercise_config(
-                    disabled_exercises=cfg.get("disabled_exercises") if isinstance(cfg.get("disabled_exercises"), list) else None,
-                    custom_exercises=cfg.get("custom_exercises") if isinstance(cfg.get("custom_exercises"), list) else None,
-                    expected_rev=None,
-                )
-            except ConflictError as e:
-                connection.send_error(msg["id"], "conflict", str(e))
-                return
-    await coordinator.async_request_refresh()
-    connection.send_result(msg["id"], {"entry_id": entry_id, "state": public_state(state, runtime=_runtime_payload())})
+    try:
+        state = await _async_apply_overrides(coordinator, msg.get("overrides"), expected_rev=msg.get("expected_rev"))
+    except ConflictError as e:
+        connection.send_error(msg["id"], "conflict", str(e))
+        return
+    connection.send_result(msg["id"], _mutation_result(coordinator, entry_id, state, msg))
 
 
 @websocket_api.websocket_command(
@@ -392,6 +495,7 @@ async def ws_set_overrides(
         vol.Required("entry_id"): str,
         vol.Required("person"): dict,
         vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("response"): vol.In(["state", "delta"]),
     }
 )
 @websocket_api.async_response
@@ -413,8 +517,7 @@ async def ws_add_person(
     except ConflictError as e:
         connection.send_error(msg["id"], "conflict", str(e))
         return
-    await coordinator.async_request_refresh()
-    connection.send_result(msg["id"], {"entry_id": entry_id, "state": public_state(state, runtime=_runtime_payload())})
+    connection.send_result(msg["id"], _mutation_result(coordinator, entry_id, state, msg))
 
 
 @websocket_api.websocket_command(
@@ -423,6 +526,7 @@ async def ws_add_person(
         vol.Required("entry_id"): str,
         vol.Required("person_id"): str,
         vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("response"): vol.In(["state", "delta"]),
     }
 )
 @websocket_api.async_response
@@ -441,8 +545,7 @@ async def ws_delete_person(
     except ConflictError as e:
         connection.send_error(msg["id"], "conflict", str(e))
         return
-    await coordinator.async_request_refresh()
-    connection.send_result(msg["id"], {"entry_id": entry_id, "state": public_state(state, runtime=_runtime_payload())})
+    connection.send_result(msg["id"], _mutation_result(coordinator, entry_id, state, msg))
 
 
 @websocket_api.websocket_command(
@@ -452,6 +555,7 @@ async def ws_delete_person(
         vol.Required("person_id"): str,
         vol.Optional("cycle"): dict,
         vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("response"): vol.In(["state", "delta"]),
     }
 )
 @websocket_api.async_response
@@ -477,14 +581,14 @@ async def ws_set_person_cycle(
     except ConflictError as e:
         connection.send_error(msg["id"], "conflict", str(e))
         return
-    await coordinator.async_request_refresh()
-    connection.send_result(msg["id"], {"entry_id": entry_id, "state": public_state(state, runtime=_runtime_payload())})
+    connection.send_result(msg["id"], _mutation_result(coordinator, entry_id, state, msg))
 
 
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "weekly_training/get_plan",
         vol.Required("entry_id"): str,
+        **_PLAN_SCOPE_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -498,77 +602,110 @@ async def ws_get_plan(
     if coordinator is None:
         connection.send_error(msg["id"], "entry_not_found", f"No entry found for entry_id={entry_id}")
         return
+    try:
+        scope = _plan_scope(msg)
+    except ValueError as e:
+        connection.send_error(msg["id"], "invalid", str(e))
+        return
     state = await coordinator.store.async_load()
     overrides = state.get("overrides", {}) if isinstance(state, dict) else {}
-    active_id = str(state.get("active_person_id") or "")
+    active_id = scope.get("person_id") or str(state.get("active_person_id") or "")
     week_offset = int(overrides.get("week_offset") or 0) if isinstance(overrides, dict) else 0
     week_start_day = coordinator._week_start_for_offset(week_offset).isoformat()  # noqa: SLF001
     plan = coordinator.store.get_plan(state, person_id=active_id, week_start=week_start_day) if active_id else None
-    connection.send_result(msg["id"], {"entry_id": entry_id, "week_start": week_start_day, "plan": plan or {}})
+    result: dict[str, Any] = {"entry_id": entry_id, "week_start": week_start_day, "plan": plan or {}}
+    if "week_from" in scope or "week_to" in scope:
+        # Week range: every stored week of that person within [week_from, week_to].
+        selected = coordinator.plan_index.select(
+            state.get("plans"), person_id=active_id, week_from=scope.get("week_from"), week_to=scope.get("week_to")
+        )
+        result["person_id"] = active_id
+        result["plans"] = selected.get(active_id, {})
+    connection.send_result(msg["id"], result)
 
 
 @websocket_api.websocket_command(
     {
-        vol.Required("type"): "weekly_training/generate_plan",
+        vol.Required("type"): "weekly_training/get_markdown",
         vol.Required("entry_id"): str,
         vol.Optional("person_id"): str,
-        vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("week_start"): str,
     }
 )
 @websocket_api.async_response
-async def ws_generate_plan(
+async def ws_get_markdown(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
+    """Markdown of one person's week (default: active person, selected week); rendered on request and cached."""
     entry_id = msg["entry_id"]
     coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
     if coordinator is None:
         connection.send_error(msg["id"], "entry_not_found", f"No entry found for entry_id={entry_id}")
         return
-    person_id = msg.get("person_id")
-    if person_id is not None:
-        person_id = str(person_id)
-    try:
-        state = await coordinator.async_generate_for_day(person_id=person_id, expected_rev=msg.get("expected_rev"))
-    except ConflictError as e:
-        connection.send_error(msg["id"], "conflict", str(e))
-        return
-    connection.send_result(msg["id"], {"entry_id": entry_id, "state": public_state(state, runtime=_runtime_payload())})
+    state = await coordinator.store.async_load()
+    person_id = str(msg.get("person_id") or state.get("active_person_id") or "")
+    raw = str(msg.get("week_start") or "").strip()
+    if raw:
+        try:
+            day = date.fromisoformat(raw[:10])
+        except ValueError:
+            connection.send_error(msg["id"], "invalid", "week_start must be an ISO date (YYYY-MM-DD)")
+            return
+        week_start = (day - timedelta(days=day.weekday())).isoformat()
+    else:
+        overrides = state.get("overrides", {}) if isinstance(state.get("overrides"), dict) else {}
+        week_start = coordinator._week_start_for_offset(int(overrides.get("week_offset") or 0)).isoformat()  # noqa: SLF001
+    markdown = coordinator.markdown.get(state, person_id=person_id, week_start=week_start)
+    connection.send_result(
+        msg["id"],
+        {
+            "entry_id": entry_id,
+            "person_id": person_id,
+            "week_start": week_start,
+            "rev": int(state.get("rev") or 1),
+            "markdown": markdown or "",
+        },
+    )
 
 
 @websocket_api.websocket_command(
     {
-        vol.Required("type"): "weekly_training/generate_cycle",
+        vol.Required("type"): "weekly_training/generate_plan",
         vol.Required("entry_id"): str,
-        vol.Required("person_id"): str,
-        vol.Required("start_week_start"): str,  # ISO date for Monday (YYYY-MM-DD)
-        vol.Optional("weeks"): vol.Coerce(int),
-        vol.Optional("weekdays"): list,  # 0..6 (Mon..Sun)
+        vol.Optional("person_id"): str,
         vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("response"): vol.In(["state", "delta"]),
     }
 )
 @websocket_api.async_response
-async def ws_generate_cycle(
+async def ws_generate_plan(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Bulk-generate a multi-week cycle for selected weekdays.
-
-    This avoids UI loops of set_overrides+generate calls. It writes all sessions
-    and returns updated state once.
-    """
     entry_id = msg["entry_id"]
     coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
     if coordinator is None:
         connection.send_error(msg["id"], "entry_not_found", f"No entry found for entry_id={entry_id}")
         return
+    person_id = msg.get("person_id")
+    if person_id is not None:
+        person_id = str(person_id)
+    try:
+        state = await coordinator.async_generate_for_day(person_id=person_id, expected_rev=msg.get("expected_rev"))
+    except ConflictError as e:
+        connection.send_error(msg["id"], "conflict", str(e))
+        return
+    connection.send_result(msg["id"], _mutation_result(coordinator, entry_id, state, msg))
 
+
+async def _cycle_request(coordinator: Any, msg: dict[str, Any]) -> tuple[str, list[date], list[int]]:
+    """Parse generate_cycle args into (person_id, week_starts, weekdays). Raises ValueError."""
     person_id = str(msg.get("person_id") or "").strip()
     if not person_id:
-        connection.send_error(msg["id"], "invalid", "person_id is required")
-        return
+        raise ValueError("person_id is required")
 
     try:
         raw_start = str(msg.get("start_week_start") or "").strip()
@@ -581,9 +718,8 @@ async def ws_generate_cycle(
             overrides0 = state0.get("overrides", {}) if isinstance(state0, dict) else {}
             week_offset0 = int(overrides0.get("week_offset") or 0) if isinstance(overrides0, dict) else 0
             start_week_start = coordinator._week_start_for_offset(week_offset0)  # noqa: SLF001
-        except Exception:  # noqa: BLE001
-            connection.send_error(msg["id"], "invalid", "start_week_start must be an ISO date (YYYY-MM-DD)")
-            return
+        except Exception as err:  # noqa: BLE001
+            raise ValueError("start_week_start must be an ISO date (YYYY-MM-DD)") from err
 
     weeks = int(msg.get("weeks") or 4)
     weeks = max(1, min(12, weeks))
@@ -600,35 +736,63 @@ async def ws_generate_cycle(
             weekdays.append(xi)
     weekdays.sort()
     if not weekdays:
-        connection.send_error(msg["id"], "invalid", "weekdays must include at least one day (0..6)")
-        return
-
-    # Optional optimistic concurrency check (single check only; we write multiple times below).
-    expected_rev = msg.get("expected_rev")
-    if expected_rev is not None:
-        state0 = await coordinator.store.async_load()
-        try:
-            coordinator.store._assert_rev(state0, expected_rev)  # noqa: SLF001
-        except ConflictError as e:
-            connection.send_error(msg["id"], "conflict", str(e))
-            return
+        raise ValueError("weekdays must include at least one day (0..6)")
 
     # Coordinator offsets are relative to its effective "current Monday" (Monday 01:00 rule).
     current_monday = coordinator._week_start_for_offset(0)  # noqa: SLF001
     start_offset = int(round((start_week_start - current_monday).days / 7))
+    week_starts = [coordinator._week_start_for_offset(start_offset + w) for w in range(weeks)]  # noqa: SLF001
+    return person_id, week_starts, weekdays
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "weekly_training/generate_cycle",
+        vol.Required("entry_id"): str,
+        vol.Required("person_id"): str,
+        vol.Required("start_week_start"): str,  # ISO date for Monday (YYYY-MM-DD)
+        vol.Optional("weeks"): vol.Coerce(int),
+        vol.Optional("weekdays"): list,  # 0..6 (Mon..Sun)
+        vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("response"): vol.In(["state", "delta"]),
+    }
+)
+@websocket_api.async_response
+async def ws_generate_cycle(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Bulk-generate a multi-week cycle for selected weekdays.
+
+    This avoids UI loops of set_overrides+generate calls. All sessions are built
+    in memory and written with a single save, then updated state is returned once.
+    """
+    entry_id = msg["entry_id"]
+    coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+    if coordinator is None:
+        connection.send_error(msg["id"], "entry_not_found", f"No entry found for entry_id={entry_id}")
+        return
 
-    # Generate each planned day across N weeks. Do not pass expected_rev, since rev increments per write.
     try:
-        state = None
-        for w in range(weeks):
-            off = start_offset + w
-            for wd in weekdays:
-                state = await coordinator.async_generate_for_day(person_id=person_id, week_offset=off, weekday=int(wd), expected_rev=None)
+        person_id, week_starts, weekdays = await _cycle_request(coordinator, msg)
+    except ValueError as e:
+        connection.send_error(msg["id"], "invalid", str(e))
+        return
+
+    # All sessions are generated in memory and committed once (single rev bump).
+    try:
+        state = await coordinator.async_generate_cycle(
+            person_id=person_id,
+            week_starts=week_starts,
+            weekdays=weekdays,
+            expected_rev=msg.get("expected_rev"),
+        )
     except ConflictError as e:
         connection.send_error(msg["id"], "conflict", str(e))
         return
 
-    connection.send_result(msg["id"], {"entry_id": entry_id, "state": public_state(state or {}, runtime=_runtime_payload())})
+    connection.send_result(msg["id"], _mutation_result(coordinator, entry_id, state or {}, msg))
 
 
 @websocket_api.websocket_command(
@@ -639,6 +803,7 @@ async def ws_generate_cycle(
         vol.Required("week_start"): str,
         vol.Required("workout"): dict,
         vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("response"): vol.In(["state", "delta"]),
     }
 )
 @websocket_api.async_response
@@ -665,8 +830,172 @@ async def ws_upsert_workout(
     except ConflictError as e:
         connection.send_error(msg["id"], "conflict", str(e))
         return
-    await coordinator.async_request_refresh()
-    connection.send_result(msg["id"], {"entry_id": entry_id, "state": public_state(state, runtime=_runtime_payload())})
+    connection.send_result(msg["id"], _mutation_result(coordinator, entry_id, state, msg))
+
+
+# Batch ops: op type -> (schema for the op's own fields, coroutine applying it).
+# Fields match the individual commands; every op runs with expected_rev=None
+# because the batch checks the rev once for all of them.
+async def _op_set_workout_completed(coordinator: Any, op: dict[str, Any]) -> dict[str, Any]:
+    return await coordinator.store.async_set_workout_completed(
+        person_id=op["person_id"], week_start=op["week_start"], date_iso=op["date"], completed=op["completed"]
+    )
+
+
+async def _op_delete_workout(coordinator: Any, op: dict[str, Any]) -> dict[str, Any]:
+    return await coordinator.store.async_delete_workout(person_id=op["person_id"], week_start=op["week_start"], date_iso=op["date"])
+
+
+async def _op_delete_workout_series(coordinator: Any, op: dict[str, Any]) -> dict[str, Any]:
+    return await coordinator.store.async_delete_workout_series(
+        person_id=op["person_id"],
+        start_week_start=op["start_week_start"],
+        weekday=op["weekday"],
+        weeks=int(op.get("weeks") or 4),
+    )
+
+
+async def _op_delete_cycle(coordinator: Any, op: dict[str, Any]) -> dict[str, Any]:
+    return await coordinator.store.async_delete_cycle(person_id=op["person_id"])
+
+
+async def _op_set_active_person(coordinator: Any, op: dict[str, Any]) -> dict[str, Any]:
+    return await coordinator.store.async_set_active_person(op["person_id"])
+
+
+async def _op_set_overrides(coordinator: Any, op: dict[str, Any]) -> dict[str, Any]:
+    return await _async_apply_overrides(coordinator, op["overrides"], expected_rev=None)
+
+
+async def _op_add_person(coordinator: Any, op: dict[str, Any]) -> dict[str, Any]:
+    return await coordinator.store.async_upsert_person(op["person"])
+
+
+async def _op_delete_person(coordinator: Any, op: dict[str, Any]) -> dict[str, Any]:
+    return await coordinator.store.async_delete_person(op["person_id"])
+
+
+async def _op_set_person_cycle(coordinator: Any, op: dict[str, Any]) -> dict[str, Any]:
+    return await coordinator.store.async_set_person_cycle(person_id=op["person_id"], cycle=op.get("cycle"))
+
+
+async def _op_generate_plan(coordinator: Any, op: dict[str, Any]) -> dict[str, Any]:
+    return await coordinator.async_generate_for_day(person_id=op.get("person_id"))
+
+
+async def _op_generate_cycle(coordinator: Any, op: dict[str, Any]) -> dict[str, Any]:
+    person_id, week_starts, weekdays = await _cycle_request(coordinator, op)
+    return await coordinator.async_generate_cycle(person_id=person_id, week_starts=week_starts, weekdays=weekdays)
+
+
+async def _op_upsert_workout(coordinator: Any, op: dict[str, Any]) -> dict[str, Any]:
+    return await coordinator.store.async_upsert_workout(person_id=op["person_id"], week_start=op["week_start"], workout=op["workout"])
+
+
+_BATCH_OPS: dict[str, tuple[dict[Any, Any], Callable[[Any, dict[str, Any]], Awaitable[dict[str, Any]]]]] = {
+    "set_workout_completed": (
+        {vol.Required("person_id"): str, vol.Required("week_start"): str, vol.Required("date"): str, vol.Required("completed"): bool},
+        _op_set_workout_completed,
+    ),
+    "delete_workout": (
+        {vol.Required("person_id"): str, vol.Required("week_start"): str, vol.Required("date"): str},
+        _op_delete_workout,
+    ),
+    "delete_workout_series": (
+        {
+            vol.Required("person_id"): str,
+            vol.Required("start_week_start"): str,
+            vol.Required("weekday"): vol.Coerce(int),
+            vol.Optional("weeks"): vol.Coerce(int),
+        },
+        _op_delete_workout_series,
+    ),
+    "delete_cycle": ({vol.Required("person_id"): str}, _op_delete_cycle),
+    "set_active_person": ({vol.Required("person_id"): str}, _op_set_active_person),
+    "set_overrides": ({vol.Required("overrides"): dict}, _op_set_overrides),
+    "add_person": ({vol.Required("person"): dict}, _op_add_person),
+    "delete_person": ({vol.Required("person_id"): str}, _op_delete_person),
+    "set_person_cycle": ({vol.Required("person_id"): str, vol.Optional("cycle"): dict}, _op_set_person_cycle),
+    "generate_plan": ({vol.Optional("person_id"): str}, _op_generate_plan),
+    "generate_cycle": (
+        {
+            vol.Required("person_id"): str,
+            vol.Required("start_week_start"): str,
+            vol.Optional("weeks"): vol.Coerce(int),
+            vol.Optional("weekdays"): list,
+        },
+        _op_generate_cycle,
+    ),
+    "upsert_workout": (
+        {vol.Required("person_id"): str, vol.Required("week_start"): str, vol.Required("workout"): dict},
+        _op_upsert_workout,
+    ),
+}
+
+
+def _batch_ops(raw_ops: list[Any]) -> list[tuple[dict[str, Any], Callable[[Any, dict[str, Any]], Awaitable[dict[str, Any]]]]]:
+    """Validate every op up front (so a bad op fails before anything is applied). Raises ValueError."""
+    ops = []
+    for i, raw in enumerate(raw_ops):
+        if not isinstance(raw, dict):
+            raise ValueError(f"ops[{i}] must be an object")
+        op_type = str(raw.get("type") or "").removeprefix(f"{DOMAIN}/")
+        entry = _BATCH_OPS.get(op_type)
+        if entry is None:
+            raise ValueError(f"ops[{i}]: unsupported op type {raw.get('type')!r}")
+        schema, apply = entry
+        fields = {k: v for k, v in raw.items() if k != "type"}
+        try:
+            ops.append((vol.Schema(schema)(fields), apply))
+        except vol.Invalid as err:
+            raise ValueError(f"ops[{i}] ({op_type}): {err}") from err
+    return ops
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "weekly_training/batch",
+        vol.Required("entry_id"): str,
+        vol.Required("ops"): [dict],
+        vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("response"): vol.In(["state", "delta"]),
+    }
+)
+@websocket_api.async_response
+async def ws_batch(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Apply an ordered list of mutating ops atomically.
+
+    Each op is `{"type": <command without the "weekly_training/" prefix>, ...fields}`
+    with the same fields as the individual command (no entry_id/expected_rev).
+    `expected_rev` is checked once; all ops are applied in memory and committed
+    with a single rev bump and write. If any op fails, none of them is applied.
+    """
+    entry_id = msg["entry_id"]
+    coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+    if coordinator is None:
+        connection.send_error(msg["id"], "entry_not_found", f"No entry found for entry_id={entry_id}")
+        return
+    try:
+        ops = _batch_ops(msg["ops"])
+    except ValueError as e:
+        connection.send_error(msg["id"], "invalid", str(e))
+        return
+    try:
+        async with coordinator.store.transaction(expected_rev=msg.get("expected_rev")):
+            for op, apply in ops:
+                await apply(coordinator, op)
+    except ConflictError as e:
+        connection.send_error(msg["id"], "conflict", str(e))
+        return
+    except ValueError as e:
+        connection.send_error(msg["id"], "invalid", str(e))
+        return
+    state = await coordinator.store.async_load()
+    connection.send_result(msg["id"], _mutation_result(coordinator, entry_id, state, msg))
 
 
 @websocket_api.websocket_command(
@@ -722,6 +1051,7 @@ async def ws_export_config(
         vol.Required("entry_id"): str,
         vol.Required("config"): dict,
         vol.Optional("expected_rev"): vol.Coerce(int),
+        vol.Optional("response"): vol.In(["state", "delta"]),
     }
 )
 @websocket_api.async_response
@@ -735,42 +1065,39 @@ async def ws_import_config(
     if coordinator is None:
         connection.send_error(msg["id"], "entry_not_found", f"No entry found for entry_id={entry_id}")
         return
-    state = await coordinator.store.async_load()
+    cfg = msg.get("config") or {}
+    if not isinstance(cfg, dict):
+        cfg = {}
+    # The message is private to this handler, so large imports normalize in the executor.
+    imported = await async_run_sized(hass, import_config_size(cfg), EXECUTOR_MIN_IMPORT_ITEMS, normalize_import_config, cfg)
     try:
-        coordinator.store._assert_rev(state, msg.get("expected_rev"))  # noqa: SLF001
+        async with coordinator.store.transaction(expected_rev=msg.get("expected_rev")) as state:
+            state.update(imported)
+            # Safety: imported profiles rarely match existing plans. Start fresh.
+            state["plans"] = {}
+            state["history"] = []
+            # Ensure active_person_id is valid.
+            ids = {str(p.get("id") or "") for p in (state.get("people") or []) if isinstance(p, dict)}
+            if state.get("active_person_id") not in ids:
+                state["active_person_id"] = next(iter(ids), "")
     except ConflictError as e:
         connection.send_error(msg["id"], "conflict", str(e))
         return
-    cfg = msg.get("config") or {}
-    if not isinstance(cfg, dict):
-        cfg = {}
-    people = cfg.get("people")
-    ex_cfg = cfg.get("exercise_config")
-    if isinstance(people, list):
-        state["people"] = [p for p in people if isinstance(p, dict)]
-    if isinstance(ex_cfg, dict):
-        state["exercise_config"] = ex_cfg
-    # Safety: imported profiles rarely match existing plans. Start fresh.
-    state["plans"] = {}
-    state["history"] = []
-    # Ensure active_person_id is valid.
-    ids = {str(p.get("id") or "") for p in (state.get("people") or []) if isinstance(p, dict)}
-    if state.get("active_person_id") not in ids:
-        state["active_person_id"] = next(iter(ids), "")
-    state = await coordinator.store.async_save(state)
-    await coordinator.async_request_refresh()
-    connection.send_result(msg["id"], {"entry_id": entry_id, "state": public_state(state, runtime=_runtime_payload())})
+    state = await coordinator.store.async_load()
+    connection.send_result(msg["id"], _mutation_result(coordinator, entry_id, state, msg))
 
 
 def async_register(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_list_entries)
     websocket_api.async_register_command(hass, ws_get_state)
+    websocket_api.async_register_command(hass, ws_subscribe)
     websocket_api.async_register_command(hass, ws_set_active_person)
     websocket_api.async_register_command(hass, ws_set_overrides)
     websocket_api.async_register_command(hass, ws_add_person)
     websocket_api.async_register_command(hass, ws_delete_person)
     websocket_api.async_register_command(hass, ws_set_person_cycle)
     websocket_api.async_register_command(hass, ws_get_plan)
+    websocket_api.async_register_command(hass, ws_get_markdown)
     websocket_api.async_register_command(hass, ws_generate_plan)
     websocket_api.async_register_command(hass, ws_generate_cycle)
     websocket_api.async_register_command(hass, ws_get_library)
@@ -779,6 +1106,7 @@ def async_register(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_delete_workout_series)
     websocket_api.async_register_command(hass, ws_delete_cycle)
     websocket_api.async_register_command(hass, ws_upsert_workout)
+    websocket_api.async_register_command(hass, ws_batch)
     websocket_api.async_register_command(hass, ws_get_history)
     websocket_api.async_register_command(hass, ws_export_config)
     websocket_api.async_register_command(hass, ws_import_config)
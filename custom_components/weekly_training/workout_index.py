@@ -0,0 +1,80 @@
+"""Index of stored workouts by (person_id, date)."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Any
+
+
+def _workout_dates(plan: Any) -> list[tuple[int, str]]:
+    workouts = plan.get("workouts") if isinstance(plan, dict) else None
+    out = []
+    for i, w in enumerate(workouts if isinstance(workouts, list) else []):
+        d = str(w.get("date") or "") if isinstance(w, dict) else ""
+        if d:
+            out.append((i, d))
+    return out
+
+
+class WorkoutIndex:
+    """Map (person_id, date) -> (week_start, position) of the workout on that date.
+
+    The index follows whatever `plans` mapping it is given (the committed
+    snapshot or a transaction's working copy). Plans are copy-on-write, so a
+    person or week whose object is unchanged since the last sync is skipped
+    and only replaced weeks are re-read. A sorted copy of each person's dates
+    serves range queries.
+    """
+
+    def __init__(self) -> None:
+        # person_id -> (person plans object, {week_start: plan object}, {date: (week_start, position)}, sorted dates)
+        self._people: dict[str, tuple[Any, dict[str, Any], dict[str, tuple[str, int]], list[str]]] = {}
+
+    def _sync_person(self, plans: Any, person_id: str) -> tuple[dict[str, tuple[str, int]], list[str]]:
+        person_plans = plans.get(person_id) if isinstance(plans, dict) else None
+        if not isinstance(person_plans, dict):
+            self._people.pop(person_id, None)
+            return {}, []
+        entry = self._people.get(person_id)
+        if entry is not None and entry[0] is person_plans:
+            return entry[2], entry[3]
+        weeks, dates, ordered = ({}, {}, []) if entry is None else entry[1:]
+        for week, plan in list(weeks.items()):
+            if person_plans.get(week) is plan:
+                continue
+            del weeks[week]
+            for _, d in _workout_dates(plan):
+                if dates.get(d, ("",))[0] == week:
+                    del dates[d]
+                    del ordered[bisect_left(ordered, d)]
+        for week, plan in person_plans.items():
+            if week in weeks:
+                continue
+            weeks[week] = plan
+            for i, d in _workout_dates(plan):
+                if d not in dates:
+                    dates[d] = (str(week), i)
+                    insort(ordered, d)
+        self._people[person_id] = (person_plans, weeks, dates, ordered)
+        return dates, ordered
+
+    def locate(self, plans: Any, person_id: str, date_iso: str) -> tuple[str, int] | None:
+        """(week_start, position in that week's workouts) of the person's workout on `date_iso`, or None."""
+        return self._sync_person(plans, str(person_id))[0].get(str(date_iso))
+
+    def dates(self, plans: Any, person_id: str) -> dict[str, tuple[str, int]]:
+        """All indexed dates of one person: {date: (week_start, position)}. Read-only."""
+        return self._sync_person(plans, str(person_id))[0]
+
+    def between(self, plans: Any, person_id: str, start: str, end: str | None = None) -> list[tuple[str, str, int]]:
+        """(date, week_start, position) of the person's workouts with start <= date < end, in date order."""
+        dates, ordered = self._sync_person(plans, str(person_id))
+        lo = bisect_left(ordered, start)
+        hi = len(ordered) if end is None else bisect_left(ordered, end, lo)
+        return [(d, *dates[d]) for d in ordered[lo:hi]]
+
+    def sync(self, plans: Any) -> None:
+        """Drop people that no longer have plans (others are synced lazily on lookup)."""
+        current = plans if isinstance(plans, dict) else {}
+        for pid in [pid for pid in self._people if pid not in current]:
+            del self._people[pid]
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+from bisect import bisect_left, bisect_right
 from typing import Any
 
+from .planner import render_week_markdown
 
-def public_state(state: dict[str, Any], *, runtime: dict[str, Any] | None = None) -> dict[str, Any]:
-    """Return a stable public payload for the UI."""
+
+def public_state(
+    state: dict[str, Any], *, runtime: dict[str, Any] | None = None, plans: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Return a stable public payload for the UI. `plans` replaces the full plans (scoped queries)."""
     if not isinstance(state, dict):
         return {}
     runtime = runtime or {}
@@ -17,8 +24,229 @@ def public_state(state: dict[str, Any], *, runtime: dict[str, Any] | None = None
         "active_person_id": str(state.get("active_person_id") or ""),
         "overrides": state.get("overrides", {}),
         "exercise_config": state.get("exercise_config", {}),
-        "plans": state.get("plans", {}),
+        "plans": state.get("plans", {}) if plans is None else plans,
         "history": state.get("history", []),
         "updated_at": str(state.get("updated_at") or ""),
         "runtime": runtime,
     }
+
+
+class PlanWeekIndex:
+    """Sorted week_start keys per person, for windowed plan queries.
+
+    Entries are dropped when a save touches that person (see `sync`) and
+    rebuilt lazily on the next query.
+    """
+
+    def __init__(self) -> None:
+        self._weeks: dict[str, list[str]] = {}
+
+    def sync(self, plans: Any, touched_people: frozenset[str] | None) -> None:
+        if touched_people is None or not isinstance(plans, dict):
+            self._weeks.clear()
+            return
+        for pid in list(self._weeks):
+            if pid in touched_people or pid not in plans:
+                self._weeks.pop(pid, None)
+
+    def weeks(self, plans: dict[str, Any], person_id: str) -> list[str]:
+        person_plans = plans.get(person_id)
+        if not isinstance(person_plans, dict):
+            return []
+        keys = self._weeks.get(person_id)
+        if keys is None or len(keys) != len(person_plans):
+            keys = sorted(str(k) for k in person_plans)
+            self._weeks[person_id] = keys
+        return keys
+
+    def select(
+        self,
+        plans: Any,
+        *,
+        person_id: str | None = None,
+        week_from: str | None = None,
+        week_to: str | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Return {person_id: {week_start: plan}} limited to one person and/or an inclusive week range."""
+        if not isinstance(plans, dict):
+            return {}
+        person_ids = [person_id] if person_id is not None else [str(pid) for pid in plans]
+        out: dict[str, dict[str, Any]] = {}
+        for pid in person_ids:
+            person_plans = plans.get(pid)
+            if not isinstance(person_plans, dict):
+                continue
+            keys = self.weeks(plans, pid)
+            lo = bisect_left(keys, week_from) if week_from else 0
+            hi = bisect_right(keys, week_to) if week_to else len(keys)
+            out[pid] = {k: person_plans[k] for k in keys[lo:hi]}
+        return out
+
+
+class MarkdownCache:
+    """Week markdown rendered on request and cached per (person_id, week_start).
+
+    Snapshots are copy-on-write, so an entry rendered at an older rev is still
+    valid while that week's plan is the same object; it is re-rendered only
+    once a rev replaced the plan. `sync` drops entries of touched people.
+    """
+
+    def __init__(self) -> None:
+        # (person_id, week_start) -> (plan object, markdown)
+        self._entries: dict[tuple[str, str], tuple[Any, str]] = {}
+
+    def sync(self, plans: Any, touched_people: frozenset[str] | None) -> None:
+        if touched_people is None or not isinstance(plans, dict):
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0] in touched_people or k[0] not in plans]:
+            del self._entries[key]
+
+    def get(self, state: dict[str, Any], *, person_id: str, week_start: str) -> str | None:
+        """Markdown of one person's week in `state`, or None when that week has no plan."""
+        plans = state.get("plans") if isinstance(state, dict) else None
+        person_plans = plans.get(person_id) if isinstance(plans, dict) else None
+        plan = person_plans.get(week_start) if isinstance(person_plans, dict) else None
+        if not isinstance(plan, dict):
+            return None
+        key = (person_id, week_start)
+        hit = self._entries.get(key)
+        if hit is not None and hit[0] is plan:
+            return hit[1]
+        markdown = render_week_markdown(plan, week_start=week_start)
+        self._entries[key] = (plan, markdown)
+        return markdown
+
+
+# Top-level public keys tracked as a whole (plans are tracked per person/week).
+_TRACKED_KEYS = ("people", "active_person_id", "overrides", "exercise_config", "history", "updated_at")
+
+
+def _pointer(*parts: str) -> str:
+    """Build a JSON pointer (RFC 6901) from raw keys."""
+    return "".join("/" + str(p).replace("~", "~0").replace("/", "~1") for p in parts)
+
+
+def _fingerprint(value: Any) -> str:
+    return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class StateDeltaTracker:
+    """Remember which public paths changed in each rev.
+
+    Mutating websocket commands can then answer with JSON-patch style ops
+    relative to the client's `expected_rev` instead of the full public state.
+    Only the last `max_revs` revs are kept; older bases get the full state.
+
+    Fingerprints are kept together with the object they were taken from; the
+    store's snapshots are copy-on-write, so a value that is still the same
+    object is unchanged and is not hashed again.
+    """
+
+    def __init__(self, *, max_revs: int = 16) -> None:
+        self._max_revs = max(1, int(max_revs))
+        self._rev: int | None = None
+        self._top: dict[str, tuple[Any, str]] = {}
+        self._weeks: dict[str, dict[str, tuple[Any, str]]] = {}
+        # rev -> paths changed by the save that produced it (None = unknown).
+        self._changes: dict[int, set[tuple[str, ...]] | None] = {}
+
+    @staticmethod
+    def _fingerprint_ref(value: Any, prev: tuple[Any, str] | None) -> tuple[Any, str]:
+        if prev is not None and prev[0] is value:
+            return prev
+        return value, _fingerprint(value)
+
+    def _fingerprint_person(self, person_plans: Any, prev: dict[str, tuple[Any, str]] | None = None) -> dict[str, tuple[Any, str]]:
+        if not isinstance(person_plans, dict):
+            return {}
+        prev = prev or {}
+        return {str(week): self._fingerprint_ref(plan, prev.get(str(week))) for week, plan in person_plans.items()}
+
+    def seed(self, state: dict[str, Any]) -> None:
+        """Take `state` as the baseline if nothing has been recorded yet."""
+        if self._rev is not None or not isinstance(state, dict):
+            return
+        self._rev = int(state.get("rev") or 1)
+        self._top = {key: self._fingerprint_ref(state.get(key), None) for key in _TRACKED_KEYS}
+        plans = state.get("plans") if isinstance(state.get("plans"), dict) else {}
+        self._weeks = {str(pid): self._fingerprint_person(pp) for pid, pp in plans.items()}
+
+    def record(self, state: dict[str, Any], *, touched_people: frozenset[str] | None = None) -> None:
+        """Record the paths changed by a save. `touched_people` limits which plans are compared."""
+        if not isinstance(state, dict):
+            return
+        rev = int(state.get("rev") or 1)
+        if self._rev is None:
+            self.seed(state)
+            self._changes[rev] = None
+            return
+
+        changed: set[tuple[str, ...]] = set()
+        for key in _TRACKED_KEYS:
+            prev = self._top.get(key)
+            cur = self._fingerprint_ref(state.get(key), prev)
+            if prev is None or prev[1] != cur[1]:
+                changed.add((key,))
+            self._top[key] = cur
+
+        plans = state.get("plans") if isinstance(state.get("plans"), dict) else {}
+        current = {str(pid) for pid in plans}
+        for pid in set(self._weeks) - current:
+            self._weeks.pop(pid, None)
+            changed.add(("plans", pid))
+        for pid in current - set(self._weeks):
+            self._weeks[pid] = self._fingerprint_person(plans.get(pid))
+            changed.add(("plans", pid))
+        compare = current if touched_people is None else current & set(touched_people)
+        for pid in compare:
+            if ("plans", pid) in changed:
+                continue
+            before = self._weeks.get(pid, {})
+            after = self._fingerprint_person(plans.get(pid), before)
+            for week in set(before) | set(after):
+                if (before.get(week) or (None, ""))[1] != (after.get(week) or (None, ""))[1]:
+                    changed.add(("plans", pid, week))
+            self._weeks[pid] = after
+
+        self._rev = rev
+        self._changes[rev] = changed
+        for old in sorted(self._changes)[: -self._max_revs]:
+            self._changes.pop(old, None)
+
+    def delta(
+        self, state: dict[str, Any], *, base_rev: int | None, runtime: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        """Return {base_rev, rev, ops} bringing a client at `base_rev` up to `state`, or None if unknown."""
+        if base_rev is None or not isinstance(state, dict):
+            return None
+        rev = int(state.get("rev") or 1)
+        if rev != self._rev or base_rev > rev:
+            return None
+        paths: set[tuple[str, ...]] = set()
+        for r in range(int(base_rev) + 1, rev + 1):
+            changes = self._changes.get(r)
+            if changes is None:
+                return None
+            paths |= changes
+
+        ops: list[dict[str, Any]] = [{"op": "add", "path": "/rev", "value": rev}]
+        for path in sorted(paths, key=lambda p: (len(p), p)):
+            # A whole-person op already covers that person's weeks.
+            if len(path) == 3 and ("plans", path[1]) in paths:
+                continue
+            value: Any = state
+            found = True
+            for part in path:
+                if isinstance(value, dict) and part in value:
+                    value = value[part]
+                else:
+                    found = False
+                    break
+            if found:
+                ops.append({"op": "add", "path": _pointer(*path), "value": value})
+            else:
+                ops.append({"op": "remove", "path": _pointer(*path)})
+        if runtime is not None:
+            ops.append({"op": "add", "path": "/runtime", "value": runtime})
+        return {"base_rev": int(base_rev), "rev": rev, "ops": ops}
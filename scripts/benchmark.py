@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""Planner/storage micro-benchmarks with a regression check.
+
+Runs the hot planner and storage helpers against synthetic libraries
+(60 / 1,000 / 10,000 exercises) and synthetic states (1-50 people,
+1-52 weeks), recording ops/sec and peak allocated bytes per call.
+
+Usage:
+  python scripts/benchmark.py --save          # record a baseline for this machine
+  python scripts/benchmark.py                 # run and compare with it
+  python scripts/benchmark.py -k markdown     # only cases whose name contains "markdown"
+
+The gate compares against the local baseline (.benchmark_baseline.json in the
+repo root, not committed), so both sides come from the same machine: save it
+on the base commit, then run the gate on your change. Exit code 1 when a case
+is slower or allocates more (peak bytes) than that baseline by more than
+--threshold (default 25%), after the flagged cases were re-measured
+--retries times. Speed is compared as `relative`: ops/sec divided by the
+ops/sec of a fixed pure-Python calibration loop timed right before the case,
+which evens out CPU frequency drift between runs; raw ops/sec is recorded for
+reference.
+
+scripts/benchmark_baseline.json holds reference numbers from one
+development machine. Calibration does not cancel the differences between
+machines, so it is never gated against: without a local baseline the run
+only reports how far each case is from the reference and exits 0. Refresh it
+with --save-reference when adding cases.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+repo_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(repo_root))
+
+from custom_components.weekly_training.planner import (  # noqa: E402
+    CompiledLibrary,
+    _render_markdown,
+    generate_session,
+    generate_sessions,
+    recompute_workout_loads,
+)
+from custom_components.weekly_training.storage import (  # noqa: E402
+    _recompute_cycle_workout_loads,
+    _recompute_cycle_workout_loads_for_person,
+    _trim_history,
+)
+from custom_components.weekly_training.workout_index import WorkoutIndex  # noqa: E402
+
+# Per-machine gate baseline (gitignored) and the committed, informational reference.
+DEFAULT_BASELINE = repo_root / ".benchmark_baseline.json"
+REFERENCE_BASELINE = repo_root / "scripts" / "benchmark_baseline.json"
+BUNDLED_LIBRARY = repo_root / "custom_components" / "weekly_training" / "data" / "exercises.json"
+
+LIBRARY_SIZES = (60, 1_000, 10_000)
+# (people, weeks) combinations for state-shaped benchmarks.
+STATE_SHAPES = ((1, 1), (10, 12), (50, 52))
+
+_TAGS = (
+    "squat", "deadlift", "hinge", "lunge", "single_leg", "leg", "bench", "push", "press",
+    "overhead_press", "dumbbell_press", "row", "pull", "pullup", "lat", "core", "arms",
+    "shoulders", "chest", "back", "accessory", "posterior_chain", "triceps", "biceps",
+)
+_EQUIPMENT = ("barbell", "dumbbell", "bodyweight", "band", "kettlebell", "machine")
+WEEK0 = date(2026, 1, 5)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic inputs
+
+
+def synthetic_library(size: int, *, seed: int = 1) -> dict[str, Any]:
+    """Bundled exercises (so template names resolve) padded with random variations."""
+    rng = random.Random(seed)
+    bundled = json.loads(BUNDLED_LIBRARY.read_text(encoding="utf-8")).get("exercises", [])
+    exercises = list(bundled[:size])
+    for i in range(len(exercises), size):
+        exercises.append(
+            {
+                "id": f"synthetic_{i}",
+                "name": f"Synthetic Variation {i}",
+                "tags": rng.sample(_TAGS, rng.randint(1, 4)),
+                "equipment": rng.sample(_EQUIPMENT, rng.randint(1, 2)),
+            }
+        )
+    return {"exercises": exercises, "tags": {}}
+
+
+def synthetic_profile(person_id: str = "person_0") -> dict[str, Any]:
+    return {
+        "id": person_id,
+        "name": person_id,
+        "gender": "male",
+        "duration_minutes": 55,
+        "units": "kg",
+        "equipment": "barbell,dumbbell,bodyweight,band",
+        "preferred_exercises": "",
+        "maxes": {"squat": 120, "deadlift": 160, "bench": 100},
+    }
+
+
+def synthetic_overrides(*, weeks: int) -> dict[str, Any]:
+    return {
+        "planning_mode": "auto",
+        "cycle": {
+            "enabled": True,
+            "preset": "strength",
+            "program": "full_body_abc",
+            "start_week_start": WEEK0.isoformat(),
+            "training_weekdays": [0, 2, 4],
+            "weeks": max(1, min(12, weeks)),
+            "step_pct": 2.5,
+            "deload_pct": 10,
+            "deload_volume": 0.65,
+        },
+    }
+
+
+_PLAN_CACHE: dict[int, dict[str, dict[str, Any]]] = {}
+
+
+def synthetic_week_plans(weeks: int) -> dict[str, dict[str, Any]]:
+    """Real generated plans (3 sessions/week) for `weeks` weeks, built once and copied."""
+    if weeks not in _PLAN_CACHE:
+        days = [(WEEK0 + timedelta(days=7 * w), wd) for w in range(weeks) for wd in (0, 2, 4)]
+        _PLAN_CACHE[weeks] = generate_sessions(
+            profile=synthetic_profile(),
+            library=synthetic_library(60),
+            overrides=synthetic_overrides(weeks=weeks),
+            days=days,
+            existing_plans={},
+        )
+    return copy.deepcopy(_PLAN_CACHE[weeks])
+
+
+def synthetic_state(people: int, weeks: int) -> dict[str, Any]:
+    cycle = synthetic_overrides(weeks=weeks)["cycle"]
+    state: dict[str, Any] = {"people": [], "plans": {}, "history": []}
+    for p in range(people):
+        pid = f"person_{p}"
+        person = synthetic_profile(pid)
+        person["cycle"] = dict(cycle)
+        state["people"].append(person)
+        state["plans"][pid] = synthetic_week_plans(weeks)
+    return state
+
+
+def synthetic_history(people: int, weeks: int) -> list[dict[str, Any]]:
+    history = []
+    for w in range(weeks):
+        week_start = (WEEK0 + timedelta(days=7 * w)).isoformat()
+        completed = [
+            {"person_id": f"person_{p}", "week_start": week_start, "date": week_start, "workout": {"name": "Full body"}}
+            for p in range(people)
+        ]
+        history.append({"week_start": week_start, "archived_at": week_start, "completed": completed})
+    random.Random(weeks).shuffle(history)
+    return history
+
+
+# ---------------------------------------------------------------------------
+# Cases: name -> factory returning the zero-argument callable to time.
+
+
+def _case_generate_session(size: int) -> Callable[[], Any]:
+    library = synthetic_library(size)
+    profile = synthetic_profile()
+    overrides = synthetic_overrides(weeks=4)
+    return lambda: generate_session(
+        profile=profile, library=library, overrides=overrides, week_start_day=WEEK0, weekday=2, existing_plan=None
+    )
+
+
+def _case_generate_session_compiled(size: int) -> Callable[[], Any]:
+    # Library compiled once (as the integration does), strength template day.
+    library = CompiledLibrary(synthetic_library(size))
+    profile = synthetic_profile()
+    overrides = synthetic_overrides(weeks=4)
+    return lambda: generate_session(
+        profile=profile, library=library, overrides=overrides, week_start_day=WEEK0, weekday=2, existing_plan=None
+    )
+
+
+def _case_recompute_workout_loads() -> Callable[[], Any]:
+    plan = synthetic_week_plans(1)[WEEK0.isoformat()]
+    workout = plan["workouts"][0]
+    profile = synthetic_profile()
+    cycle = synthetic_overrides(weeks=4)["cycle"]
+    return lambda: recompute_workout_loads(profile=profile, workout=workout, cycle_cfg=cycle)
+
+
+def _case_render_markdown() -> Callable[[], Any]:
+    plan = synthetic_week_plans(1)[WEEK0.isoformat()]
+    return lambda: _render_markdown(week_number=2, week_start=WEEK0.isoformat(), plan=plan)
+
+
+def _case_recompute_cycle(people: int, weeks: int) -> Callable[[], Any]:
+    state = synthetic_state(people, weeks)
+    person = state["people"][-1]
+    return lambda: _recompute_cycle_workout_loads_for_person(state, person=person)
+
+
+def _case_recompute_cycle_all(people: int, weeks: int) -> Callable[[], Any]:
+    state = synthetic_state(people, weeks)
+    return lambda: _recompute_cycle_workout_loads(state, people=state["people"])
+
+
+def _case_trim_history(people: int, weeks: int) -> Callable[[], Any]:
+    history = synthetic_history(people, weeks)
+    return lambda: _trim_history(list(history), keep=4)
+
+
+def _case_calendar_range(people: int, weeks: int) -> Callable[[], Any]:
+    # Synced index; a four-week calendar window for the last person.
+    state = synthetic_state(people, weeks)
+    index = WorkoutIndex()
+    pid = state["people"][-1]["id"]
+    index.dates(state["plans"], pid)
+    start, end = WEEK0.isoformat(), (WEEK0 + timedelta(days=28)).isoformat()
+    return lambda: index.between(state["plans"], pid, start, end)
+
+
+def cases() -> dict[str, Callable[[], Callable[[], Any]]]:
+    out: dict[str, Callable[[], Callable[[], Any]]] = {}
+    for size in LIBRARY_SIZES:
+        out[f"generate_session[lib={size}]"] = lambda size=size: _case_generate_session(size)
+        out[f"generate_session_compiled[lib={size}]"] = lambda size=size: _case_generate_session_compiled(size)
+    out["recompute_workout_loads"] = _case_recompute_workout_loads
+    out["render_markdown"] = _case_render_markdown
+    for people, weeks in STATE_SHAPES:
+        shape = f"people={people},weeks={weeks}"
+        out[f"recompute_cycle_loads_for_person[{shape}]"] = lambda p=people, w=weeks: _case_recompute_cycle(p, w)
+        out[f"recompute_cycle_loads_all[{shape}]"] = lambda p=people, w=weeks: _case_recompute_cycle_all(p, w)
+        out[f"trim_history[{shape}]"] = lambda p=people, w=weeks: _case_trim_history(p, w)
+        out[f"calendar_range[{shape}]"] = lambda p=people, w=weeks: _case_calendar_range(p, w)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+
+
+def _calibration() -> int:
+    # Dict/str/list churn, roughly the mix the planner does.
+    total = 0
+    for i in range(200):
+        row = {"name": f"item {i}", "sets": i % 5, "reps": i % 8}
+        total += len(str(row["name"]).split()) + row["sets"] * row["reps"]
+    return total
+
+
+def _ops_per_sec(fn: Callable[[], Any], *, min_time: float, repeat: int, min_calls: int = 1) -> float:
+    best = 0.0
+    for _ in range(repeat):
+        n = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time or n < min_calls:
+            fn()
+            n += 1
+            elapsed = time.perf_counter() - start
+        best = max(best, n / elapsed)
+    return best
+
+
+def measure(fn: Callable[[], Any], *, min_time: float, repeat: int) -> dict[str, float]:
+    """Best-of-`repeat` ops/sec (each run at least `min_time` s and 5 calls), relative speed and peak bytes of one call.
+
+    `relative` is the median over runs of (case ops/sec / calibration ops/sec),
+    each pair timed back to back, so one lucky or unlucky run moves neither the
+    baseline nor the gate.
+    """
+    fn()  # warm up caches/lazy imports
+    best = 0.0
+    ratios: list[float] = []
+    for _ in range(repeat):
+        calibration = _ops_per_sec(_calibration, min_time=min_time / 2, repeat=1)
+        ops = _ops_per_sec(fn, min_time=min_time, repeat=1, min_calls=5)
+        best = max(best, ops)
+        ratios.append(ops / calibration)
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "ops_per_sec": round(best, 2),
+        "relative": round(statistics.median(ratios), 6),
+        "peak_bytes": max(0, peak - base),
+    }
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], *, threshold: float) -> list[str]:
+    regressions: list[str] = []
+    for name, cur in results.items():
+        ref = baseline.get(name)
+        if not ref:
+            continue
+        if cur["relative"] < ref["relative"] * (1 - threshold):
+            regressions.append(f"{name}: relative speed {cur['relative']:.4g} < baseline {ref['relative']:.4g}")
+        # Small absolute slack so tiny allocations don't flap.
+        if cur["peak_bytes"] > ref["peak_bytes"] * (1 + threshold) + 1024:
+            regressions.append(f"{name}: peak bytes {cur['peak_bytes']} > baseline {ref['peak_bytes']}")
+    return regressions
+
+
+def _save(path: Path, results: dict[str, dict[str, float]]) -> None:
+    baseline = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    baseline.update(results)
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    print(f"baseline written: {path}")
+
+
+def _report_reference(results: dict[str, dict[str, float]], reference: dict[str, dict[str, float]]) -> None:
+    for name, cur in results.items():
+        ref = reference.get(name)
+        if ref and ref.get("relative"):
+            print(f"{name:55s} {cur['relative'] / ref['relative']:>8.2f}x reference speed")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="local baseline to gate against")
+    parser.add_argument("--save", action="store_true", help="write results as this machine's baseline")
+    parser.add_argument("--save-reference", action="store_true", help=f"write results into {REFERENCE_BASELINE.name} (informational)")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed regression ratio (default 0.25)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timing run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--retries", type=int, default=2, help="re-measure flagged cases this many times before failing")
+    args = parser.parse_args(argv)
+
+    results: dict[str, dict[str, float]] = {}
+    for name, factory in cases().items():
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = measure(factory(), min_time=args.min_time, repeat=max(1, args.repeat))
+        r = results[name]
+        print(f"{name:55s} {r['ops_per_sec']:>12,.1f} ops/s {r['relative']:>10.4g} rel {r['peak_bytes']:>12,d} B peak")
+
+    if args.save or args.save_reference:
+        if args.save:
+            _save(args.baseline, results)
+        if args.save_reference:
+            _save(REFERENCE_BASELINE, results)
+        return 0
+
+    if not args.baseline.exists():
+        print(f"no local baseline at {args.baseline}; run with --save (e.g. on the base commit) to enable the gate")
+        if REFERENCE_BASELINE.exists():
+            print(f"compared with {REFERENCE_BASELINE.name} (other machine, not gated):")
+            _report_reference(results, json.loads(REFERENCE_BASELINE.read_text(encoding="utf-8")))
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(results, baseline, threshold=args.threshold)
+    for attempt in range(args.retries):
+        if not regressions:
+            break
+        # Re-measure only the flagged cases (longer runs, best result kept) so a
+        # noisy moment on a shared host does not fail the gate.
+        flagged = {line.split(":", 1)[0] for line in regressions}
+        for name in sorted(flagged):
+            again = measure(cases()[name](), min_time=args.min_time * (2 + attempt), repeat=max(1, args.repeat))
+            prev = results[name]
+            results[name] = {
+                "ops_per_sec": max(prev["ops_per_sec"], again["ops_per_sec"]),
+                "relative": max(prev["relative"], again["relative"]),
+                "peak_bytes": min(prev["peak_bytes"], again["peak_bytes"]),
+            }
+            print(f"re-measured {name}: {results[name]['relative']:.4g} rel {results[name]['peak_bytes']:,d} B peak")
+        regressions = compare(results, baseline, threshold=args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(request):
+    # Only Home Assistant tests (those using `hass`) load the integration; pure tests stay plain.
+    if "hass" not in request.fixturenames:
+        yield
+        return
+    request.getfixturevalue("enable_custom_integrations")
+    # The card's static path needs the http component; not under test here.
+    with patch("custom_components.weekly_training.async_register_frontend", AsyncMock()):
+        yield
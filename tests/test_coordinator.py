@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.weekly_training.const import DOMAIN
+
+
+async def _setup(hass):
+    entry = MockConfigEntry(domain=DOMAIN, data={"name": "WT"})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry, hass.data[DOMAIN][entry.entry_id]
+
+
+async def test_pushed_rev_writes_sensor_with_that_revs_summary(hass) -> None:
+    _, coordinator = await _setup(hass)
+    state = await coordinator.store.async_load()
+    pid = state["people"][0]["id"]
+    today = dt_util.now().date()
+    state = await coordinator.async_generate_for_day(person_id=pid, week_offset=0, weekday=today.weekday())
+    sensor = next(s for s in hass.states.async_all("sensor") if "workout_count" in s.attributes)
+    assert sensor.attributes["next_session_date"] == today.isoformat()
+    assert sensor.attributes["updated_at"] == state["updated_at"]
+
+    week_start = sensor.attributes["week_start"]
+    state = await coordinator.store.async_set_workout_completed(
+        person_id=pid, week_start=week_start, date_iso=today.isoformat(), completed=True
+    )
+    # No refresh: the push for this rev alone must carry the new summary.
+    attrs = hass.states.get(sensor.entity_id).attributes
+    assert attrs["updated_at"] == state["updated_at"]
+    assert attrs["completed_count"] == 1
+    assert attrs["next_session_date"] is None
+
+
+async def test_generate_for_day_does_not_lose_a_concurrent_completion(hass) -> None:
+    _, coordinator = await _setup(hass)
+    state = await coordinator.store.async_load()
+    pid = state["people"][0]["id"]
+    today = dt_util.now().date()
+    state = await coordinator.async_generate_for_day(person_id=pid, week_offset=0, weekday=today.weekday())
+    week_start = next(iter(state["plans"][pid]))
+
+    # Hold generation inside its context step while a completion of the same week is sent.
+    gate = asyncio.Event()
+    original = coordinator._async_generation_context
+
+    async def _slow_context(*args, **kwargs):
+        await gate.wait()
+        return await original(*args, **kwargs)
+
+    coordinator._async_generation_context = _slow_context
+    generate = hass.async_create_task(
+        coordinator.async_generate_for_day(person_id=pid, week_offset=0, weekday=(today.weekday() + 1) % 7)
+    )
+    complete = hass.async_create_task(
+        coordinator.store.async_set_workout_completed(
+            person_id=pid, week_start=week_start, date_iso=today.isoformat(), completed=True
+        )
+    )
+    await asyncio.sleep(0)
+    gate.set()
+    await generate
+    await complete
+
+    state = await coordinator.store.async_load()
+    workouts = {w["date"]: w for w in state["plans"][pid][week_start]["workouts"]}
+    assert len(workouts) == 2
+    assert workouts[today.isoformat()]["completed"] is True
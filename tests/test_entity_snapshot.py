@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from custom_components.weekly_training.coordinator import (
+    _exercise_options,
+    build_entity_snapshot,
+    build_person_summary,
+)
+from custom_components.weekly_training.workout_index import WorkoutIndex
+
+
+def test_entity_snapshot_derives_entity_views() -> None:
+    options = _exercise_options(
+        {
+            "exercises": [
+                {"name": "Back Squat", "tags": ["Squat"]},
+                {"name": "Bench Press", "tags": ["bench", "push"]},
+                {"name": "Barbell Row", "tags": ["row"]},
+                {"name": "Plank", "tags": ["core"]},
+            ]
+        }
+    )
+    state = {
+        "rev": 7,
+        "people": [{"id": "p1", "name": "Ann"}, {"id": "p2", "name": "Bo"}, {"id": "p3", "name": "Ann"}],
+        "active_person_id": "p2",
+        "overrides": {"planning_mode": "Manual", "duration_minutes": 60, "session_overrides": {"a_lower": " Back Squat "}},
+    }
+    snap = build_entity_snapshot(state, exercise_options=options)
+    assert snap.rev == 7
+    assert snap.person_names == ("Ann", "Bo", "Ann")
+    assert snap.person_ids_by_name == {"Ann": "p1", "Bo": "p2"}
+    assert snap.active_person_name == "Bo"
+    assert (snap.planning_mode, snap.duration_minutes, snap.preferred_exercises) == ("manual", 60.0, "")
+    assert snap.slot_options("b_lower") == ("Auto", "Back Squat")
+    assert snap.slot_options("c_pull") == ("Auto", "Barbell Row")
+    assert snap.slot_value("a_lower") == "Back Squat"
+    assert snap.slot_value("a_push") == "Auto"
+
+    empty = build_entity_snapshot({}, exercise_options=options)
+    assert empty.active_person_name is None and empty.duration_minutes == 45.0
+
+
+def test_person_summary_today_next_and_completion() -> None:
+    plans = {
+        "p1": {
+            "2024-01-01": {
+                "workouts": [
+                    {"date": "2024-01-02", "name": "A", "items": [{}, {}], "completed": True},
+                    {"date": "2024-01-04", "name": "B", "items": [{}], "completed": True},
+                    {"date": "2024-01-05", "name": "C", "items": [{}, {}, {}]},
+                ]
+            },
+            "2024-01-08": {"workouts": [{"date": "2024-01-08", "name": "A", "items": []}]},
+        }
+    }
+    state = {"people": [{"id": "p1", "name": "Ann"}], "plans": plans}
+    summary = build_person_summary(state, state["people"][0], index=WorkoutIndex(), today="2024-01-04", week_start="2024-01-01")
+    assert summary.name == "Ann"
+    assert (summary.today.name, summary.today.completed, summary.today.exercises) == ("B", True, 1)
+    assert (summary.next_session.date, summary.next_session.week_start) == ("2024-01-05", "2024-01-01")
+    assert (summary.workout_count, summary.completed_count, summary.week_completion) == (3, 2, 66.7)
+
+    rest = build_person_summary(state, state["people"][0], index=WorkoutIndex(), today="2024-01-09", week_start="2024-01-08")
+    assert rest.today is None and rest.next_session is None and rest.week_completion == 0.0
+    empty = build_person_summary({}, {"id": "p2"}, index=WorkoutIndex(), today="2024-01-09", week_start="2024-01-08")
+    assert empty.week_completion is None
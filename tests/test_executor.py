@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.weekly_training.executor import async_run_sized
+
+
+class _Hass:
+    def __init__(self) -> None:
+        self.jobs = 0
+
+    async def async_add_executor_job(self, target):
+        self.jobs += 1
+        return await asyncio.get_running_loop().run_in_executor(None, target)
+
+
+def test_run_sized_stays_inline_below_threshold() -> None:
+    hass = _Hass()
+
+    async def _run() -> tuple[int, int]:
+        small = await async_run_sized(hass, 9, 10, sum, [1, 2], start=3)
+        large = await async_run_sized(hass, 10, 10, sum, [1, 2], start=3)
+        return small, large
+
+    assert asyncio.run(_run()) == (6, 6)
+    assert hass.jobs == 1
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from custom_components.weekly_training.library import LibraryView, exercise_config_key
+
+
+def test_exercise_config_key_only_tracks_custom_and_disabled() -> None:
+    base = {"custom_exercises": [{"name": "Sled Push", "tags": ["leg"]}], "disabled_exercises": ["Plank"]}
+    assert exercise_config_key(base) == exercise_config_key({**base, "unrelated": 1})
+    assert exercise_config_key(base) != exercise_config_key({**base, "disabled_exercises": []})
+    assert exercise_config_key(None) == exercise_config_key({})
+
+
+def test_library_view_merges_custom_exercises_without_touching_bundled() -> None:
+    bundled = {"exercises": [{"name": "Back Squat", "tags": ["squat"]}], "tags": {}}
+    cfg = {"custom_exercises": [{"name": "Sled Push", "tags": ["leg"]}, "junk"], "disabled_exercises": ["Plank"]}
+    view = LibraryView(exercise_config_key(cfg), bundled, cfg)
+    assert [e["name"] for e in view.library["exercises"]] == ["Back Squat", "Sled Push"]
+    assert len(bundled["exercises"]) == 1
+    assert view.disabled_exercises == ["Plank"]
+    assert view.compiled is view.compiled
+    assert view.compiled.by_name["Sled Push"].name == "Sled Push"
+
+    plain = LibraryView(exercise_config_key({}), bundled, {})
+    assert plain.library is bundled and plain.disabled_exercises == []
+
+
+def test_library_view_payload_is_normalized_and_hashed() -> None:
+    bundled = {"exercises": [{"name": "squat", "tags": [" Leg "]}, {"name": "Bench", "group": "Push", "equipment": ["BARBELL"]}, {"name": ""}]}
+    view = LibraryView(exercise_config_key({}), bundled, {})
+    assert view.payload == [
+        {"name": "Bench", "group": "Push", "tags": [], "equipment": ["barbell"]},
+        {"name": "squat", "tags": ["leg"], "equipment": []},
+    ]
+    assert view.payload is view.payload
+    same = LibraryView(exercise_config_key({}), bundled, {})
+    assert same.payload_hash == view.payload_hash
+    custom = {"custom_exercises": [{"name": "Sled Push"}]}
+    assert LibraryView(exercise_config_key(custom), bundled, custom).payload_hash != view.payload_hash
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import date
 
-from custom_components.weekly_training.planner import generate_session
+from custom_components.weekly_training.planner import generate_session, generate_sessions
 
 
 def _base_profile() -> dict:
@@ -112,3 +112,32 @@ def test_front_squat_not_auto_selected_for_strength_templates() -> None:
     assert lowers
     assert all("front squat" not in str(i.get("exercise") or "").lower() for i in lowers)
 
+
+
+def test_generate_sessions_matches_day_by_day_generation() -> None:
+    prof = _base_profile()
+    lib = _base_library()
+    start = date.fromisoformat("2026-02-16")
+    ov = _cycle_overrides(program="full_body_abc", training_weekdays=[0, 2, 4], start_week_start=start.isoformat())
+    weeks = [date.fromordinal(start.toordinal() + 7 * i) for i in range(4)]
+
+    expected: dict[str, dict] = {}
+    for ws in weeks:
+        for wd in [0, 2, 4]:
+            key = ws.isoformat()
+            expected[key] = generate_session(
+                profile=prof, library=lib, overrides=ov, week_start_day=ws, weekday=wd, existing_plan=expected.get(key)
+            )
+
+    batch = generate_sessions(
+        profile=prof,
+        library=lib,
+        overrides=ov,
+        days=[(ws, wd) for ws in weeks for wd in [0, 2, 4]],
+        existing_plans={},
+    )
+
+    assert sorted(batch) == sorted(expected)
+    for key, plan in batch.items():
+        assert plan["workouts"] == expected[key]["workouts"]
+        assert "markdown" not in plan
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from custom_components.weekly_training.planner import CompiledLibrary, PickContext, _pick_one
+from custom_components.weekly_training.programs import PROGRAMS
+
+
+def _ctx(*, equipment: str = "", preferred: str = "", disabled: tuple[str, ...] = ()) -> PickContext:
+    split = lambda raw: frozenset(p.strip().lower() for p in raw.split(",") if p.strip())
+    return PickContext(equipment=split(equipment), preferred=split(preferred), disabled=frozenset(disabled))
+
+
+def _library() -> dict:
+    return {
+        "exercises": [
+            {"name": "Zercher Squat", "tags": ["Squat", "leg"], "equipment": ["barbell"]},
+            {"name": "Back Squat", "tags": ["squat", "leg"], "equipment": ["barbell"]},
+            {"name": "Goblet Squat", "tags": ["squat", "leg"], "equipment": ["dumbbell"]},
+            {"name": "Plank", "tags": ["core"], "equipment": ["bodyweight"]},
+            "not-an-exercise",
+        ]
+    }
+
+
+def test_compiled_library_normalizes_sets_and_indexes() -> None:
+    lib = CompiledLibrary(_library())
+    assert len(lib.exercises) == 4
+    assert lib.by_name_lc["zercher squat"].tags == frozenset({"squat", "leg"})
+    assert lib.tagged({"squat"}) == frozenset({0, 1, 2})
+
+
+def test_pick_one_uses_name_order_and_preferences() -> None:
+    lib = CompiledLibrary(_library())
+    assert _pick_one(lib, tags_any={"squat"}, ctx=_ctx(), fallback_tags_any={"leg"})["name"] == "Back Squat"
+    picked = _pick_one(lib, tags_any={"squat"}, ctx=_ctx(equipment="dumbbell"), fallback_tags_any={"leg"})
+    assert picked["name"] == "Goblet Squat"
+    picked = _pick_one(lib, tags_any={"squat"}, ctx=_ctx(disabled=("back squat", "goblet squat")), fallback_tags_any=set())
+    assert picked["name"] == "Zercher Squat"
+
+
+def test_pick_one_falls_back_when_nothing_matches() -> None:
+    lib = CompiledLibrary(_library())
+    # No "row" exercise: fall back to the fallback tags (ignoring preferences), then anything.
+    picked = _pick_one(lib, tags_any={"row"}, ctx=_ctx(equipment="band"), fallback_tags_any={"core"})
+    assert picked["name"] == "Plank"
+    picked = _pick_one(lib, tags_any={"row"}, ctx=_ctx(), fallback_tags_any=set())
+    assert picked["name"] == "Back Squat"
+
+
+def test_program_is_resolved_once_per_context() -> None:
+    lib = CompiledLibrary(_library())
+    resolved = lib.program("upper_lower_4day", _ctx())
+    assert set(resolved) == set(PROGRAMS["upper_lower_4day"].slots)
+    assert lib.program("upper_lower_4day", _ctx()) is resolved
+    # Named candidates come first; the front-squat guard and tag fallbacks apply otherwise.
+    assert resolved["L"][0][:2] == ("main_lower", lib.by_name["Back Squat"].raw)
+    assert resolved["L"][0][2] == "4 x 5"
+    assert lib.program("upper_lower_4day", _ctx(equipment="dumbbell"))["L"][0][1]["name"] == "Goblet Squat"
+    assert lib.program("no_such_program", _ctx()) == {}
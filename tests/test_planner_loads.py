@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from custom_components.weekly_training import planner
+from custom_components.weekly_training.planner import (
+    lift_families_for_maxes,
+    lift_family,
+    recompute_loads_bulk,
+    recompute_workout_loads,
+)
+
+
+def _workout() -> dict:
+    return {
+        "intensity": "normal",
+        "cycle": {"enabled": True, "week_index": 0},
+        "items": [
+            {"exercise": "Back Squat", "type": "main_lower", "suggested_load": 90.0, "units": "kg"},
+            {"exercise": "Bench Press", "type": "main_upper", "suggested_load": 75.0, "units": "kg"},
+            {"exercise": "Overhead Press", "type": "accessory", "suggested_load": 50.0, "units": "kg"},
+            {"exercise": "Barbell Row", "type": "accessory"},
+        ],
+    }
+
+
+def test_lift_family_matches_name_heuristics() -> None:
+    assert lift_family("Front Squat") == ("squat", 0.85)
+    assert lift_family("Romanian Deadlift") == ("deadlift", 0.65)
+    assert lift_family("Close-Grip Bench Press") == ("bench", 1.0)
+    assert lift_family("Press") == ("ohp", 0.65)
+    assert lift_family("Barbell Row") is None
+
+
+def test_lift_families_for_maxes() -> None:
+    before = {"squat": 120, "deadlift": 160, "bench": 100}
+    assert lift_families_for_maxes(before, dict(before)) == frozenset()
+    assert lift_families_for_maxes(before, {**before, "bench": 105}) == {"bench", "ohp"}
+    assert lift_families_for_maxes({}, before) == {"squat", "deadlift", "bench", "ohp"}
+
+
+def test_recompute_only_touches_changed_families() -> None:
+    workout = _workout()
+    profile = {"units": "kg", "maxes": {"squat": 120, "deadlift": 160, "bench": 110}}
+    out = recompute_workout_loads(profile=profile, workout=workout, cycle_cfg=None, families={"bench", "ohp"})
+
+    assert out is not workout
+    assert out["items"][0] is workout["items"][0]
+    assert out["items"][1]["suggested_load"] == 82.5
+    assert out["items"][2]["suggested_load"] == 52.5
+    assert out["items"][3] is workout["items"][3]
+    # Nothing left to change: the same workout comes back.
+    assert recompute_workout_loads(profile=profile, workout=out, cycle_cfg=None) is out
+
+
+def test_bulk_matches_single_and_vector_path(monkeypatch) -> None:
+    profiles = [
+        {"units": "kg", "maxes": {"squat": 117, "deadlift": 163, "bench": 101}},
+        {"units": "lb", "maxes": {"squat": 315, "deadlift": 405, "bench": 0}},
+    ]
+    jobs = []
+    for n in range(300):
+        workout = _workout()
+        workout["intensity"] = ("easy", "normal", "hard")[n % 3]
+        workout["cycle"] = {"enabled": True, "week_index": n % 4}
+        workout["items"][0]["type"] = "main_lower_light" if n % 2 else "main_lower"
+        jobs.append((profiles[n % 2], workout, {"step_pct": 2.5 + n % 5, "deload_pct": 10}))
+
+    single = [recompute_workout_loads(profile=p, workout=w, cycle_cfg=c) for p, w, c in jobs]
+    assert recompute_loads_bulk(jobs) == single
+    monkeypatch.setattr(planner, "np", None)
+    assert recompute_loads_bulk(jobs) == single
+    # Zero bench max: bench-derived loads are dropped.
+    assert "suggested_load" not in single[1]["items"][1] and single[1]["items"][0]["units"] == "lb"
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.weekly_training.storage import (
+    ConflictError,
+    WeeklyTrainingStore,
+    _draft_person_plans,
+    _replace_person,
+    _state_changes,
+    import_config_size,
+    normalize_import_config,
+)
+
+
+def test_state_changes_reports_changed_keys_and_touched_people() -> None:
+    base = {"rev": 3, "history": [], "plans": {"p1": {"2026-01-05": {"workouts": []}}, "p2": {}}}
+    same = {"rev": 3, "history": [], "plans": {"p1": {"2026-01-05": {"workouts": []}}, "p2": {}}}
+    assert _state_changes(base, same) == (False, set())
+
+    assert _state_changes(base, {**same, "history": [{"week_start": "2026-01-05"}]}) == (True, set())
+    edited = {**same, "plans": {"p1": {}, "p2": {}, "p3": {}}}
+    assert _state_changes(base, edited) == (True, {"p1", "p3"})
+    # Removing a person's plans is a change even though nobody is left to rewrite.
+    assert _state_changes(base, {**same, "plans": {"p1": base["plans"]["p1"]}}) == (True, set())
+
+
+def test_draft_helpers_copy_only_the_changed_path() -> None:
+    week = {"workouts": [{"date": "2026-01-05"}]}
+    other = {"2026-01-05": {"workouts": []}}
+    snapshot = {"people": [{"id": "p1", "cycle": {}}, {"id": "p2"}], "plans": {"p1": {"2026-01-05": week}, "p2": other}}
+    draft = dict(snapshot)
+
+    _draft_person_plans(draft, "p1")["2026-01-12"] = {"workouts": []}
+    _replace_person(draft, {"id": "p1", "cycle": None})
+
+    assert set(snapshot["plans"]["p1"]) == {"2026-01-05"} and snapshot["people"][0]["cycle"] == {}
+    assert draft["plans"]["p1"]["2026-01-05"] is week and draft["plans"]["p2"] is other
+    assert draft["people"][1] is snapshot["people"][1] and draft["people"][0]["cycle"] is None
+    assert _state_changes(snapshot, draft) == (True, {"p1"})
+
+
+def test_normalize_import_config_filters_people_and_normalizes_custom_exercises() -> None:
+    cfg = {
+        "people": [{"id": "p1", "name": "Ann"}, "junk"],
+        "exercise_config": {"disabled_exercises": ["Plank"], "custom_exercises": [{"name": " Sled Push ", "tags": ["Push"]}, {"name": ""}]},
+    }
+    assert import_config_size(cfg) == 4
+    out = normalize_import_config(cfg)
+    assert out["people"] == [{"id": "p1", "name": "Ann"}]
+    (custom,) = out["exercise_config"]["custom_exercises"]
+    assert (custom["name"], custom["tags"], custom["custom"]) == ("Sled Push", ["push"], True)
+    assert out["exercise_config"]["disabled_exercises"] == ["Plank"]
+    assert len(cfg["exercise_config"]["custom_exercises"]) == 2
+    assert normalize_import_config({"people": None}) == {}
+
+
+async def test_transaction_rolls_back_on_exception(hass: HomeAssistant) -> None:
+    store = WeeklyTrainingStore(hass, "t1", save_delay=0)
+    before = await store.async_load()
+    with patch.object(store, "_async_write", wraps=store._async_write) as write:
+        with pytest.raises(RuntimeError):
+            async with store.transaction() as state:
+                state["history"] = [{"week_start": "1999-01-04"}]
+                await store.async_set_overrides(duration_minutes=30)
+                raise RuntimeError("boom")
+    after = await store.async_load()
+    assert after is before and after["rev"] == before["rev"]
+    assert after["overrides"]["duration_minutes"] is None and after["history"] == before["history"]
+    write.assert_not_called()
+
+
+async def test_nested_transaction_commits_once_with_the_outer_one(hass: HomeAssistant) -> None:
+    store = WeeklyTrainingStore(hass, "t1", save_delay=0)
+    rev = (await store.async_load())["rev"]
+    seen: list[int] = []
+    store.async_add_listener(lambda state, _touched: seen.append(state["rev"]))
+    with patch.object(store, "_async_write", wraps=store._async_write) as write:
+        async with store.transaction(expected_rev=rev) as outer:
+            await store.async_set_overrides(duration_minutes=30)
+            async with store.transaction(expected_rev=rev) as inner:
+                assert inner is outer
+                await store.async_set_overrides(week_offset=1)
+            write.assert_not_called()
+    state = await store.async_load()
+    assert state["rev"] == rev + 1 and seen == [rev + 1]
+    assert (state["overrides"]["duration_minutes"], state["overrides"]["week_offset"]) == (30, 1)
+    write.assert_called_once()
+
+
+async def test_concurrent_transactions_are_serialized(hass: HomeAssistant) -> None:
+    store = WeeklyTrainingStore(hass, "t1", save_delay=0)
+    rev = (await store.async_load())["rev"]
+
+    async def _append(entry: str) -> None:
+        async with store.transaction() as state:
+            history = list(state.get("history") or [])
+            await asyncio.sleep(0)  # let the other writer run between read and write
+            state["history"] = [*history, entry]
+
+    await asyncio.gather(_append("a"), _append("b"))
+    state = await store.async_load()
+    assert sorted(state["history"]) == ["a", "b"] and state["rev"] == rev + 2
+
+
+async def test_expected_rev_mismatch_is_rejected(hass: HomeAssistant) -> None:
+    store = WeeklyTrainingStore(hass, "t1", save_delay=0)
+    rev = (await store.async_load())["rev"]
+    with pytest.raises(ConflictError):
+        await store.async_set_overrides(duration_minutes=30, expected_rev=rev - 1)
+    with pytest.raises(ConflictError):
+        async with store.transaction(expected_rev=rev + 1) as state:
+            state["history"] = []
+    state = await store.async_load()
+    assert state["rev"] == rev and state["overrides"]["duration_minutes"] is None
+
+
+async def test_v1_document_migrates_to_shards_and_reloads_unchanged(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    week = {"week_start": "2026-01-05", "workouts": [{"date": "2026-01-05", "completed": True}]}
+    people = [{"id": "p1", "name": "Ann"}, {"id": "p2", "name": "Bob"}]
+    hass_storage["weekly_training_t1"] = {
+        "version": 1,
+        "key": "weekly_training_t1",
+        "data": {
+            "rev": 7,
+            "people": people,
+            "active_person_id": "p1",
+            "plans": {"p1": {"2026-01-05": week}, "p2": {}},
+        },
+    }
+    migrated = await WeeklyTrainingStore(hass, "t1", save_delay=0).async_load()
+
+    core = hass_storage["weekly_training_t1"]["data"]
+    assert "plans" not in core and core["plan_shards"] == ["p1", "p2"] and core["schema"] == 2
+    assert hass_storage["weekly_training_t1_plans_p1"]["data"]["plans"] == {"2026-01-05": week}
+    assert hass_storage["weekly_training_t1_plans_p2"]["data"]["plans"] == {}
+
+    reloaded = await WeeklyTrainingStore(hass, "t1", save_delay=0).async_load()
+    assert reloaded == migrated
+    assert reloaded["plans"] == {"p1": {"2026-01-05": week}, "p2": {}} and reloaded["rev"] == 7
+
+
+async def test_deleting_a_person_drops_their_shard(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    store = WeeklyTrainingStore(hass, "t1", save_delay=0)
+    await store.async_upsert_person({"id": "p2", "name": "Bob"})
+    await store.async_save_plan(person_id="p2", week_start="2026-01-05", plan={"workouts": []})
+    assert "weekly_training_t1_plans_p2" in hass_storage
+
+    await store.async_delete_person("p2")
+    assert "weekly_training_t1_plans_p2" not in hass_storage
+    assert "p2" not in hass_storage["weekly_training_t1"]["data"]["plan_shards"]
+    reloaded = await WeeklyTrainingStore(hass, "t1", save_delay=0).async_load()
+    assert "p2" not in reloaded["plans"] and all(p["id"] != "p2" for p in reloaded["people"])
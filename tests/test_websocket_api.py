@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.weekly_training.const import DOMAIN
+from custom_components.weekly_training.websocket_api import (
+    _change_event,
+    _snapshot_event,
+    _state_result,
+)
+from custom_components.weekly_training.ws_state import PlanWeekIndex, StateDeltaTracker
+
+
+def _state() -> dict:
+    return {
+        "rev": 5,
+        "people": [{"id": "p1", "name": "Ann"}, {"id": "p2", "name": "Bo"}],
+        "plans": {
+            "p1": {"2026-01-05": {"workouts": []}, "2026-01-12": {"workouts": []}},
+            "p2": {"2026-01-05": {"workouts": []}},
+        },
+    }
+
+
+def test_get_state_if_rev_only_short_circuits_unscoped_queries() -> None:
+    coordinator = SimpleNamespace(plan_index=PlanWeekIndex())
+    state = _state()
+    assert _state_result(coordinator, "e1", state, {"if_rev": 5}) == {"entry_id": "e1", "not_modified": True, "rev": 5}
+
+    # A matching rev does not prove the client holds this slice: it is always sent.
+    out = _state_result(coordinator, "e1", state, {"if_rev": 5, "person_id": "p1", "week_from": "2026-01-14"})
+    assert "not_modified" not in out
+    assert out["scope"] == {"person_id": "p1", "week_from": "2026-01-12"}
+    assert out["state"]["plans"] == {"p1": {"2026-01-12": {"workouts": []}}}
+
+    # The scope is validated before the rev is compared.
+    with pytest.raises(ValueError, match="week_to"):
+        _state_result(coordinator, "e1", state, {"if_rev": 5, "week_to": "not-a-date"})
+
+
+def test_subscription_sends_a_snapshot_then_changes_and_falls_back_to_a_snapshot() -> None:
+    coordinator = SimpleNamespace(deltas=StateDeltaTracker())
+    state = _state()
+    coordinator.deltas.seed(state)
+    first = _snapshot_event(state)
+    assert (first["type"], first["rev"], first["state"]["plans"]) == ("snapshot", 5, state["plans"])
+
+    saved = {**state, "rev": 6, "plans": {**state["plans"], "p2": {}}}
+    coordinator.deltas.record(saved, touched_people=frozenset({"p2"}))
+    event = _change_event(coordinator, saved, 5)
+    assert (event["type"], event["base_rev"], event["rev"]) == ("change", 5, 6)
+    assert {"op": "remove", "path": "/plans/p2/2026-01-05"} in event["ops"]
+    # Same rev (e.g. a no-op save): nothing is sent.
+    assert _change_event(coordinator, saved, 6) is None
+
+    # The tracker cannot express the change from rev 2: the client gets the full state again.
+    fallback = _change_event(coordinator, saved, 2)
+    assert (fallback["type"], fallback["rev"]) == ("snapshot", 6)
+    assert fallback["state"]["plans"] == saved["plans"]
+
+
+async def test_subscribe_streams_saves_until_unsubscribed_or_unloaded(hass, hass_ws_client) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, data={"name": "WT"})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    store = hass.data[DOMAIN][entry.entry_id].store
+    client = await hass_ws_client(hass)
+
+    async def _subscribe(msg_id: int) -> int:
+        await client.send_json(
+            {"id": msg_id, "type": "weekly_training/subscribe", "entry_id": entry.entry_id}
+        )
+        assert (await client.receive_json())["success"]
+        snapshot = (await client.receive_json())["event"]
+        assert snapshot["type"] == "snapshot"
+        return snapshot["rev"]
+
+    rev = await _subscribe(1)
+    await store.async_set_overrides(duration_minutes=30)
+    event = (await client.receive_json())["event"]
+    assert (event["type"], event["base_rev"], event["rev"]) == ("change", rev, rev + 1)
+    overrides = (await store.async_load())["overrides"]
+    assert {"op": "add", "path": "/overrides", "value": overrides} in event["ops"]
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    assert (await client.receive_json())["success"]
+    listeners = len(store._listeners)
+    await store.async_set_overrides(duration_minutes=45)
+
+    # Unloading ends the stream and frees its store listener (no orphan on the old store).
+    await _subscribe(3)
+    assert len(store._listeners) == listeners + 1
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    msg = await client.receive_json()
+    assert (msg["id"], msg["event"]) == (3, {"type": "closed", "reason": "entry_unloaded"})
+    assert len(store._listeners) == listeners
+    await client.send_json({"id": 4, "type": "unsubscribe_events", "subscription": 3})
+    assert (await client.receive_json())["success"]
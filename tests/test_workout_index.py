@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from custom_components.weekly_training.workout_index import WorkoutIndex
+
+
+def test_workout_index_follows_copy_on_write_plans() -> None:
+    week1 = {"workouts": [{"date": "2026-01-05"}, {"date": "2026-01-07"}]}
+    week2 = {"workouts": [{"date": "2026-01-12"}]}
+    plans = {"p1": {"2026-01-05": week1, "2026-01-12": week2}}
+    index = WorkoutIndex()
+    assert index.locate(plans, "p1", "2026-01-07") == ("2026-01-05", 1)
+    assert index.locate(plans, "p1", "2026-01-06") is None
+    assert index.locate(plans, "p2", "2026-01-05") is None
+
+    # Replace one week: its dates are re-read, the other week is kept.
+    plans = {"p1": {"2026-01-05": {"workouts": [{"date": "2026-01-07"}]}, "2026-01-12": week2}}
+    assert index.locate(plans, "p1", "2026-01-05") is None
+    assert index.locate(plans, "p1", "2026-01-07") == ("2026-01-05", 0)
+    assert index.dates(plans, "p1") == {"2026-01-07": ("2026-01-05", 0), "2026-01-12": ("2026-01-12", 0)}
+
+    plans = {"p1": {"2026-01-05": plans["p1"]["2026-01-05"]}}
+    assert index.locate(plans, "p1", "2026-01-12") is None
+    index.sync({})
+    assert index.locate({}, "p1", "2026-01-07") is None
+
+
+def test_workout_index_range_queries_follow_replaced_weeks() -> None:
+    plans = {
+        "p1": {
+            "2026-01-05": {"workouts": [{"date": "2026-01-07"}, {"date": "2026-01-05"}]},
+            "2026-01-12": {"workouts": [{"date": "2026-01-12"}, {"date": "2026-01-14"}]},
+        }
+    }
+    index = WorkoutIndex()
+    assert index.between(plans, "p1", "2026-01-06", "2026-01-14") == [
+        ("2026-01-07", "2026-01-05", 0),
+        ("2026-01-12", "2026-01-12", 0),
+    ]
+    assert [d for d, _, _ in index.between(plans, "p1", "2026-01-01")] == ["2026-01-05", "2026-01-07", "2026-01-12", "2026-01-14"]
+    assert index.between(plans, "p2", "2026-01-01") == []
+
+    plans = {"p1": {**plans["p1"], "2026-01-05": {"workouts": [{"date": "2026-01-06"}]}}}
+    assert [d for d, _, _ in index.between(plans, "p1", "2026-01-01", "2026-01-13")] == ["2026-01-06", "2026-01-12"]
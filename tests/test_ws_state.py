@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import copy
+
+from custom_components.weekly_training.ws_state import (
+    MarkdownCache,
+    PlanWeekIndex,
+    StateDeltaTracker,
+    public_state,
+)
+
+
+def _apply(doc: dict, ops: list[dict]) -> dict:
+    doc = copy.deepcopy(doc)
+    for op in ops:
+        parts = [p.replace("~1", "/").replace("~0", "~") for p in op["path"].split("/")[1:]]
+        node = doc
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        if op["op"] == "remove":
+            node.pop(parts[-1], None)
+        else:
+            node[parts[-1]] = op["value"]
+    return doc
+
+
+def _state(rev: int) -> dict:
+    return {
+        "schema": 2,
+        "rev": rev,
+        "people": [{"id": "p1"}, {"id": "p/2"}],
+        "active_person_id": "p1",
+        "overrides": {},
+        "exercise_config": {},
+        "plans": {"p1": {"2026-01-05": {"workouts": [{"date": "2026-01-05", "completed": False}]}}, "p/2": {}},
+        "history": [],
+        "updated_at": "t0",
+    }
+
+
+def test_delta_replays_changes_since_base_rev() -> None:
+    tracker = StateDeltaTracker()
+    state = _state(5)
+    tracker.seed(state)
+    client = public_state(copy.deepcopy(state))
+
+    state = copy.deepcopy(state)
+    state["rev"], state["updated_at"] = 6, "t1"
+    state["plans"]["p1"]["2026-01-05"]["workouts"][0]["completed"] = True
+    tracker.record(state, touched_people=frozenset({"p1"}))
+
+    state = copy.deepcopy(state)
+    state["rev"], state["updated_at"] = 7, "t2"
+    state["plans"]["p/2"]["2026-01-12"] = {"workouts": []}
+    state["plans"].pop("p1")
+    tracker.record(state, touched_people=frozenset({"p/2"}))
+
+    delta = tracker.delta(state, base_rev=5)
+    assert delta is not None and delta["rev"] == 7
+    paths = {op["path"] for op in delta["ops"]}
+    assert "/people" not in paths and "/plans/p~12/2026-01-12" in paths
+    patched = _apply(client, delta["ops"])
+    assert patched == public_state(state, runtime={})
+
+    # Single-rev delta only touches that week.
+    assert [op["path"] for op in tracker.delta(state, base_rev=6)["ops"] if op["path"].startswith("/plans")] == [
+        "/plans/p1",
+        "/plans/p~12/2026-01-12",
+    ]
+
+
+def test_delta_falls_back_when_base_rev_unknown() -> None:
+    tracker = StateDeltaTracker(max_revs=2)
+    state = _state(1)
+    tracker.seed(state)
+    for rev in range(2, 6):
+        state = dict(state, rev=rev, updated_at=f"t{rev}")
+        tracker.record(state, touched_people=frozenset())
+    assert tracker.delta(state, base_rev=1) is None
+    assert tracker.delta(state, base_rev=4) is not None
+    assert tracker.delta(state, base_rev=None) is None
+
+
+def test_plan_index_selects_person_and_week_window() -> None:
+    plans = {
+        "p1": {f"2026-01-{d:02d}": {"n": d} for d in (26, 5, 19, 12)},
+        "p2": {"2026-01-12": {"n": 0}},
+    }
+    index = PlanWeekIndex()
+    assert index.select(plans, person_id="p1", week_from="2026-01-12", week_to="2026-01-19") == {
+        "p1": {"2026-01-12": {"n": 12}, "2026-01-19": {"n": 19}}
+    }
+    assert index.select(plans, week_to="2026-01-05") == {"p1": {"2026-01-05": {"n": 5}}, "p2": {}}
+    assert index.select(plans, person_id="nobody") == {}
+
+    plans["p1"]["2026-01-26"] = {"n": 99}
+    plans["p1"].pop("2026-01-05")
+    plans["p1"]["2026-02-02"] = {"n": 2}
+    index.sync(plans, frozenset({"p1"}))
+    assert list(index.select(plans, person_id="p1", week_from="2026-01-20")["p1"]) == ["2026-01-26", "2026-02-02"]
+
+
+def test_markdown_cache_renders_on_request_and_reuses_unchanged_weeks() -> None:
+    week = {"week_number": 2, "workouts": [{"name": "Dag A", "date": "2026-01-05", "items": [{"exercise": "Plank", "sets_reps": "3 x 45"}]}]}
+    state = {"rev": 1, "plans": {"p1": {"2026-01-05": week}}}
+    cache = MarkdownCache()
+    markdown = cache.get(state, person_id="p1", week_start="2026-01-05")
+    assert markdown.startswith("# Weekly Training Plan (ISO week 2)") and "- Plank: 3 x 45" in markdown
+    assert cache.get(state, person_id="p1", week_start="2026-01-12") is None
+
+    # A later rev that kept the week object reuses the rendered text.
+    state = {"rev": 2, "plans": {"p1": {"2026-01-05": week}}}
+    assert cache.get(state, person_id="p1", week_start="2026-01-05") is markdown
+    state = {"rev": 3, "plans": {"p1": {"2026-01-05": {**week, "workouts": []}}}}
+    assert "_No sessions generated yet._" in cache.get(state, person_id="p1", week_start="2026-01-05")